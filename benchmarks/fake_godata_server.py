@@ -0,0 +1,244 @@
+"""
+Servidor Go.Data local para benchmarks e testes manuais.
+
+Implementa os endpoints usados pelo GodataApiClient, com os casos em memória,
+um subconjunto do filtro loopback (where com `and`/`inq`/`gt`/`gte`, fields, limit, skip)
+e injeção de latência e de erros (503 com Retry-After).
+
+Uso:
+    python -m benchmarks.fake_godata_server --port 8000 --latency 0.02 --error-rate 0.01
+"""
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.synthetic_sinan import location_tree
+
+OUTBREAK = {"id": "outbreak-sarampo", "name": "Sarampo"}
+
+
+class FakeGodataState:
+    """Dados e parâmetros compartilhados pelas requisições do servidor."""
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, seed: int = 42):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.locations = location_tree()
+        self.outbreaks = [OUTBREAK]
+        # outbreakId → id do caso → documento
+        self.cases: Dict[str, Dict[str, dict]] = {OUTBREAK["id"]: {}}
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            return self._random.random() < self.error_rate
+
+    def find_locations(self, filter_: Dict[str, Any]) -> List[dict]:
+        """
+        Como alguns servidores Go.Data, aplica o `where` à lista de localizações
+        e retorna os nós encontrados sem a subárvore.
+        """
+        where = filter_.get("where")
+        if not where:
+            return self.locations
+        return [
+            {"location": node["location"], "children": []}
+            for node in self.locations
+            if all(_matches(node["location"].get(field), condition) for field, condition in where.items())
+        ]
+
+    def save_case(self, outbreak_id: str, case: dict, case_id: Optional[str] = None) -> dict:
+        with self._lock:
+            cases = self.cases.setdefault(outbreak_id, {})
+            case_id = case_id or str(uuid.uuid4())
+            document = {**cases.get(case_id, {}), **case}
+            document["id"] = case_id
+            document["updatedAt"] = datetime.now(timezone.utc).isoformat()
+            cases[case_id] = document
+            return document
+
+    def find_cases(self, outbreak_id: str, filter_: Dict[str, Any]) -> List[dict]:
+        with self._lock:
+            cases = sorted(self.cases.get(outbreak_id, {}).values(), key=lambda case: case["id"])
+
+        where = filter_.get("where") or {}
+        cases = [case for case in cases if _matches_where(case, where)]
+
+        skip = filter_.get("skip", 0)
+        limit = filter_.get("limit")
+        cases = cases[skip:skip + limit] if limit else cases[skip:]
+
+        fields = [field for field, included in (filter_.get("fields") or {}).items() if included]
+        if fields:
+            cases = [{field: case.get(field) for field in fields} for case in cases]
+        return cases
+
+
+def _matches_where(case: dict, where: Dict[str, Any]) -> bool:
+    for field, condition in where.items():
+        if field == "and":
+            if not all(_matches_where(case, clause) for clause in condition):
+                return False
+        elif not _matches(case.get(field), condition):
+            return False
+    return True
+
+
+def _matches(value: Any, condition: Any) -> bool:
+    if isinstance(condition, dict):
+        if "inq" in condition:
+            return value in condition["inq"]
+        if "gte" in condition:
+            return value is not None and value >= condition["gte"]
+        if "gt" in condition:
+            return value is not None and value > condition["gt"]
+    return value == condition
+
+
+class FakeGodataHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Cabeçalhos e corpo saem em escritas separadas; sem isso o ACK atrasado domina a latência
+    disable_nagle_algorithm = True
+    state: FakeGodataState
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    # --- Rotas ---
+
+    def do_GET(self) -> None:
+        if not self._before_request():
+            return
+        parts = self._path_parts()
+        if parts == ["api", "outbreaks"]:
+            self._send_json(self.state.outbreaks)
+        elif parts == ["api", "reference-data"]:
+            self._send_json([])
+        elif parts == ["api", "locations", "hierarchical"]:
+            self._send_json(self.state.find_locations(self._filter()))
+        elif len(parts) == 4 and parts[:2] == ["api", "outbreaks"] and parts[3] == "cases":
+            self._send_json(self.state.find_cases(parts[2], self._filter()))
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self) -> None:
+        body = self._read_body()
+        if not self._before_request():
+            return
+        parts = self._path_parts()
+        if parts == ["api", "users", "login"]:
+            self._send_json({"id": "fake-token"})
+        elif len(parts) == 4 and parts[:2] == ["api", "outbreaks"] and parts[3] == "cases":
+            self._send_json(self.state.save_case(parts[2], body))
+        elif len(parts) == 5 and parts[3:] == ["cases", "import"]:
+            self._send_json([self.state.save_case(parts[2], case) for case in body.get("data", [])])
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_PUT(self) -> None:
+        body = self._read_body()
+        if not self._before_request():
+            return
+        parts = self._path_parts()
+        if len(parts) == 5 and parts[:2] == ["api", "outbreaks"] and parts[3] == "cases" \
+                and parts[4] in self.state.cases.get(parts[2], {}):
+            self._send_json(self.state.save_case(parts[2], body, case_id=parts[4]))
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    # --- Utilitários ---
+
+    def _before_request(self) -> bool:
+        """Aplica a latência configurada e, eventualmente, responde 503."""
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        if self.state.should_fail():
+            self._send_json({"error": "injected failure"}, status=503, headers={"Retry-After": "0"})
+            return False
+        return True
+
+    def _path_parts(self) -> List[str]:
+        return [part for part in urlparse(self.path).path.split("/") if part]
+
+    def _filter(self) -> Dict[str, Any]:
+        query = parse_qs(urlparse(self.path).query)
+        return json.loads(query["filter"][0]) if "filter" in query else {}
+
+    def _read_body(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        if self.headers.get("Content-Type", "").startswith("application/json") and raw:
+            return json.loads(raw)
+        return {}
+
+    def _send_json(self, data: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> None:
+        payload = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class FakeGodataServer:
+    """Servidor em uma thread própria; `url` fica disponível após `start`."""
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, error_rate: float = 0.0):
+        self.state = FakeGodataState(latency=latency, error_rate=error_rate)
+        handler = type("Handler", (FakeGodataHandler,), {"state": self.state})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeGodataServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-godata", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Atende na thread atual (uso pela linha de comando)."""
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeGodataServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor Go.Data local para benchmarks.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="atraso de cada resposta, em segundos")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fração de respostas 503")
+    args = parser.parse_args()
+
+    server = FakeGodataServer(args.host, args.port, args.latency, args.error_rate)
+    print(f"Go.Data local em {server.url} (surto {OUTBREAK['name']}: {OUTBREAK['id']})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,213 @@
+"""
+Benchmark do importador com base sintética e servidor Go.Data local.
+
+Executa o ImportSinanDataUseCase real (surtos e localizações vindos do
+servidor local, por meio do ReferenceDataCache, árvore com o nível de
+regiões de Santa Catarina) e reporta, para cada etapa (leitura,
+pré-processamento, mapeamento, serialização e envio), o tempo total e as
+linhas por segundo, a partir da métrica `stage_duration_seconds`.
+
+A serialização (`asdict` + JSON de cada caso) é medida à parte, antes de
+repassar o bloco à saída; como ela ocorre dentro da etapa de envio do caso
+de uso, o tempo de envio reportado já a desconta.
+
+O pico de memória de cada etapa só é medido com `--profile-memory`: o
+tracemalloc intercepta todas as alocações e deixa as etapas várias vezes
+mais lentas, então tempos e picos devem vir de execuções separadas.
+
+Uso:
+    python -m benchmarks.run_benchmarks --rows 20000 --format csv --latency 0.005
+    python -m benchmarks.run_benchmarks --rows 50000 --skip-upload --workers 4 --json bench.json
+"""
+import argparse
+import json
+import os
+import shutil
+import tracemalloc
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional
+
+from benchmarks.fake_godata_server import OUTBREAK, FakeGodataServer
+from benchmarks.synthetic_sinan import write_dataset, write_ibge_dictionary
+from core.adapters import (
+    CaseJsonWriter,
+    CaseUploader,
+    CsvReader,
+    GodataLocationTranslator,
+    GodataOutbreakTranslator,
+    IBGELocationIdTranslator,
+    ReferenceDataCache,
+    XlsxReader,
+)
+from core.app.use_cases import ImportSinanDataUseCase
+from core.domain.ports import CasesOutputPort
+from core.infra import HttpTransport, RetryPolicy
+from core.infra.client import GodataApiClient
+from core.logger import logger
+from core.metrics import metrics
+from core.profiling import StageProfiler
+
+STAGES = ("leitura", "preprocessamento", "mapeamento", "serializacao", "envio")
+
+
+class SerializingOutputPort(CasesOutputPort):
+    """
+    Mede a serialização de cada bloco (`asdict` + JSON, como no envio) como
+    etapa `serializacao` e repassa o bloco à saída. Com o tracemalloc ativo,
+    guarda também o pico da serialização e reinicia o pico antes do envio,
+    para que o pico de `envio` não a inclua.
+    """
+    def __init__(self, output_port: CasesOutputPort):
+        self.output_port = output_port
+        self.peak = 0
+
+    def send_cases(self, cases, outbreak_id):
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        with metrics.timer("stage_duration_seconds", stage="serializacao"):
+            payloads = [json.dumps(asdict(caso), default=str) for caso in cases]
+        if tracing:
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1] - baseline)
+            del payloads
+            tracemalloc.reset_peak()
+        return self.output_port.send_cases(cases, outbreak_id)
+
+
+def build_reader(path: str, chunk_size: int):
+    if path.endswith(".csv"):
+        return CsvReader(file_path=path, chunk_size=chunk_size)
+    return XlsxReader(file_path=path, chunk_size=chunk_size)
+
+
+def stage_results(rows: int, peaks: Dict[str, int]) -> List[Dict[str, Any]]:
+    """Tempo de cada etapa registrado pelo caso de uso em `stage_duration_seconds`."""
+    seconds = {
+        series["labels"]["stage"]: series["sum"]
+        for series in metrics.snapshot()["histograms"].get("stage_duration_seconds", [])
+    }
+    # A serialização medida roda dentro da etapa de envio do caso de uso
+    if "envio" in seconds:
+        seconds["envio"] -= seconds.get("serializacao", 0.0)
+    return [
+        {
+            "stage": stage,
+            "rows": rows,
+            "seconds": round(seconds[stage], 4),
+            "rows_per_second": round(rows / seconds[stage], 1) if seconds[stage] else 0.0,
+            "peak_mib": round(peaks[stage] / 2 ** 20, 2) if stage in peaks else None,
+        }
+        for stage in STAGES
+        if stage in seconds
+    ]
+
+
+def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    input_path = os.path.join(args.work_dir, f"base_{args.rows}.{args.format}")
+    dictionary_path = os.path.join(args.work_dir, "Dic_Mun_Res.xlsx")
+    reference_dir = os.path.join(args.work_dir, "reference")
+    if not os.path.exists(input_path):
+        logger.info("Gerando base sintética com %s linhas", args.rows)
+        write_dataset(input_path, args.rows, seed=args.seed)
+    write_ibge_dictionary(dictionary_path)
+    # Os snapshots de referência são de um servidor local que não sobrevive à execução
+    shutil.rmtree(reference_dir, ignore_errors=True)
+
+    with FakeGodataServer(latency=args.latency, error_rate=args.error_rate) as server:
+        api_client = GodataApiClient(
+            base_url=server.url,
+            token="fake-token",
+            transport=HttpTransport(pool_size=args.upload_workers, gzip_requests=args.gzip),
+            retry_policy=RetryPolicy(backoff_base=0.05),
+        )
+        reference_data = ReferenceDataCache(api_client, snapshot_dir=reference_dir)
+        if args.skip_upload:
+            output_port = CaseJsonWriter(file_path=os.path.join(args.work_dir, "cases.json"))
+        else:
+            output_port = CaseUploader(api_client, max_workers=args.upload_workers, bulk_size=args.bulk_size or None)
+        output_port = SerializingOutputPort(output_port)
+        profiler = None
+        if args.profile or args.profile_memory:
+            profiler = StageProfiler(
+                args.profile or os.path.join(args.work_dir, "profile"), trace_memory=args.profile_memory
+            )
+
+        use_case = ImportSinanDataUseCase(
+            disease_module_name="sarampo",
+            input_port=build_reader(input_path, args.chunk_size),
+            godata_outbreak_translator=GodataOutbreakTranslator(api_client=reference_data),
+            godata_location_translator=GodataLocationTranslator(api_client=reference_data),
+            ibge_location_translator=IBGELocationIdTranslator(dictionary_path=dictionary_path),
+            output_port=output_port,
+            pipelined=args.pipeline,
+            queue_size=args.queue_size,
+            workers=args.workers,
+            profiler=profiler,
+        )
+
+        metrics.reset()
+        rows = use_case.execute(OUTBREAK["name"], anonymize=True)
+        if profiler is not None:
+            profiler.write_report()
+        logger.info("Requisições atendidas pelo servidor local: %s", server.state.requests)
+
+    peaks = profiler.peaks if profiler is not None else {}
+    if args.profile_memory:
+        peaks["serializacao"] = output_port.peak
+    results = stage_results(rows, peaks)
+    run_seconds = metrics.snapshot()["gauges"]["run_duration_seconds"][0]["value"]
+    results.append({
+        "stage": "total",
+        "rows": rows,
+        "seconds": round(run_seconds, 4),
+        "rows_per_second": round(rows / run_seconds, 1) if run_seconds else 0.0,
+        "peak_mib": None,
+    })
+    return results
+
+
+def print_report(results: List[Dict[str, Any]]) -> None:
+    header = f"{'etapa':<18}{'linhas':>10}{'segundos':>12}{'linhas/s':>14}{'pico MiB':>12}"
+    print(header)
+    print("-" * len(header))
+    for item in results:
+        peak = f"{item['peak_mib']:>12.2f}" if item["peak_mib"] is not None else f"{'-':>12}"
+        print(
+            f"{item['stage']:<18}{item['rows']:>10}{item['seconds']:>12.3f}"
+            f"{item['rows_per_second']:>14.1f}{peak}"
+        )
+    if all(item["peak_mib"] is None for item in results):
+        print("(pico de memória por etapa apenas com --profile-memory, que deixa as etapas mais lentas)")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark do importador SINAN → Go.Data.")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--format", choices=("csv", "xlsx"), default="csv")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--work-dir", default="data/bench")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency", type=float, default=0.0, help="atraso de cada resposta do servidor local")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fração de respostas 503 do servidor local")
+    parser.add_argument("--upload-workers", type=int, default=5)
+    parser.add_argument("--bulk-size", type=int, default=0)
+    parser.add_argument("--gzip", action="store_true", help="envia corpos JSON com gzip")
+    parser.add_argument("--pipeline", action="store_true", help="executa as etapas em paralelo (como PIPELINE=1)")
+    parser.add_argument("--queue-size", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=1, help="processos de mapeamento dos blocos")
+    parser.add_argument("--skip-upload", action="store_true", help="grava os casos em JSON em vez de enviá-los")
+    parser.add_argument("--profile", metavar="DIR", help="grava o perfil de CPU de cada etapa em DIR")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="mede o pico de memória de cada etapa (tracemalloc, mais lento); implica --profile")
+    parser.add_argument("--json", help="grava o resultado neste arquivo JSON")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    results = run(args)
+    print_report(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"params": vars(args), "stages": results}, f, indent=2)
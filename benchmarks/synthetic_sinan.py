@@ -0,0 +1,192 @@
+"""
+Gerador de bases sintéticas do SINAN para benchmarks.
+
+As colunas seguem o SinanMapperService e o módulo do agravo (por padrão,
+sarampo), com valores plausíveis para cada tipo de campo. Colunas extras
+sem uso simulam a largura real das exportações do SINAN.
+
+Uso:
+    python -m benchmarks.synthetic_sinan --rows 100000 --output data/bench/base.csv
+"""
+import argparse
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+
+import pandas as pd
+
+from core.domain.diseases.disease_registry import disease_registry
+from core.domain.services import SinanMapperService
+
+# (código IBGE, município, UF) usados nas bases e no servidor Go.Data local
+MUNICIPALITIES: List[Tuple[str, str, str]] = [
+    ("420540", "Florianópolis", "Santa Catarina"),
+    ("421660", "São José", "Santa Catarina"),
+    ("420910", "Joinville", "Santa Catarina"),
+    ("420240", "Blumenau", "Santa Catarina"),
+    ("261160", "Recife", "Pernambuco"),
+    ("260790", "Jaboatão dos Guararapes", "Pernambuco"),
+    ("355030", "São Paulo", "São Paulo"),
+    ("350950", "Campinas", "São Paulo"),
+    ("330455", "Rio de Janeiro", "Rio de Janeiro"),
+    ("310620", "Belo Horizonte", "Minas Gerais"),
+    ("292740", "Salvador", "Bahia"),
+    ("230440", "Fortaleza", "Ceará"),
+    ("530010", "Brasília", "Distrito Federal"),
+    ("431490", "Porto Alegre", "Rio Grande do Sul"),
+    ("410690", "Curitiba", "Paraná"),
+    ("130260", "Manaus", "Amazonas"),
+]
+
+# Regiões de saúde de Santa Catarina → códigos IBGE dos municípios abaixo delas
+REGIONS: Dict[str, List[str]] = {
+    "Grande Florianópolis": ["420540", "421660"],
+    "Joinville": ["420910"],
+    "Médio Vale do Itajaí": ["420240"],
+}
+
+DATE_FORMAT = SinanMapperService.DATE_FORMAT
+FIRST_NAMES = ["Ana", "Bruno", "Carla", "Daniel", "Eduarda", "Felipe", "Gabriela", "Heitor", "Isabela", "João"]
+LAST_NAMES = ["Silva", "Souza", "Oliveira", "Santos", "Pereira", "Lima", "Costa", "Ferreira", "Almeida", "Ribeiro"]
+
+# Domínios dos campos codificados do SINAN
+CODED_VALUES: Dict[str, List[str]] = {
+    "CS_SEXO": ["M", "F", "I"],
+    "CS_GESTANT": ["1", "2", "3", "4", "5", "6", "9"],
+    "EVOLUCAO": ["1", "2", "3", "9", ""],
+    "CLASS_FIN": ["1", "2", "3", ""],
+    "CS_FONTE": ["1", "2", "9", ""],
+    "CS_VACINA": ["1", "2", "9", ""],
+}
+LAB_RESULTS = ["1", "2", "3", "4", "9", ""]
+
+
+def _random_date(rng: random.Random, start: datetime, days: int) -> str:
+    return (start + timedelta(days=rng.randrange(days))).strftime(DATE_FORMAT)
+
+
+def _value(column: str, row: int, rng: random.Random) -> str:
+    if column == "NU_NOTIFIC":
+        return str(1_000_000 + row)
+    if column in CODED_VALUES:
+        return rng.choice(CODED_VALUES[column])
+    if column in ("ID_MN_RESI", "ID_MUNICIP"):
+        return rng.choice(MUNICIPALITIES)[0]
+    if column == "DT_NASC":
+        return _random_date(rng, datetime(1940, 1, 1), 80 * 365)
+    if column == "DT_NOTIFIC":
+        return _random_date(rng, datetime(2024, 1, 1), 365)
+    if column.startswith("DT_"):
+        # Parte das datas vem vazia, como nas bases reais
+        return _random_date(rng, datetime(2024, 1, 1), 365) if rng.random() > 0.1 else ""
+    if column.startswith("ID_S"):
+        return rng.choice(LAB_RESULTS)
+    if column in ("NM_PACIENT", "NM_MAE_PAC"):
+        return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}"
+    if column == "NU_CEP":
+        return f"{rng.randrange(10000, 99999)}-{rng.randrange(1000):03d}"
+    if column == "NU_TELEFON":
+        return f"({rng.randrange(11, 99)}){rng.randrange(90000, 99999)}-{rng.randrange(10000):04d}"
+    if column == "ID_CNS_SUS":
+        return str(rng.randrange(10 ** 14, 10 ** 15)) if rng.random() > 0.3 else ""
+    if column == "NU_NUMERO":
+        return str(rng.randrange(1, 3000))
+    if column == "NM_LOGRADO":
+        return f"Rua {rng.choice(LAST_NAMES)}"
+    if column == "NM_BAIRRO":
+        return rng.choice(["Centro", "Trindade", "Boa Vista", "Jardim América", "Vila Nova"])
+    if column == "NM_COMPLEM":
+        return rng.choice(["", "", "Apto 101", "Casa 2", "Fundos"])
+    return f"{column.lower()}_{rng.randrange(100)}"
+
+
+def sinan_columns(disease: str = "sarampo", extra_columns: int = 20) -> List[str]:
+    """Colunas lidas pelo importador para o agravo, mais `extra_columns` colunas sem uso."""
+    disease_module = disease_registry.get(disease)
+    columns = list(SinanMapperService.REQUIRED_COLUMNS)
+    columns += [column for column in disease_module.required_columns if column not in columns]
+    columns += [f"EXTRA_{i:02d}" for i in range(extra_columns)]
+    return columns
+
+
+def generate_dataframe(rows: int, disease: str = "sarampo", extra_columns: int = 20, seed: int = 42) -> pd.DataFrame:
+    rng = random.Random(seed)
+    columns = sinan_columns(disease, extra_columns)
+    return pd.DataFrame(
+        [[_value(column, row, rng) for column in columns] for row in range(rows)],
+        columns=columns,
+    )
+
+
+def write_dataset(path: str, rows: int, disease: str = "sarampo", extra_columns: int = 20, seed: int = 42) -> str:
+    """Grava a base em `.csv` (separada por `;`, latin-1, como o SINAN exporta) ou `.xlsx`."""
+    df = generate_dataframe(rows, disease, extra_columns, seed)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        df.to_csv(path, index=False, sep=";", encoding="latin-1")
+    elif extension == ".xlsx":
+        df.to_excel(path, index=False)
+    else:
+        raise ValueError(f"Formato de saída não suportado: {path}")
+    return path
+
+
+def write_ibge_dictionary(path: str) -> str:
+    """Grava o dicionário de municípios (formato do Dic_Mun_Res.xlsx) com MUNICIPALITIES."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    pd.DataFrame(
+        MUNICIPALITIES, columns=["ID_MN_RESI", "MUNICIPIO RESI", "UF RESI"]
+    ).to_excel(path, index=False)
+    return path
+
+
+def location_tree(country: str = "Brasil") -> List[dict]:
+    """
+    Árvore hierárquica de localizações (formato do Go.Data) com MUNICIPALITIES.
+    Em Santa Catarina, os municípios ficam abaixo de REGIONS, como no Go.Data
+    do estado; uma das regiões tem o nome do seu município polo.
+    """
+    region_of = {code: region for region, codes in REGIONS.items() for code in codes}
+
+    states: Dict[str, List[dict]] = {}
+    regions: Dict[str, dict] = {}
+    for code, name, uf in MUNICIPALITIES:
+        municipality = _node(f"loc-{code}", name)
+        region = region_of.get(code)
+        if region is None:
+            states.setdefault(uf, []).append(municipality)
+            continue
+        if region not in regions:
+            regions[region] = _node(f"loc-regiao-{_slug(region)}", region)
+            states.setdefault(uf, []).append(regions[region])
+        regions[region]["children"].append(municipality)
+
+    return [_node("loc-br", country, (_node(f"loc-{_slug(uf)}", uf, children) for uf, children in states.items()))]
+
+
+def _node(location_id: str, name: str, children: Iterable[dict] = ()) -> dict:
+    return {"location": {"id": location_id, "name": name}, "children": list(children)}
+
+
+def _slug(name: str) -> str:
+    return name.lower().replace(" ", "-")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera uma base sintética do SINAN.")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--output", default="data/bench/base.csv")
+    parser.add_argument("--disease", default="sarampo")
+    parser.add_argument("--extra-columns", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    write_dataset(args.output, args.rows, args.disease, args.extra_columns, args.seed)
+    print(f"{args.rows} linhas gravadas em {args.output}")
@@ -1,7 +1,15 @@
 from .xlsx_reader import XlsxReader
+from .dbf_reader import DbfReader
+from .csv_reader import CsvReader
+from .cached_reader import CachedReader
 from .godata_location_translator import GodataLocationTranslator
 from .ibge_location_id_translator import IBGELocationIdTranslator
+from .location_resolution_cache import LocationResolutionCache
+from .case_index import LocalCaseIndex
 from .case_uploader import CaseUploader
+from .adaptive_case_uploader import AdaptiveCaseUploader, AdaptiveConcurrencyLimiter
 from .case_json_writer import CaseJsonWriter
+from .run_journal import RunJournal, JournaledOutputPort
 from .godata_outbreak_translator import GodataOutbreakTranslator
+from .reference_data_cache import ReferenceDataCache
 from .translation import *
\ No newline at end of file
@@ -0,0 +1,130 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional
+
+from core.adapters.case_index import LocalCaseIndex
+from core.adapters.case_uploader import CaseUploader
+from core.domain.models import GodataCase
+from core.infra.client import GodataApiClient
+from core.logger import logger
+from core.metrics import metrics
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limite de requisições simultâneas ajustado no estilo AIMD:
+    cresce aditivamente (≈ +1 por janela completa de respostas rápidas)
+    e cai multiplicativamente quando há erro ou a latência passa do alvo.
+    Compartilhado entre as threads de envio.
+    """
+    def __init__(
+            self,
+            initial: float = 4,
+            min_limit: int = 1,
+            max_limit: int = 64,
+            latency_target: float = 2.0,
+            decrease_factor: float = 0.5,
+        ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Bloqueia até haver vaga no limite atual."""
+        with self._condition:
+            self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    def release(self, latency: float, ok: bool) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            if ok and latency <= self.latency_target:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            else:
+                # Uma redução por janela de latência, para uma rajada de erros não zerar o limite
+                now = time.monotonic()
+                if now - self._last_decrease >= self.latency_target:
+                    self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+                    self._last_decrease = now
+                    metrics.inc("upload_concurrency_decreases_total")
+                    logger.debug("Concorrência reduzida para %.1f (latência %.2f s, ok=%s)", self.limit, latency, ok)
+            metrics.set_gauge("upload_concurrency_limit", self.limit)
+            self._condition.notify_all()
+
+
+class AdaptiveCaseUploader(CaseUploader):
+    """
+    Envio de casos em threads com concorrência adaptativa (AIMD).
+
+    As requisições usam o GodataApiClient síncrono em um pool de threads do
+    tamanho do limite máximo, criado uma vez para toda a execução; quantas
+    ficam em andamento ao mesmo tempo é decidido pelo AdaptiveConcurrencyLimiter.
+    Os casos são consumidos do iterável apenas quando há vaga no limite, o que
+    propaga a contrapressão para quem os produz.
+    """
+    def __init__(
+            self,
+            api_client: GodataApiClient,
+            initial_concurrency: int = 4,
+            max_concurrency: int = 64,
+            latency_target: float = 2.0,
+            case_index: Optional[LocalCaseIndex] = None,
+        ):
+        super().__init__(api_client=api_client, max_workers=max_concurrency, case_index=case_index)
+        self.max_concurrency = max_concurrency
+        self.latency_target = latency_target
+        # Limite aprendido, mantido entre chamadas de send_cases
+        self._concurrency_limit = float(initial_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="upload")
+
+    def send_cases(self, casos: Iterable[GodataCase], outbreak_id: str) -> List[dict]:
+        """Envia os casos e retorna os resultados na ordem de conclusão"""
+        existing_cases = self._get_existing_cases(outbreak_id)
+        limiter = AdaptiveConcurrencyLimiter(
+            initial=self._concurrency_limit,
+            max_limit=self.max_concurrency,
+            latency_target=self.latency_target,
+        )
+        skipped: List[dict] = []
+        fingerprints: Dict[str, str] = {}
+
+        with metrics.timer("upload_batch_duration_seconds", uploader="adaptive"):
+            futures = []
+            for caso in self._filter_unchanged(casos, outbreak_id, skipped, fingerprints):
+                limiter.acquire()
+                futures.append(self._executor.submit(self._send_one, limiter, caso, existing_cases))
+            self._notify(outbreak_id, skipped)
+            results = []
+            for future in as_completed(futures):
+                results.append(future.result())
+                self._notify(outbreak_id, results[-1:])
+
+        self._concurrency_limit = limiter.limit
+        self._record_results(outbreak_id, results, fingerprints)
+        if skipped:
+            metrics.inc("cases_uploaded_total", len(skipped), status="skipped")
+        logger.info(
+            "%s casos enviados e %s sem alterações, concorrência final %.1f",
+            len(results), len(skipped), limiter.limit,
+        )
+        return skipped + results
+
+    def _send_one(
+            self,
+            limiter: AdaptiveConcurrencyLimiter,
+            caso: GodataCase,
+            existing_cases: Dict[str, str],
+        ) -> dict:
+        start = time.monotonic()
+        result = self._send_case(caso, existing_cases.get(caso.visualId))
+        limiter.release(time.monotonic() - start, result["status"] == "success")
+        # Casos criados passam a ser atualizados nos blocos seguintes
+        if result["status"] == "success" and result.get("response_id"):
+            existing_cases.setdefault(result["NU_NOTIFIC"], result["response_id"])
+        return result
@@ -0,0 +1,235 @@
+import glob
+import hashlib
+import json
+import os
+import shutil
+import pandas as pd
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from core.logger import logger
+from core.domain.ports import DataframeReader
+
+try:
+    from pyarrow import feather
+except ImportError:  # pyarrow é opcional (extra `cache`); sem ele o cache usa pickle
+    feather = None
+
+# Incrementar quando o formato dos arquivos em cache mudar
+CACHE_VERSION = 2
+HASH_BLOCK_SIZE = 1024 * 1024
+MANIFEST_NAME = "manifest.json"
+
+
+class CachedReader(DataframeReader):
+    """
+    Envolve outro DataframeReader e guarda os blocos lidos (já projetados)
+    em disco, um arquivo por bloco, em formato colunar (Feather/Arrow).
+    Ler o cache evita interpretar de novo a entrada original, mas não é
+    cópia zero: a conversão para pandas copia as colunas de texto.
+    A chave do cache é o hash do conteúdo do arquivo de entrada somado ao
+    `cache_key()` do leitor e às colunas pedidas, então qualquer alteração no
+    arquivo invalida a entrada automaticamente.
+    Na primeira leitura os blocos são gravados à medida que passam, sem
+    manter a entrada inteira em memória; a entrada só vale depois que o
+    manifesto é gravado, ao final.
+    """
+    def __init__(self, reader: DataframeReader, cache_dir: str = "data/cache/input"):
+        self.reader = reader
+        self.cache_dir = cache_dir
+        self.chunk_size: Optional[int] = getattr(reader, "chunk_size", None)
+        self._index_path = os.path.join(cache_dir, "index.json")
+        if feather is None:
+            logger.warning(
+                "pyarrow não está instalado; o cache de entrada usará pickle, "
+                "sem formato colunar (instale o extra `cache`)"
+            )
+
+    def cache_key(self) -> dict:
+        return self.reader.cache_key()
+
+    def read_dataframe(self, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        chunks = list(self.read_chunks(columns))
+        if not chunks:
+            return pd.DataFrame(columns=list(columns or []))
+        return pd.concat(chunks)
+
+    def read_chunks(self, columns: Optional[Iterable[str]] = None) -> Iterator[pd.DataFrame]:
+        columns = list(columns) if columns is not None else None
+        entry_dir = self._entry_dir(columns)
+
+        parts = self._load_manifest(entry_dir)
+        if parts is not None:
+            logger.info("Entrada carregada do cache: %s", entry_dir)
+            yield from self._rechunk(self._load_parts(entry_dir, parts))
+            return
+
+        # Cache ausente: grava cada bloco do leitor em um arquivo à medida que ele passa
+        yield from self._read_and_store(columns, entry_dir)
+
+    # --- Chave do cache ---
+
+    def _entry_dir(self, columns: Optional[List[str]]) -> str:
+        file_hash = self._file_hash(self.reader.file_path)
+        options_key = json.dumps(
+            {
+                "version": CACHE_VERSION,
+                "reader": type(self.reader).__name__,
+                "options": self.reader.cache_key(),
+                "columns": sorted(columns) if columns is not None else None,
+                "format": "feather" if feather is not None else "pickle",
+            },
+            sort_keys=True,
+            default=str,
+        )
+        options_hash = hashlib.sha256(options_key.encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{file_hash}-{options_hash}")
+
+    def _file_hash(self, file_path: str) -> str:
+        """
+        Hash SHA-256 do conteúdo do arquivo.
+        O hash é memorizado por caminho, tamanho e data de modificação
+        para evitar reler arquivos grandes que não mudaram.
+        """
+        stat = os.stat(file_path)
+        key = os.path.abspath(file_path)
+        index = self._read_index()
+        entry = index.get(key)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        file_hash = digest.hexdigest()
+
+        # Conteúdo mudou: as entradas antigas desse arquivo não serão mais usadas
+        if entry and entry["sha256"] != file_hash:
+            self._evict(entry["sha256"])
+
+        index[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": file_hash}
+        self._write_index(index)
+        return file_hash
+
+    def _read_index(self) -> Dict[str, Any]:
+        try:
+            with open(self._index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index: Dict[str, Any]) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self._index_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self._index_path)
+
+    def _evict(self, file_hash: str) -> None:
+        for path in glob.glob(os.path.join(self.cache_dir, f"{file_hash}-*")):
+            logger.debug("Removendo entrada obsoleta do cache: %s", path)
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.exists(path):
+            os.remove(path)
+
+    # --- Leitura e escrita ---
+
+    def _load_manifest(self, entry_dir: str) -> Optional[List[str]]:
+        try:
+            with open(os.path.join(entry_dir, MANIFEST_NAME)) as f:
+                return json.load(f)["parts"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _load_parts(self, entry_dir: str, parts: List[str]) -> Iterator[pd.DataFrame]:
+        start = 0
+        for part in parts:
+            path = os.path.join(entry_dir, part)
+            if part.endswith(".feather"):
+                df = feather.read_table(path, memory_map=True).to_pandas()
+            else:
+                df = pd.read_pickle(path)
+            df.index = pd.RangeIndex(start, start + len(df))
+            start += len(df)
+            yield self._restore_types(df)
+
+    def _rechunk(self, frames: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Reagrupa os blocos gravados no `chunk_size` atual do leitor."""
+        if not self.chunk_size:
+            yield from frames
+            return
+
+        pending: List[pd.DataFrame] = []
+        size = 0
+        for df in frames:
+            pending.append(df)
+            size += len(df)
+            while size >= self.chunk_size:
+                merged = pd.concat(pending) if len(pending) > 1 else pending[0]
+                yield merged.iloc[:self.chunk_size]
+                rest = merged.iloc[self.chunk_size:]
+                pending = [rest] if len(rest) else []
+                size = len(rest)
+        if size:
+            yield pd.concat(pending) if len(pending) > 1 else pending[0]
+
+    @staticmethod
+    def _restore_types(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Colunas de data voltam do formato colunar como datetime64;
+        converte de volta para objetos com None nos ausentes, como os leitores entregam.
+        """
+        for col in df.select_dtypes(include=["datetime", "datetimetz"]).columns:
+            values = df[col]
+            df[col] = values.astype(object).where(values.notna(), None)
+        return df
+
+    def _read_and_store(self, columns: Optional[List[str]], entry_dir: str) -> Iterator[pd.DataFrame]:
+        tmp_dir = f"{entry_dir}.tmp"
+        self._remove(tmp_dir)
+        parts: Optional[List[str]] = []
+        completed = False
+        try:
+            for chunk in self.reader.read_chunks(columns):
+                if parts is not None:
+                    parts = self._store_part(chunk, tmp_dir, parts)
+                yield chunk
+            completed = True
+        finally:
+            # Leitura interrompida ou falha na gravação: a entrada parcial é descartada
+            if completed and parts is not None:
+                self._commit(tmp_dir, entry_dir, parts)
+            else:
+                self._remove(tmp_dir)
+
+    def _store_part(self, chunk: pd.DataFrame, tmp_dir: str, parts: List[str]) -> Optional[List[str]]:
+        """Grava o bloco e retorna a lista de partes; None desativa a gravação desta leitura."""
+        name = f"part-{len(parts):05d}.{'feather' if feather is not None else 'pkl'}"
+        try:
+            os.makedirs(tmp_dir, exist_ok=True)
+            df = chunk.reset_index(drop=True)
+            if feather is not None:
+                # Sem compressão para permitir o mapeamento em memória na leitura
+                feather.write_feather(df, os.path.join(tmp_dir, name), compression="uncompressed")
+            else:
+                df.to_pickle(os.path.join(tmp_dir, name))
+        except Exception as e:
+            logger.warning("Não foi possível gravar o cache de entrada: %s", e)
+            return None
+        return parts + [name]
+
+    def _commit(self, tmp_dir: str, entry_dir: str, parts: List[str]) -> None:
+        try:
+            os.makedirs(tmp_dir, exist_ok=True)
+            with open(os.path.join(tmp_dir, MANIFEST_NAME), "w") as f:
+                json.dump({"version": CACHE_VERSION, "parts": parts}, f)
+            self._remove(entry_dir)
+            os.replace(tmp_dir, entry_dir)
+            logger.info("Entrada gravada no cache: %s (%s blocos)", entry_dir, len(parts))
+        except Exception as e:
+            logger.warning("Não foi possível gravar o cache de entrada: %s", e)
+            self._remove(tmp_dir)
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import asdict
+from typing import Dict, Iterable, Optional, Tuple
+
+from core.domain.models import GodataCase
+from core.infra.client import GodataApiClient
+from core.logger import logger
+
+# Campos que mudam a cada execução sem alterar o conteúdo do caso
+VOLATILE_FIELDS = ("updatedAt",)
+
+
+def case_fingerprint(caso: GodataCase) -> str:
+    """Hash estável do conteúdo do caso mapeado, ignorando VOLATILE_FIELDS."""
+    data = asdict(caso)
+    for field_name in VOLATILE_FIELDS:
+        data.pop(field_name, None)
+    payload = json.dumps(data, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LocalCaseIndex:
+    """
+    Índice local persistente (SQLite) dos casos do Go.Data:
+    (outbreakId, visualId) → (id do caso, updatedAt).
+
+    Cada surto guarda uma marca d'água com o maior `updatedAt` já visto;
+    a sincronização pede ao Go.Data apenas os casos alterados a partir dela,
+    em vez de listar o surto inteiro a cada execução.
+
+    Também guarda a impressão digital (`case_fingerprint`) do último
+    conteúdo enviado de cada caso, para que casos sem alteração não sejam
+    reenviados.
+
+    Casos removidos no Go.Data não aparecem entre os alterados: são esquecidos
+    quando a atualização responde 404 (`remove`) ou com `reset`.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Conexão única protegida por lock, usada pelas threads de envio
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cases ("
+                " outbreak_id TEXT NOT NULL,"
+                " visual_id TEXT NOT NULL,"
+                " case_id TEXT NOT NULL,"
+                " updated_at TEXT,"
+                " PRIMARY KEY (outbreak_id, visual_id))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                " outbreak_id TEXT PRIMARY KEY,"
+                " watermark TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints ("
+                " outbreak_id TEXT NOT NULL,"
+                " visual_id TEXT NOT NULL,"
+                " fingerprint TEXT NOT NULL,"
+                " PRIMARY KEY (outbreak_id, visual_id))"
+            )
+
+    def sync(self, api_client: GodataApiClient, outbreak_id: str, page_size: int = 1000) -> Dict[str, str]:
+        """Atualiza o índice com os casos alterados desde a última sincronização e retorna visualId → id."""
+        watermark = self.get_watermark(outbreak_id)
+        # gte: casos alterados no mesmo instante da marca d'água também são trazidos
+        where = {"updatedAt": {"gte": watermark}} if watermark else None
+        logger.info(
+            "Sincronizando índice de casos do surto %s %s",
+            outbreak_id, f"a partir de {watermark}" if watermark else "(carga completa)",
+        )
+
+        rows = []
+        newest = watermark
+        for case in api_client.iter_cases(outbreak_id, page_size=page_size, where=where):
+            updated_at = case.get("updatedAt")
+            rows.append((case["visualId"], case["id"], updated_at))
+            if updated_at and (newest is None or updated_at > newest):
+                newest = updated_at
+
+        self.upsert_many(outbreak_id, rows)
+        if newest != watermark:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT INTO sync_state (outbreak_id, watermark) VALUES (?, ?)"
+                    " ON CONFLICT(outbreak_id) DO UPDATE SET watermark = excluded.watermark",
+                    (outbreak_id, newest),
+                )
+        logger.info("%s casos alterados desde a última sincronização", len(rows))
+        return self.cases(outbreak_id)
+
+    def get_watermark(self, outbreak_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark FROM sync_state WHERE outbreak_id = ?", (outbreak_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def cases(self, outbreak_id: str) -> Dict[str, str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT visual_id, case_id FROM cases WHERE outbreak_id = ?", (outbreak_id,)
+            ).fetchall()
+        return dict(rows)
+
+    def upsert_many(self, outbreak_id: str, rows: Iterable[Tuple[str, str, Optional[str]]]) -> None:
+        """Grava (visualId, id, updatedAt); updatedAt None mantém o valor já registrado."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO cases (outbreak_id, visual_id, case_id, updated_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(outbreak_id, visual_id) DO UPDATE SET"
+                " case_id = excluded.case_id,"
+                " updated_at = COALESCE(excluded.updated_at, cases.updated_at)",
+                [(outbreak_id, visual_id, case_id, updated_at) for visual_id, case_id, updated_at in rows],
+            )
+
+    def fingerprints(self, outbreak_id: str) -> Dict[str, str]:
+        """Retorna visualId → impressão digital do último conteúdo enviado."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT visual_id, fingerprint FROM fingerprints WHERE outbreak_id = ?", (outbreak_id,)
+            ).fetchall()
+        return dict(rows)
+
+    def set_fingerprints(self, outbreak_id: str, rows: Iterable[Tuple[str, str]]) -> None:
+        """Grava (visualId, impressão digital) dos casos enviados com sucesso."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO fingerprints (outbreak_id, visual_id, fingerprint) VALUES (?, ?, ?)"
+                " ON CONFLICT(outbreak_id, visual_id) DO UPDATE SET fingerprint = excluded.fingerprint",
+                [(outbreak_id, visual_id, fingerprint) for visual_id, fingerprint in rows],
+            )
+
+    def remove(self, outbreak_id: str, visual_ids: Iterable[str]) -> None:
+        """Esquece casos removidos do Go.Data, que a sincronização por alterações não traz."""
+        rows = [(outbreak_id, visual_id) for visual_id in visual_ids]
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM cases WHERE outbreak_id = ? AND visual_id = ?", rows)
+            self._conn.executemany("DELETE FROM fingerprints WHERE outbreak_id = ? AND visual_id = ?", rows)
+
+    def reset(self, outbreak_id: Optional[str] = None) -> None:
+        """Descarta o índice do surto informado (ou de todos), forçando uma carga completa."""
+        with self._lock, self._conn:
+            if outbreak_id is None:
+                self._conn.execute("DELETE FROM cases")
+                self._conn.execute("DELETE FROM sync_state")
+                self._conn.execute("DELETE FROM fingerprints")
+            else:
+                self._conn.execute("DELETE FROM cases WHERE outbreak_id = ?", (outbreak_id,))
+                self._conn.execute("DELETE FROM sync_state WHERE outbreak_id = ?", (outbreak_id,))
+                self._conn.execute("DELETE FROM fingerprints WHERE outbreak_id = ?", (outbreak_id,))
+        logger.info("Índice local de casos descartado")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -6,9 +6,13 @@ import json
 class CaseJsonWriter(CasesOutputPort):
     def __init__(self, file_path: str):
         self.file_path = file_path
+        self._started = False
 
-    def send_cases(self, cases: list[GodataCase]) -> None:
-        with open(self.file_path, 'w') as f:
+    def send_cases(self, cases: list[GodataCase], outbreak_id: str = None) -> None:
+        # O arquivo é recriado na primeira chamada e os blocos seguintes são anexados
+        mode = 'a' if self._started else 'w'
+        self._started = True
+        with open(self.file_path, mode) as f:
             for case in cases:
                 item_dict = asdict(case)
                 json.dump(item_dict, f, indent=4, default=str,sort_keys=True)
\ No newline at end of file
@@ -2,26 +2,55 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import json
 from dataclasses import asdict
-from typing import List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 from pprint import pprint
 
+from core.adapters.case_index import LocalCaseIndex, case_fingerprint
 from core.domain.models import GodataCase
 from core.domain.ports import CasesOutputPort
-from core.infra.client import GodataApiClient
+from core.infra.client import GodataApiClient, GodataApiError
 
 from core.logger import logger
+from core.metrics import metrics
 
 class CaseUploader(CasesOutputPort):
-    def __init__(self, api_client: GodataApiClient, max_workers: int = 5):
+    def __init__(
+            self,
+            api_client: GodataApiClient,
+            max_workers: int = 5,
+            bulk_size: Optional[int] = None,
+            page_size: int = 1000,
+            case_index: Optional[LocalCaseIndex] = None,
+        ):
         self.api_client = api_client
         self.max_workers = max_workers
+        # Casos existentes são listados em páginas de page_size, só com id e visualId
+        self.page_size = page_size
+        # Com case_index, o índice é mantido localmente e só as alterações são consultadas;
+        # casos existentes cujo conteúdo não mudou desde o último envio não são reenviados
+        self.case_index = case_index
+        self._fingerprints: Dict[str, Dict[str, str]] = {}
+        # Com bulk_size, casos novos são criados em lotes pela importação em lote do Go.Data
+        self.bulk_size = bulk_size
+        # Índice visualId → id dos casos existentes, carregado uma vez por surto
+        self._existing_cases: Dict[str, Dict[str, str]] = {}
+        self._result_listeners: List[Callable[[str, List[dict]], None]] = []
+
+    def add_result_listener(self, listener: Callable[[str, List[dict]], None]) -> None:
+        """Registra uma função chamada com (outbreak_id, resultados) assim que cada envio termina."""
+        self._result_listeners.append(listener)
+
+    def _notify(self, outbreak_id: str, results: List[dict]) -> None:
+        if not results:
+            return
+        for listener in self._result_listeners:
+            listener(outbreak_id, results)
 
-    
     def _send_case(self, caso: GodataCase, case_id: str = None) -> dict:
         """Envia um caso individual para a API e retorna o resultado"""
         try:
             if case_id:
-                response = self.api_client.put_case(caso.outbreakId, case_id, asdict(caso))
+                response = self._update_case(caso, case_id)
             else:
                 response = self.api_client.post_case(caso.outbreakId, asdict(caso))
 
@@ -39,20 +68,184 @@ class CaseUploader(CasesOutputPort):
                 "error_message": str(e),
             }
 
+    def _update_case(self, caso: GodataCase, case_id: str) -> dict:
+        try:
+            return self.api_client.put_case(caso.outbreakId, case_id, asdict(caso))
+        except GodataApiError as e:
+            if e.status_code != 404:
+                raise
+        # Removido no Go.Data depois da última sincronização: é esquecido e criado de novo
+        logger.warning("Caso NU_NOTIFIC=%s não existe mais no Go.Data, criando novamente", caso.visualId)
+        self._existing_cases.get(caso.outbreakId, {}).pop(caso.visualId, None)
+        if self.case_index is not None:
+            self.case_index.remove(caso.outbreakId, [caso.visualId])
+        return self.api_client.post_case(caso.outbreakId, asdict(caso))
+
+    def _send_batch(self, casos: List[GodataCase], outbreak_id: str) -> List[dict]:
+        """
+        Cria um lote de casos novos em uma única requisição.
+        Se o lote falhar, os casos desse lote são enviados individualmente.
+        """
+        try:
+            response = self.api_client.import_cases(outbreak_id, [asdict(caso) for caso in casos])
+        except GodataApiError as e:
+            logger.warning("Falha no envio em lote de %s casos, enviando individualmente: %s", len(casos), e)
+            return self._send_batch_fallback(casos, outbreak_id)
+
+        ids = self._response_ids(response, len(casos))
+        found: Optional[Dict[str, str]] = {}
+        unconfirmed = [caso.visualId for caso, case_id in zip(casos, ids) if not case_id]
+        if unconfirmed:
+            # Sem o id na resposta, não há como saber se o caso foi criado: consulta o Go.Data
+            logger.warning("Resposta do envio em lote sem o id de %s casos, confirmando no Go.Data", len(unconfirmed))
+            try:
+                found = self._find_cases(outbreak_id, unconfirmed)
+            except GodataApiError as e:
+                logger.error("Não foi possível confirmar os casos do lote: %s", e)
+                found = None
+
+        results = []
+        for caso, case_id in zip(casos, ids):
+            case_id = case_id or (found or {}).get(caso.visualId)
+            if case_id:
+                results.append({"NU_NOTIFIC": caso.visualId, "status": "success", "response_id": case_id})
+            elif found is None:
+                results.append({
+                    "NU_NOTIFIC": caso.visualId,
+                    "status": "error",
+                    "error_message": "envio em lote não confirmado",
+                })
+            else:
+                # Não foi criado pelo lote: envia individualmente
+                results.append(self._send_case(caso))
+        logger.info("Lote de %s casos enviado.", len(casos))
+        return results
+
+    @staticmethod
+    def _response_ids(response, size: int) -> List[Optional[str]]:
+        """Ids dos casos criados, quando a resposta é uma lista na ordem dos casos enviados."""
+        if not isinstance(response, list) or len(response) != size:
+            return [None] * size
+        return [item.get("id") if isinstance(item, dict) else None for item in response]
+
+    def _send_batch_fallback(self, casos: List[GodataCase], outbreak_id: str) -> List[dict]:
+        # Parte do lote pode ter sido criada antes da falha: esses casos são atualizados
+        try:
+            created = self._find_cases(outbreak_id, [caso.visualId for caso in casos])
+        except GodataApiError as e:
+            logger.error("Não foi possível verificar os casos do lote com falha: %s", e)
+            created = {}
+        return [self._send_case(caso, case_id=created.get(caso.visualId)) for caso in casos]
+
+    def _find_cases(self, outbreak_id: str, visual_ids: List[str]) -> Dict[str, str]:
+        filter_params = {"filter": json.dumps({
+            "where": {"visualId": {"inq": visual_ids}},
+            "fields": {"id": True, "visualId": True},
+        })}
+        return {case['visualId']: case['id'] for case in self.api_client.get_cases(outbreak_id, filter_params)}
+
+    def _get_existing_cases(self, outbreak_id: str) -> Dict[str, str]:
+        """Retorna o índice visualId → id do surto, consultando a API apenas na primeira chamada"""
+        if outbreak_id not in self._existing_cases and self.case_index is not None:
+            self._existing_cases[outbreak_id] = self.case_index.sync(
+                self.api_client, outbreak_id, page_size=self.page_size
+            )
+        elif outbreak_id not in self._existing_cases:
+            cases_repository = self.api_client.iter_cases(
+                outbreak_id, page_size=self.page_size, fields=("id", "visualId", "updatedAt")
+            )
+            self._existing_cases[outbreak_id] = {case['visualId']: case['id'] for case in cases_repository}
+            logger.info("%s casos existentes no surto", len(self._existing_cases[outbreak_id]))
+        return self._existing_cases[outbreak_id]
+
+    def _get_fingerprints(self, outbreak_id: str) -> Dict[str, str]:
+        if outbreak_id not in self._fingerprints:
+            self._fingerprints[outbreak_id] = self.case_index.fingerprints(outbreak_id)
+        return self._fingerprints[outbreak_id]
+
+    def _filter_unchanged(
+            self,
+            casos: Iterable[GodataCase],
+            outbreak_id: str,
+            skipped: List[dict],
+            fingerprints: Dict[str, str],
+        ) -> Iterator[GodataCase]:
+        """
+        Gera os casos que precisam ser enviados. Os que já existem no Go.Data com
+        o mesmo conteúdo vão para `skipped`; a impressão digital dos demais vai
+        para `fingerprints`, para ser gravada após o envio.
+        """
+        if self.case_index is None:
+            yield from casos
+            return
+
+        existing_cases = self._get_existing_cases(outbreak_id)
+        stored = self._get_fingerprints(outbreak_id)
+        for caso in casos:
+            fingerprint = case_fingerprint(caso)
+            if caso.visualId in existing_cases and stored.get(caso.visualId) == fingerprint:
+                skipped.append({"NU_NOTIFIC": caso.visualId, "status": "skipped"})
+                continue
+            fingerprints[caso.visualId] = fingerprint
+            yield caso
+
+    def _record_results(self, outbreak_id: str, results: List[dict], fingerprints: Dict[str, str]) -> None:
+        """Casos criados passam a ser atualizados nos blocos seguintes e nas próximas execuções"""
+        existing_cases = self._get_existing_cases(outbreak_id)
+        created = []
+        sent = []
+        for item in results:
+            metrics.inc("cases_uploaded_total", status=item["status"])
+            if item["status"] != "success":
+                continue
+            if item.get("response_id"):
+                if existing_cases.setdefault(item["NU_NOTIFIC"], item["response_id"]) == item["response_id"]:
+                    created.append((item["NU_NOTIFIC"], item["response_id"], None))
+            if item["NU_NOTIFIC"] in fingerprints:
+                sent.append((item["NU_NOTIFIC"], fingerprints[item["NU_NOTIFIC"]]))
+
+        if self.case_index is not None:
+            if created:
+                self.case_index.upsert_many(outbreak_id, created)
+            if sent:
+                self.case_index.set_fingerprints(outbreak_id, sent)
+                self._get_fingerprints(outbreak_id).update(sent)
+
     def send_cases(self,  casos: List[GodataCase], outbreak_id: str) -> List[dict]:
         """Executa envio de casos em paralelo"""
         results = []
-        cases_repository = self.api_client.get_cases(outbreak_id)
-        existing_cases = {case['visualId']: case['id'] for case in cases_repository}
+        existing_cases = self._get_existing_cases(outbreak_id)
+        fingerprints: Dict[str, str] = {}
+        casos = list(self._filter_unchanged(casos, outbreak_id, results, fingerprints))
+        if results:
+            logger.info("%s casos sem alterações não serão reenviados", len(results))
+            self._notify(outbreak_id, results)
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_case = {
+        if self.bulk_size:
+            # Casos existentes continuam sendo atualizados um a um
+            individual = [caso for caso in casos if caso.visualId in existing_cases]
+            new_cases = [caso for caso in casos if caso.visualId not in existing_cases]
+        else:
+            individual, new_cases = casos, []
+
+        with metrics.timer("upload_batch_duration_seconds", uploader="threads"), \
+                ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
                 executor.submit(
                     self._send_case, 
                     caso=caso, 
                     case_id=existing_cases.get(caso.visualId, None)
-                ): caso for caso in casos
-            }
-            for future in as_completed(future_to_case):
-                results.append(future.result())
+                ) for caso in individual
+            ]
+            futures += [
+                executor.submit(self._send_batch, new_cases[i:i + self.bulk_size], outbreak_id)
+                for i in range(0, len(new_cases), self.bulk_size or 1)
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                result = result if isinstance(result, list) else [result]
+                results.extend(result)
+                self._notify(outbreak_id, result)
+
+        self._record_results(outbreak_id, results, fingerprints)
         return results
\ No newline at end of file
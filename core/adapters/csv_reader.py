@@ -0,0 +1,107 @@
+import codecs
+import pandas as pd
+from typing import Iterable, Iterator, Optional
+from core.logger import logger
+from core.domain.ports import DataframeReader
+
+# Delimitadores aceitos na detecção automática, em ordem de preferência
+CANDIDATE_DELIMITERS = (";", ",", "\t", "|")
+SAMPLE_SIZE = 64 * 1024
+# Blocos lidos ao verificar se o arquivo inteiro é UTF-8 válido
+SCAN_BLOCK_SIZE = 1024 * 1024
+
+
+class CsvReader(DataframeReader):
+    """
+    Leitor de extrações do SINAN em CSV.
+    Todas as colunas são lidas como string, como no XlsxReader, e o arquivo
+    é entregue em blocos de `chunk_size` linhas.
+    Quando não informados, o delimitador é detectado pelo início do arquivo
+    e a codificação pelo arquivo inteiro: UTF-8 se todo ele for UTF-8
+    válido, senão latin-1. A decodificação é estrita, sem substituir
+    caracteres. As datas seguem como texto e são convertidas
+    pelos mapeadores, que aceitam os formatos comuns do SINAN
+    (`2024-01-02`, `02/01/2024`, ...; ver `core.domain.services.dates`).
+    """
+    def __init__(
+            self,
+            file_path: str,
+            n_rows: Optional[int] = None,
+            chunk_size: int = 5000,
+            sep: Optional[str] = None,
+            encoding: Optional[str] = None,
+        ):
+        self.file_path = file_path
+        self.n_rows = n_rows
+        self.chunk_size = chunk_size
+        self.sep = sep
+        self.encoding = encoding
+
+    def cache_key(self) -> dict:
+        return {"n_rows": self.n_rows, "sep": self.sep, "encoding": self.encoding}
+
+    def read_dataframe(self, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        try:
+            df = pd.read_csv(self.file_path, **self._read_options(columns))
+            logger.info("CSV lido com sucesso: %s linhas", len(df))
+        except Exception as e:
+            logger.error("Erro ao ler o CSV: %s", e)
+            raise
+
+        return df
+
+    def read_chunks(self, columns: Optional[Iterable[str]] = None) -> Iterator[pd.DataFrame]:
+        try:
+            reader = pd.read_csv(self.file_path, chunksize=self.chunk_size, **self._read_options(columns))
+        except Exception as e:
+            logger.error("Erro ao ler o CSV: %s", e)
+            raise
+
+        total = 0
+        with reader:
+            for chunk in reader:
+                total += len(chunk)
+                yield chunk
+
+        logger.info("CSV lido com sucesso: %s linhas", total)
+
+    def _read_options(self, columns: Optional[Iterable[str]] = None) -> dict:
+        sample = self._read_sample()
+        encoding = self.encoding or self._detect_encoding(sample, self.file_path)
+        sep = self.sep or self._detect_delimiter(sample.decode(encoding, errors="replace"))
+        logger.debug("CSV %s: delimitador=%r, codificação=%s", self.file_path, sep, encoding)
+
+        usecols = set(columns) if columns is not None else None
+        return {
+            "sep": sep,
+            "encoding": encoding,
+            "dtype": str,
+            "nrows": self.n_rows,
+            "usecols": (lambda name: name in usecols) if usecols is not None else None,
+        }
+
+    def _read_sample(self) -> bytes:
+        with open(self.file_path, "rb") as f:
+            return f.read(SAMPLE_SIZE)
+
+    @staticmethod
+    def _detect_encoding(sample: bytes, file_path: str) -> str:
+        if sample.startswith(codecs.BOM_UTF8):
+            return "utf-8-sig"
+        # Acentos podem aparecer só depois da amostra: o arquivo inteiro é verificado
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            with open(file_path, "rb") as f:
+                for block in iter(lambda: f.read(SCAN_BLOCK_SIZE), b""):
+                    decoder.decode(block)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return "latin-1"
+        return "utf-8"
+
+    @staticmethod
+    def _detect_delimiter(sample: str) -> str:
+        header = sample.splitlines()[0] if sample else ""
+        counts = {delimiter: header.count(delimiter) for delimiter in CANDIDATE_DELIMITERS}
+        best = max(CANDIDATE_DELIMITERS, key=lambda delimiter: counts[delimiter])
+        return best if counts[best] > 0 else ","
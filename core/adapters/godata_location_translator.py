@@ -1,37 +1,158 @@
-import pandas as pd
+import hashlib
+import json
+import unicodedata
+from collections import deque
+from typing import Dict, Optional, Set, Tuple
+from core.adapters.reference_data_cache import ReferenceDataCache
 from core.logger import logger
 
+
+def normalize_location_name(name: str) -> str:
+    """Normaliza nomes de localização ignorando acentos, caixa e espaços extras."""
+    text = unicodedata.normalize("NFKD", str(name or ""))
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(text.casefold().split())
+
+
 class GodataLocationTranslator:
+    """
+    Resolve (município, UF) para o id de localização do Go.Data.
+
+    A árvore de localizações só é baixada e indexada na primeira tradução;
+    execuções que resolvem tudo pela tabela persistente (LocationResolutionCache)
+    não chegam a carregá-la.
+    """
     def __init__(self, api_client):
         self.api_client = api_client
-        
+        self.locations: Optional[dict] = None
+        self._ufs: Optional[Set[str]] = None
+        self._index: Optional[Dict[Tuple[str, str], str]] = None
+        # Localizações não encontradas, reportadas juntas ao final da importação
+        self._unresolved: Set[Tuple[Optional[str], str]] = set()
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Identifica a versão da árvore de localizações. Com ReferenceDataCache,
+        vem dos metadados do snapshot, sem baixar nem indexar a árvore.
+        """
+        if hasattr(self.api_client, "locations_version"):
+            return self.api_client.locations_version()
+        self._ensure_loaded()
+        return hashlib.sha256(
+            json.dumps(self.locations, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _ensure_loaded(self) -> None:
+        if self._index is not None:
+            return
+
         logger.info("Carregando localizações do Go.Data")
-        
         self.locations = next((pais for pais in self.api_client.get_locations() if pais["location"].get("name") == "Brasil"), None)
-        
-        logger.info("Localizações carregadas com sucesso")
-        
+        self._ufs, self._index = self._build_index(self.locations)
+        logger.info("Localizações carregadas com sucesso: %s localizações indexadas", len(self._index))
+
+    def __getstate__(self) -> dict:
+        # Ao ser enviado a processos de mapeamento, não leva o cliente (sessões,
+        # locks), que não é serializável, nem a árvore, que não é consultada.
+        # O índice só vai se já tiver sido carregado; com ReferenceDataCache, os
+        # processos carregam a árvore do snapshot apenas se algum código não estiver
+        # na tabela persistente. Sem ela, os processos não teriam como carregá-la.
+        state = self.__dict__.copy()
+        state["locations"] = None
+        if self._index is None and isinstance(self.api_client, ReferenceDataCache):
+            # Garante o snapshot em disco, sem carregar nem indexar a árvore
+            self.api_client.locations_version()
+            return state
+        self._ensure_loaded()
+        state.update(api_client=None, _ufs=self._ufs, _index=self._index)
+        return state
+
+    @staticmethod
+    def _build_index(country: Optional[dict]) -> Tuple[Set[str], Dict[Tuple[str, str], str]]:
+        """
+        Indexa as localizações abaixo de cada UF por (UF, nome), com nomes normalizados.
+        Municípios são as folhas da árvore, em qualquer profundidade (ex.: abaixo das
+        regiões de Santa Catarina). Em nomes repetidos, folhas têm prioridade sobre
+        níveis intermediários e, entre estes, vence o mais profundo; nomes repetidos
+        no mesmo nível são ambíguos e ficam com o primeiro, com um aviso no log.
+        """
+        ufs: Set[str] = set()
+        index: Dict[Tuple[str, str], str] = {}
+        if not country:
+            return ufs, index
+
+        # (é folha, profundidade) da localização indexada em cada chave
+        ranks: Dict[Tuple[str, str], Tuple[bool, int]] = {}
+        collisions: Dict[Tuple[str, str], Tuple[bool, int]] = {}
+        for estado in country.get("children", []):
+            uf = normalize_location_name(estado["location"].get("name"))
+            ufs.add(uf)
+
+            queue = deque((node, 1) for node in estado.get("children", []))
+            while queue:
+                node, depth = queue.popleft()
+                children = node.get("children") or []
+                key = (uf, normalize_location_name(node["location"].get("name")))
+                location_id = node["location"].get("id")
+                rank = (not children, depth)
+
+                if key not in ranks or rank > ranks[key]:
+                    index[key] = location_id
+                    ranks[key] = rank
+                elif rank == ranks[key] and index[key] != location_id:
+                    collisions[key] = rank
+                queue.extend((child, depth + 1) for child in children)
+
+        # Repetições em níveis que perderam para outra localização não são ambíguas
+        ambiguous = sorted(
+            f"{name} ({uf})" for (uf, name), rank in collisions.items() if ranks[(uf, name)] == rank
+        )
+        if ambiguous:
+            logger.warning("Localizações com nomes repetidos no Go.Data (usada a primeira): %s", ", ".join(ambiguous))
+        return ufs, index
 
     def translate(self, municipio: str,  uf: str):
-        uf_loc = next((estado for estado in self.locations["children"] if estado["location"].get("name") == uf), None)
-        
-        if not uf_loc:
-            logger.warning("UF não encontrada: %s", uf)
+        self._ensure_loaded()
+        uf_key = normalize_location_name(uf)
+        if uf_key not in self._ufs:
+            self._report_unresolved(None, uf)
             return
-        
-        if uf in ["Santa Catarina"]:
-            for regiao in uf_loc["children"]:
-                logger.debug("Verificando municípios: %s", regiao["location"].get("name"))
-                municipio_loc = next((mun for mun in regiao["children"] if mun["location"].get("name") == municipio), None)
-                if municipio_loc:
-                    break
-        else:
-            municipio_loc = next((mun for mun in uf_loc["children"] if mun["location"].get("name") == municipio), None)
 
-        if not municipio_loc:
-            logger.warning("Município não encontrado: %s", municipio)
+        location_id = self._index.get((uf_key, normalize_location_name(municipio)))
+        if location_id is None:
+            self._report_unresolved(municipio, uf)
             return
 
-        return municipio_loc["location"].get("id")
-    
+        return location_id
+
+    def _report_unresolved(self, municipio: Optional[str], uf: str) -> None:
+        """Guarda a localização não encontrada para o resumo de `report_unresolved`."""
+        key = (municipio, uf)
+        if key in self._unresolved:
+            return
+        self._unresolved.add(key)
 
+        if municipio is None:
+            logger.debug("UF não encontrada: %s", uf)
+        else:
+            logger.debug("Município não encontrado: %s (%s)", municipio, uf)
+
+    @property
+    def unresolved(self) -> Set[Tuple[Optional[str], str]]:
+        """(município, UF) não encontrados; município None indica UF não encontrada."""
+        return set(self._unresolved)
+
+    def merge_unresolved(self, unresolved: Set[Tuple[Optional[str], str]]) -> None:
+        """Incorpora localizações não encontradas em outro processo."""
+        self._unresolved.update(unresolved)
+
+    def report_unresolved(self) -> None:
+        """Registra no log o resumo das localizações que não puderam ser resolvidas."""
+        if not self._unresolved:
+            return
+        names = sorted(
+            f"UF {uf}" if municipio is None else f"{municipio} ({uf})"
+            for municipio, uf in self._unresolved
+        )
+        logger.warning("%s localizações não resolvidas no Go.Data: %s", len(names), ", ".join(names))
@@ -1,14 +1,31 @@
 from core.infra import GodataApiClient
-from pprint import pprint
+from core.logger import logger
+
+
 class GodataOutbreakTranslator: 
     def __init__(self, api_client: GodataApiClient):
-        self.outbreaks = api_client.get_outbreaks()
+        self.api_client = api_client
+        self._load()
 
+    def _load(self) -> None:
+        self.outbreaks = self.api_client.get_outbreaks()
+        # Índice nome → id; em nomes repetidos vale o primeiro, como na busca original
+        self._ids_by_name = {}
+        for ob in self.outbreaks:
+            self._ids_by_name.setdefault(ob['name'], ob['id'])
 
     def translate(self, outbreak_name: str) -> str:
-        outbreak_id = next((ob['id'] for ob in self.outbreaks if ob['name']== outbreak_name), None)
+        outbreak_id = self._ids_by_name.get(outbreak_name)
+
+        if outbreak_id is None:
+            # O surto pode ter sido criado depois do snapshot local: busca a lista uma vez mais
+            logger.info("Agravo '%s' não encontrado, atualizando a lista de surtos", outbreak_name)
+            if hasattr(self.api_client, "invalidate"):
+                self.api_client.invalidate("outbreaks")
+            self._load()
+            outbreak_id = self._ids_by_name.get(outbreak_name)
 
-        if outbreak_id == None:
+        if outbreak_id is None:
             raise ValueError(f"Agravo de nome '{outbreak_name}' não encontrado no GoData.") 
         
-        return outbreak_id
\ No newline at end of file
+        return outbreak_id
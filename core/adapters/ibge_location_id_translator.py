@@ -1,46 +1,96 @@
-from typing import Tuple
+import hashlib
+import os
+import pickle
+from typing import Dict, Optional, Tuple
 import pandas as pd
+from core.logger import logger
+
+# Incrementar quando o formato da tabela compilada mudar
+COMPILED_VERSION = 1
+
 
 class IBGELocationIdTranslator:
     """
     Classe para mapear códigos de município e UF (unidade federativa)
     para seus respectivos nomes, com base em um dicionário Excel.
+
+    A tabela código → (município, UF) é compilada uma vez e salva ao lado
+    do dicionário (`<dicionário>.cache`), identificada pelo hash do arquivo
+    de origem; nas execuções seguintes ela é carregada sem reler o Excel.
+    A tabela só é carregada na primeira consulta.
     """
-    def __init__(self, dictionary_path: str):
+    def __init__(self, dictionary_path: str, compiled_path: Optional[str] = None):
+        self.dictionary_path = dictionary_path
+        self.compiled_path = compiled_path or f"{dictionary_path}.cache"
+        # Identifica a versão do dicionário pelo tamanho e data de modificação, sem lê-lo
+        stat = os.stat(dictionary_path)
+        self.fingerprint = f"{stat.st_size}-{stat.st_mtime_ns}"
+        # Dicionário de código → (município, UF)
+        self._loaded_table: Optional[Dict[str, Tuple[str, str]]] = None
+
+    @property
+    def _table(self) -> Dict[str, Tuple[str, str]]:
+        if self._loaded_table is None:
+            with open(self.dictionary_path, "rb") as f:
+                source_hash = hashlib.sha256(f.read()).hexdigest()
+            table = self._load_compiled(self.compiled_path, source_hash)
+            if table is None:
+                table = self._compile(self.dictionary_path)
+                self._save_compiled(self.compiled_path, source_hash, table)
+            self._loaded_table = table
+        return self._loaded_table
+
+    @staticmethod
+    def _compile(dictionary_path: str) -> Dict[str, Tuple[str, str]]:
         dic = pd.read_excel(dictionary_path, dtype=str)
         dic.columns = dic.columns.str.strip().str.upper()
-        
+
         expected_cols = {"ID_MN_RESI", "MUNICIPIO RESI", "UF RESI"}
         missing = expected_cols - set(dic.columns)
         if missing:
             raise ValueError(f"Colunas ausentes no dicionário: {missing}")
 
-        # Dicionário de código → município
-        self.municipios = (
-            dic[["ID_MN_RESI", "MUNICIPIO RESI"]]
-            .drop_duplicates()
-            .set_index("ID_MN_RESI")["MUNICIPIO RESI"]
-            .to_dict()
-        )
-
-        # Dicionário de código → UF
-        self.ufs = (
-            dic[["ID_MN_RESI", "UF RESI"]]
-            .drop_duplicates()
-            .set_index("ID_MN_RESI")["UF RESI"]
-            .to_dict()
-        )
-    
+        dic = dic[["ID_MN_RESI", "MUNICIPIO RESI", "UF RESI"]].fillna("")
+        return {
+            codigo: (municipio, uf)
+            for codigo, municipio, uf in zip(dic["ID_MN_RESI"], dic["MUNICIPIO RESI"], dic["UF RESI"])
+            if codigo
+        }
+
+    def _load_compiled(self, compiled_path: str, source_hash: str) -> Optional[Dict[str, Tuple[str, str]]]:
+        try:
+            with open(compiled_path, "rb") as f:
+                data = pickle.load(f)
+        except Exception:
+            return None
+
+        if not isinstance(data, dict):
+            return None
+        if data.get("version") != COMPILED_VERSION or data.get("source_hash") != source_hash:
+            return None
+        return data["table"]
+
+    def _save_compiled(self, compiled_path: str, source_hash: str, table: Dict[str, Tuple[str, str]]) -> None:
+        data = {"version": COMPILED_VERSION, "source_hash": source_hash, "table": table}
+        # Gravação atômica: processos de mapeamento podem compilar o dicionário ao mesmo tempo
+        tmp_path = f"{compiled_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, compiled_path)
+        except OSError as e:
+            logger.warning("Não foi possível salvar o dicionário IBGE compilado: %s", e)
+
     def get_municipio(self, codigo: str) -> str:
         """Retorna o nome do município dado o código."""
-        return self.municipios.get(codigo, "")
-    
+        return self._table.get(codigo, ("", ""))[0]
+
     def get_uf(self, codigo: str) -> str:
         """Retorna o nome da UF dado o código."""
-        return self.ufs.get(codigo, "")
-    
+        return self._table.get(codigo, ("", ""))[1]
+
     def get_location(self, codigo: str) -> Tuple[str, str]:
         """Retorna o nome do município e da UF dado o código."""
-        return self.get_municipio(codigo), self.get_uf(codigo)
-    
+        return self._table.get(codigo, ("", ""))
+
 
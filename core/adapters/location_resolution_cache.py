@@ -0,0 +1,75 @@
+import json
+import os
+from typing import Dict, Optional
+from core.logger import logger
+
+
+class LocationResolutionCache:
+    """
+    Tabela persistente código IBGE (ID_MN_RESI) → id de localização do Go.Data.
+
+    A tabela é válida apenas para a combinação de árvore de localizações e
+    dicionário de municípios que a gerou, identificada por `fingerprint`
+    (versão do snapshot de localizações e tamanho/data do dicionário, que
+    não exigem carregar nenhum dos dois); se algum mudar, a tabela salva é
+    descartada e reconstruída.
+    Códigos não resolvidos ficam só em memória, para voltarem a ser
+    reportados nas execuções seguintes.
+    """
+    VERSION = 1
+
+    def __init__(self, path: str, fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+        self._table: Dict[str, Optional[str]] = self._load()
+        self._dirty = False
+
+    @staticmethod
+    def build_fingerprint(*parts: str) -> str:
+        return ":".join(parts)
+
+    def _load(self) -> Dict[str, Optional[str]]:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if data.get("version") != self.VERSION or data.get("fingerprint") != self.fingerprint:
+            logger.info("Localizações ou dicionário IBGE mudaram, a tabela de resolução será reconstruída")
+            return {}
+
+        table = data.get("table", {})
+        logger.info("Tabela de resolução de localizações carregada: %s municípios", len(table))
+        return table
+
+    def __contains__(self, codigo: str) -> bool:
+        return codigo in self._table
+
+    def __getitem__(self, codigo: str) -> Optional[str]:
+        return self._table[codigo]
+
+    def __setitem__(self, codigo: str, location_id: Optional[str]) -> None:
+        self._table[codigo] = location_id
+        if location_id is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        data = {
+            "version": self.VERSION,
+            "fingerprint": self.fingerprint,
+            "table": {codigo: loc for codigo, loc in self._table.items() if loc is not None},
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        logger.info("Tabela de resolução de localizações salva: %s", self.path)
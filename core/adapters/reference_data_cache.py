@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+from core.infra import GodataApiClient
+from core.logger import logger
+
+
+class ReferenceDataCache:
+    """
+    Camada de dados de referência do Go.Data (localizações e surtos)
+    com snapshot local.
+
+    Pode ser passada no lugar do GodataApiClient para os tradutores
+    (GodataLocationTranslator, GodataOutbreakTranslator): expõe os mesmos
+    `get_locations`/`get_outbreaks`, mas só consulta a API quando o snapshot
+    não existe, expirou (`ttl_seconds`) ou foi invalidado.
+
+    Enviada a processos de mapeamento, vai sem o cliente da API: lá apenas
+    lê os snapshots, mesmo expirados durante a execução.
+    """
+    def __init__(
+            self,
+            api_client: GodataApiClient,
+            snapshot_dir: str = "data/cache/reference",
+            ttl_seconds: float = 24 * 60 * 60,
+            country_name: str = "Brasil",
+        ):
+        self.api_client = api_client
+        self.snapshot_dir = snapshot_dir
+        self.ttl_seconds = ttl_seconds
+        self.country_name = country_name
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["api_client"] = None
+        return state
+
+    # --- Dados de referência ---
+
+    def get_locations(self, filter_params: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """Retorna apenas a subárvore do país configurado."""
+        snapshot = self._load("locations")
+        if snapshot is not None:
+            return snapshot
+
+        self._require_api("locations")
+        locations = self._fetch_country_locations(filter_params)
+        # Sem a árvore do país, nada é salvo: a próxima execução tenta de novo
+        if locations:
+            self._save("locations", locations)
+        return locations
+
+    def get_outbreaks(self) -> List[Dict[str, Any]]:
+        snapshot = self._load("outbreaks")
+        if snapshot is not None:
+            return snapshot
+
+        self._require_api("outbreaks")
+        outbreaks = self.api_client.get_outbreaks()
+        self._save("outbreaks", outbreaks)
+        return outbreaks
+
+    def locations_version(self) -> str:
+        """
+        Hash do conteúdo do snapshot de localizações, lido dos metadados sem
+        carregar a árvore. Sem snapshot válido, as localizações são baixadas.
+        """
+        meta = self._load_meta("locations")
+        if meta is None:
+            self.get_locations()
+            meta = self._load_meta("locations")
+        return meta["sha256"] if meta is not None else ""
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Remove o snapshot informado ("locations" ou "outbreaks") ou todos."""
+        names = [name] if name else ["locations", "outbreaks"]
+        for snapshot_name in names:
+            path = self._path(snapshot_name)
+            if os.path.exists(self._meta_path(snapshot_name)):
+                os.remove(self._meta_path(snapshot_name))
+            if os.path.exists(path):
+                os.remove(path)
+                logger.info("Snapshot de %s invalidado", snapshot_name)
+
+    def _fetch_country_locations(self, filter_params: Optional[Dict[str, str]]) -> List[Dict[str, Any]]:
+        # A API hierárquica não tem filtro que devolva só a subárvore de um país
+        # (o `where` é aplicado à lista e volta o país sem filhos): a árvore é
+        # baixada inteira e recortada aqui. O que evita o download nas execuções
+        # seguintes é o snapshot, que guarda apenas o país.
+        logger.info("Baixando localizações do Go.Data")
+        country = self._find_country(self.api_client.get_locations(filter_params=filter_params) or [])
+        if country is None:
+            logger.warning("Árvore de localizações de %s não encontrada no Go.Data", self.country_name)
+
+        return [country] if country is not None else []
+
+    def _find_country(self, locations: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Nó do país com a sua subárvore."""
+        return next(
+            (
+                node for node in locations
+                if node["location"].get("name") == self.country_name and node.get("children")
+            ),
+            None,
+        )
+
+    def _require_api(self, name: str) -> None:
+        if self.api_client is None:
+            raise RuntimeError(f"Snapshot de {name} indisponível e sem acesso à API neste processo")
+
+    # --- Snapshots ---
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.snapshot_dir, f"{name}.json")
+
+    def _meta_path(self, name: str) -> str:
+        return os.path.join(self.snapshot_dir, f"{name}.meta.json")
+
+    def _load_meta(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._meta_path(name)) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - meta.get("fetched_at", 0) > self.ttl_seconds or not os.path.exists(self._path(name)):
+            return None
+        return meta
+
+    def _load(self, name: str) -> Optional[Any]:
+        try:
+            with open(self._path(name)) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        age = time.time() - snapshot.get("fetched_at", 0)
+        # Sem o cliente da API (em outro processo), o snapshot é usado mesmo expirado
+        if age > self.ttl_seconds and self.api_client is not None:
+            logger.info("Snapshot de %s expirado (%.0f s)", name, age)
+            return None
+
+        logger.info("Usando snapshot local de %s (%.0f s)", name, age)
+        return snapshot.get("data")
+
+    def _save(self, name: str, data: Any) -> None:
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        fetched_at = time.time()
+        content = json.dumps(data, sort_keys=True)
+        # Metadados à parte, para consultar a versão sem ler o snapshot inteiro
+        meta = {"fetched_at": fetched_at, "sha256": hashlib.sha256(content.encode()).hexdigest()}
+        for path, document in (
+            (self._path(name), {"fetched_at": fetched_at, "data": data}),
+            (self._meta_path(name), meta),
+        ):
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(document, f)
+            os.replace(tmp_path, path)
@@ -0,0 +1,160 @@
+import json
+import os
+import threading
+from dataclasses import asdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from core.domain.models import GodataCase
+from core.domain.ports import CasesOutputPort
+from core.logger import logger
+from core.metrics import metrics
+
+
+class RunJournal:
+    """
+    Diário durável (JSON Lines) do resultado de cada caso enviado.
+
+    Cada linha registra surto, visualId e status; casos com erro levam
+    também o payload enviado, para poderem ser reenviados depois sem
+    reprocessar a entrada. Vale sempre o último registro de cada caso.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Começa um diário novo, descartando o da execução anterior."""
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def record(self, outbreak_id: str, results: Iterable[dict], cases: Dict[str, GodataCase]) -> None:
+        lines = []
+        for result in results:
+            entry = {"outbreakId": outbreak_id, "visualId": result["NU_NOTIFIC"], "status": result["status"]}
+            if result["status"] == "error":
+                entry["error_message"] = result.get("error_message")
+                caso = cases.get(result["NU_NOTIFIC"])
+                if caso is not None:
+                    entry["payload"] = asdict(caso)
+            lines.append(json.dumps(entry, default=str, ensure_ascii=False))
+
+        if not lines:
+            return
+
+        directory = os.path.dirname(self.path)
+        with self._lock:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _latest(self) -> Dict[Tuple[str, str], dict]:
+        latest: Dict[Tuple[str, str], dict] = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Última linha incompleta de uma execução interrompida
+                        continue
+                    latest[(entry["outbreakId"], entry["visualId"])] = entry
+        except OSError:
+            pass
+        return latest
+
+    def confirmed(self, outbreak_id: str) -> Set[str]:
+        """visualIds do surto já enviados (ou ignorados por não terem mudado)."""
+        return {
+            visual_id
+            for (entry_outbreak, visual_id), entry in self._latest().items()
+            if entry_outbreak == outbreak_id and entry["status"] in ("success", "skipped")
+        }
+
+    def failed_cases(self) -> Dict[str, List[GodataCase]]:
+        """Casos cujo último resultado foi erro, agrupados por surto."""
+        failed: Dict[str, List[GodataCase]] = {}
+        for (outbreak_id, _), entry in self._latest().items():
+            if entry["status"] == "error" and entry.get("payload"):
+                failed.setdefault(outbreak_id, []).append(GodataCase(**entry["payload"]))
+        return failed
+
+
+class JournaledOutputPort(CasesOutputPort):
+    """
+    Decorador de CasesOutputPort que registra no RunJournal o resultado de
+    cada caso. O bloco inteiro é repassado à saída; quando ela aceita
+    `add_result_listener` (CaseUploader e AdaptiveCaseUploader), os
+    resultados são gravados no diário à medida que os envios terminam, a
+    cada `checkpoint_size` resultados, sem esperar o fim do bloco.
+
+    Com `resume`, casos já confirmados no diário não são reenviados e voltam
+    com status "resumed", distinto do "skipped" de casos sem alteração.
+    """
+    def __init__(
+            self,
+            output_port: CasesOutputPort,
+            journal: RunJournal,
+            resume: bool = False,
+            checkpoint_size: int = 200,
+        ):
+        self.output_port = output_port
+        self.journal = journal
+        self.resume = resume
+        self.checkpoint_size = checkpoint_size
+        self._confirmed: Dict[str, Set[str]] = {}
+        self._pending: List[dict] = []
+        self._cases: Dict[str, GodataCase] = {}
+        self._lock = threading.Lock()
+        self._listening = hasattr(output_port, "add_result_listener")
+        if self._listening:
+            output_port.add_result_listener(self._on_results)
+        if not resume:
+            journal.reset()
+
+    def _on_results(self, outbreak_id: str, results: List[dict]) -> None:
+        with self._lock:
+            self._pending.extend(results)
+            if len(self._pending) >= self.checkpoint_size:
+                self._flush(outbreak_id)
+
+    def _flush(self, outbreak_id: str) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self.journal.record(outbreak_id, pending, self._cases)
+
+    def send_cases(self, cases: List[GodataCase], outbreak_id: str) -> List[dict]:
+        results = []
+        if self.resume:
+            if outbreak_id not in self._confirmed:
+                self._confirmed[outbreak_id] = self.journal.confirmed(outbreak_id)
+                logger.info("Retomando importação: %s casos já confirmados", len(self._confirmed[outbreak_id]))
+            confirmed = self._confirmed[outbreak_id]
+            results = [{"NU_NOTIFIC": caso.visualId, "status": "resumed"} for caso in cases if caso.visualId in confirmed]
+            cases = [caso for caso in cases if caso.visualId not in confirmed]
+            if results:
+                metrics.inc("cases_uploaded_total", len(results), status="resumed")
+
+        self._cases = {caso.visualId: caso for caso in cases}
+        try:
+            sent = self.output_port.send_cases(cases, outbreak_id) or []
+            if not self._listening:
+                self._on_results(outbreak_id, sent)
+        finally:
+            # Inclusive quando o envio é interrompido, o que já terminou fica no diário
+            with self._lock:
+                self._flush(outbreak_id)
+        results.extend(sent)
+        return results
+
+    def replay_failed(self) -> List[dict]:
+        """Reenvia apenas os casos que falharam na execução registrada no diário."""
+        results = []
+        for outbreak_id, cases in self.journal.failed_cases().items():
+            logger.info("Reenviando %s casos com erro do surto %s", len(cases), outbreak_id)
+            results.extend(self.send_cases(cases, outbreak_id))
+        return results
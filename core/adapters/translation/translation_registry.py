@@ -1,37 +1,97 @@
-from typing import Callable, Dict, Any
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Any, Iterable, List, Optional
+
+
+class Translator:
+    """
+    Tradutor já resolvido no registry.
+    Pode ser guardado por quem traduz muitos valores, evitando
+    buscar o nome no registry a cada chamada.
+    """
+    def __init__(
+        self,
+        name: str,
+        fn: Optional[Callable[[Any], Any]] = None,
+        mapping: Optional[Dict[Any, Any]] = None,
+        batched: bool = False,
+    ):
+        self.name = name
+        self.fn = fn
+        self.mapping = mapping
+        self.batched = batched
+
+    def __call__(self, value: Any) -> Any:
+        if self.fn is None:
+            return value
+        if self.batched:
+            return list(self.fn(pd.Series([value], dtype=object)))[0]
+        return self.fn(value)
+
+    def many(self, values: Iterable[Any]) -> List[Any]:
+        """Traduz uma coluna inteira de valores."""
+        if self.fn is None:
+            return list(values)
+
+        if self.mapping is not None:
+            # Busca vetorizada no dict; valores sem tradução são mantidos
+            series = pd.Series(list(values), dtype=object)
+            translated = series.map(self.mapping).to_numpy(dtype=object)
+            # np.where mantém None; Series.where o trocaria por NaN
+            return np.where(series.isin(list(self.mapping.keys())), translated, series.to_numpy(dtype=object)).tolist()
+
+        if self.batched:
+            return list(self.fn(pd.Series(list(values), dtype=object)))
+
+        return [self.fn(value) for value in values]
 
 
 class TranslationRegistry:
     def __init__(self):
-        # Ex: {"gender": translator_fn}
-        self._registry: Dict[str, Callable[[Any], Any]] = {}
+        # Ex: {"gender": Translator(...)}
+        self._registry: Dict[str, Translator] = {}
 
-    
-    def register(self, name: str, mapping: Callable[[Any], Any]):
+
+    def register(self, name: str, mapping: Callable[[Any], Any], batched: bool = False):
         """
         Registra um tradutor no registry.
 
         Tradutores podem ser:
         - um map/dict simples
         - um callable
+        - um callable que recebe e devolve uma coluna inteira (batched=True)
         """
         if isinstance(mapping, dict):
-            mapping = self._wrap_dict_translator(mapping)
+            self._registry[name] = Translator(
+                name, fn=self._wrap_dict_translator(mapping), mapping=mapping
+            )
+            return
 
         if not callable(mapping):
             raise ValueError(f"Translator for '{name}' is not callable or dict.")
 
-        self._registry[name] = mapping
+        self._registry[name] = Translator(name, fn=mapping, batched=batched)
+
+    def get(self, name: str) -> Translator:
+        """
+        Retorna o tradutor registrado.
+        Se não existir, retorna um tradutor que devolve o valor original.
+        """
+        return self._registry.get(name) or Translator(name)
 
     def translate(self, name: str, value: Any) -> Any:
         """
         Aplica o tradutor adequado.
         Se não existir, retorna o valor original.
         """
-        mapping = self._registry.get(name)
-        if mapping is None:
-            return value
-        return mapping(value)
+        return self.get(name)(value)
+
+    def translate_many(self, name: str, values: Iterable[Any]) -> List[Any]:
+        """
+        Aplica o tradutor adequado a vários valores de uma vez.
+        Se não existir, retorna os valores originais.
+        """
+        return self.get(name).many(values)
 
     @staticmethod
     def _wrap_dict_translator(mapper: Dict[Any, Any]):
@@ -1,19 +1,104 @@
 import pandas as pd
-from typing import Optional
+from typing import Any, Iterable, Iterator, List, Optional
+from openpyxl import load_workbook
 from core.logger import logger
 from core.domain.ports import DataframeReader
 
 class XlsxReader(DataframeReader):
-    def __init__(self,file_path: str, n_rows: Optional[int] = None):
+    def __init__(self,file_path: str, n_rows: Optional[int] = None, chunk_size: Optional[int] = None):
         self.file_path = file_path
         self.n_rows = n_rows
+        self.chunk_size = chunk_size
 
-    def read_dataframe(self) -> pd.DataFrame:
+    def cache_key(self) -> dict:
+        return {"n_rows": self.n_rows}
+
+    def read_dataframe(self, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        usecols = set(columns) if columns is not None else None
         try:
-            df = pd.read_excel(self.file_path, nrows=self.n_rows,dtype=str)
+            df = pd.read_excel(
+                self.file_path,
+                nrows=self.n_rows,
+                dtype=str,
+                usecols=(lambda name: name in usecols) if usecols is not None else None,
+            )
             logger.info("XLSX lido com sucesso: %s linhas", len(df))
         except Exception as e:
             logger.error("Erro ao ler o XLSX: %s", e)
             raise
 
-        return df
\ No newline at end of file
+        return df
+
+    def read_chunks(self, columns: Optional[Iterable[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Lê o XLSX em blocos de `chunk_size` linhas usando o modo read-only do openpyxl,
+        mantendo em memória apenas o bloco corrente.
+        Sem `chunk_size`, lê a planilha inteira de uma vez.
+        """
+        if not self.chunk_size:
+            yield self.read_dataframe(columns)
+            return
+
+        try:
+            workbook = load_workbook(self.file_path, read_only=True, data_only=True)
+        except Exception as e:
+            logger.error("Erro ao ler o XLSX: %s", e)
+            raise
+
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+
+            header_names = [
+                str(name) if name is not None else f"Unnamed: {i}"
+                for i, name in enumerate(header)
+            ]
+            wanted = set(columns) if columns is not None else None
+            # Posições das colunas projetadas na planilha
+            positions = [
+                i for i, name in enumerate(header_names)
+                if wanted is None or name in wanted
+            ]
+            selected = [header_names[i] for i in positions]
+            n_cols = len(header_names)
+            start = 0
+            buffer: List[List[Optional[str]]] = []
+
+            for values in rows:
+                if self.n_rows is not None and start + len(buffer) >= self.n_rows:
+                    break
+                # Linhas totalmente vazias (comuns no fim de planilhas exportadas) são ignoradas
+                if all(value is None for value in values):
+                    continue
+
+                values = tuple(values[:n_cols]) + (None,) * (n_cols - len(values))
+                buffer.append([self._to_str(values[i]) for i in positions])
+
+                if len(buffer) >= self.chunk_size:
+                    yield self._build_chunk(buffer, selected, start)
+                    start += len(buffer)
+                    buffer = []
+
+            if buffer:
+                yield self._build_chunk(buffer, selected, start)
+                start += len(buffer)
+
+            logger.info("XLSX lido com sucesso: %s linhas", start)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _to_str(value: Any) -> Optional[str]:
+        """Converte o valor da célula para string, como o `dtype=str` do pandas."""
+        if value is None:
+            return None
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+
+    @staticmethod
+    def _build_chunk(buffer: List[List[Optional[str]]], columns: List[str], start: int) -> pd.DataFrame:
+        index = pd.RangeIndex(start, start + len(buffer))
+        return pd.DataFrame(buffer, columns=columns, index=index, dtype=object)
@@ -1 +1,3 @@
-from .preprocessor import Preprocessor
\ No newline at end of file
+from .preprocessor import Preprocessor
+from .pipeline import Pipeline
+from .process_pool_mapper import ProcessPoolMapper, wait_result
@@ -0,0 +1,126 @@
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, List, Sequence, Tuple
+
+from core.logger import logger
+
+# Marca o fim do fluxo em cada fila
+_END = object()
+
+Stage = Tuple[str, Callable[[Any], Any]]
+
+
+class Pipeline:
+    """
+    Executa uma sequência de etapas (nome, função) sobre os itens de uma fonte.
+
+    No modo encadeado (`threaded`), a fonte e cada etapa rodam em sua própria
+    thread, ligadas por filas de até `queue_size` itens: uma etapa lenta faz
+    as anteriores esperarem, e a memória fica limitada a poucos itens em
+    trânsito. A ordem dos itens é preservada. Um erro em qualquer etapa
+    interrompe as demais e é relançado para quem consome `run`.
+
+    Sem `threaded`, as etapas são aplicadas item a item na thread atual.
+    """
+    # Intervalo para verificar se o pipeline foi interrompido enquanto espera uma fila
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, stages: Sequence[Stage], queue_size: int = 2, threaded: bool = True):
+        self.stages = list(stages)
+        self.queue_size = queue_size
+        self.threaded = threaded
+
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        if not self.threaded:
+            return self._run_sequential(source)
+        return self._run_threaded(source)
+
+    def _run_sequential(self, source: Iterable[Any]) -> Iterator[Any]:
+        for item in source:
+            for _, fn in self.stages:
+                item = fn(item)
+            yield item
+
+    def _run_threaded(self, source: Iterable[Any]) -> Iterator[Any]:
+        stop = threading.Event()
+        errors: List[BaseException] = []
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+
+        threads = [threading.Thread(
+            target=self._feed, args=(source, queues[0], stop, errors), name="pipeline-leitura", daemon=True
+        )]
+        for i, (name, fn) in enumerate(self.stages):
+            threads.append(threading.Thread(
+                target=self._work,
+                args=(name, fn, queues[i], queues[i + 1], stop, errors),
+                name=f"pipeline-{name}",
+                daemon=True,
+            ))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = self._get(queues[-1], stop)
+                if item is _END:
+                    break
+                yield item
+        finally:
+            # Consumidor encerrado antes do fim (erro ou abandono): libera as etapas
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+
+    def _feed(self, source: Iterable[Any], output: queue.Queue, stop: threading.Event, errors: List[BaseException]) -> None:
+        try:
+            for item in source:
+                if not self._put(output, item, stop):
+                    return
+        except BaseException as e:
+            logger.error("Erro na leitura da entrada: %s", e)
+            errors.append(e)
+            stop.set()
+        self._put(output, _END, stop)
+
+    def _work(
+            self,
+            name: str,
+            fn: Callable[[Any], Any],
+            input_: queue.Queue,
+            output: queue.Queue,
+            stop: threading.Event,
+            errors: List[BaseException],
+        ) -> None:
+        try:
+            while True:
+                item = self._get(input_, stop)
+                if item is _END:
+                    break
+                if not self._put(output, fn(item), stop):
+                    return
+        except BaseException as e:
+            logger.error("Erro na etapa %s: %s", name, e)
+            errors.append(e)
+            stop.set()
+        self._put(output, _END, stop)
+
+    def _get(self, input_: queue.Queue, stop: threading.Event) -> Any:
+        while True:
+            try:
+                return input_.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                if stop.is_set():
+                    return _END
+
+    def _put(self, output: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        """Coloca o item na fila; retorna False se o pipeline foi interrompido antes disso."""
+        while True:
+            try:
+                output.put(item, timeout=self.POLL_INTERVAL)
+                return True
+            except queue.Full:
+                if stop.is_set():
+                    return False
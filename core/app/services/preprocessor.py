@@ -1,4 +1,5 @@
 import pandas as pd
+from typing import Iterable
 from datetime import datetime, timezone
 from core.logger import logger
 
@@ -7,11 +8,16 @@ class Preprocessor:
     Classe responsável pelo pré-processamento de DataFrames,
     incluindo normalização de valores ausentes e anonimização de dados sensíveis.
     """
-    def run(self, df: pd.DataFrame, anonymize_data: bool) -> pd.DataFrame:
+    def run(self, df: pd.DataFrame, anonymize_data: bool, categorical_columns: Iterable[str] = ()) -> pd.DataFrame:
             # 1. Normalizar valores ausentes
             
             df = df.fillna("")
 
+            # Colunas de códigos com poucos valores distintos ocupam menos memória como categóricas
+            for col in categorical_columns:
+                if col in df.columns:
+                    df[col] = df[col].astype("category")
+
             # 2. Anonimização (se solicitada)
             if anonymize_data:
                 logger.info("Anonimizando dados sensíveis")
@@ -0,0 +1,67 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+
+# Etapas recebidas pelo processo na inicialização, reaproveitadas em todas as tarefas
+_worker_stages: Sequence[Callable[[Any], Any]] = ()
+
+
+def _init_worker(stages: Sequence[Callable[[Any], Any]]) -> None:
+    global _worker_stages
+    _worker_stages = stages
+
+
+def _run_worker_stages(item: Any) -> Any:
+    for fn in _worker_stages:
+        item = fn(item)
+    return item
+
+
+def wait_result(future: Future) -> Any:
+    return future.result()
+
+
+class ProcessPoolMapper:
+    """
+    Aplica uma sequência de etapas a cada item em um pool de processos.
+
+    As etapas (e tudo o que referenciam: módulo do agravo, índices de
+    localização, tabelas IBGE) são serializadas uma única vez por processo,
+    na inicialização, e não a cada bloco. Os resultados saem na ordem de
+    entrada, e no máximo `max_pending` blocos ficam em processamento, para
+    que a leitura não se adiante ao mapeamento.
+
+    Os processos são iniciados com "spawn": não herdam threads, locks nem
+    conexões abertas do processo principal (sessões HTTP, SQLite).
+
+    `collect` obtém o resultado de cada tarefa (por padrão, `wait_result`);
+    pode ser envolvido para medir apenas a espera pelos blocos mapeados,
+    sem o tempo de leitura da entrada.
+    """
+    def __init__(
+            self,
+            stages: Sequence[Callable[[Any], Any]],
+            workers: int,
+            max_pending: Optional[int] = None,
+            collect: Callable[[Future], Any] = wait_result,
+        ):
+        self.stages = list(stages)
+        self.workers = workers
+        self.max_pending = max_pending or workers * 2
+        self.collect = collect
+
+    def map(self, source: Iterable[Any]) -> Iterator[Any]:
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.stages,),
+        ) as executor:
+            pending = deque()
+            for item in source:
+                pending.append(executor.submit(_run_worker_stages, item))
+                if len(pending) >= self.max_pending:
+                    yield self.collect(pending.popleft())
+            while pending:
+                yield self.collect(pending.popleft())
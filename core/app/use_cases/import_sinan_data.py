@@ -1,3 +1,7 @@
+import time
+from collections import Counter
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
 from core.domain.ports import (
     CasesOutputPort, DataframeReader
 )
@@ -6,14 +10,19 @@ from core.domain.services import (
     DiseaseMapperService,
     SinanMapperService
 )
-from core.app.services import Preprocessor
+from core.domain.diseases.disease_registry import disease_registry
+from core.app.services import Pipeline, Preprocessor, ProcessPoolMapper, wait_result
+from core.domain.models import GodataCase
 
 from core.adapters import(
     GodataLocationTranslator,
     IBGELocationIdTranslator,
-    GodataOutbreakTranslator
+    GodataOutbreakTranslator,
+    LocationResolutionCache
 )
 from core.logger import logger
+from core.metrics import metrics
+from core.profiling import StageProfiler
 
 
 
@@ -25,7 +34,12 @@ class ImportSinanDataUseCase:
             godata_outbreak_translator: GodataOutbreakTranslator,
             godata_location_translator: GodataLocationTranslator, 
             ibge_location_translator: IBGELocationIdTranslator,
-            output_port: CasesOutputPort
+            output_port: CasesOutputPort,
+            location_cache: Optional[LocationResolutionCache] = None,
+            pipelined: bool = False,
+            queue_size: int = 2,
+            workers: int = 1,
+            profiler: Optional[StageProfiler] = None,
         ):
         
         self.disease_module_name = disease_module_name
@@ -37,35 +51,171 @@ class ImportSinanDataUseCase:
             ibge_location_translator=ibge_location_translator
         )
         self.godata_outbreak_translator = godata_outbreak_translator
+        self.godata_location_translator = godata_location_translator
 
         self.godata_mapper = GodataMapperService(
             godata_location_translator=godata_location_translator,
             ibge_location_translator=ibge_location_translator,
+            location_cache=location_cache,
         ) 
+        self.location_cache = location_cache
         self.output_port = output_port
+        # Com pipelined, leitura, pré-processamento, mapeamento e envio rodam em
+        # paralelo, com até queue_size blocos aguardando entre uma etapa e a seguinte
+        self.pipelined = pipelined
+        self.queue_size = queue_size
+        # Com workers > 1, pré-processamento e mapeamento dos blocos rodam em um pool de processos
+        self.workers = workers
+        # Com profiler, cada etapa é perfilada (CPU e, opcionalmente, memória) no processo principal
+        self.profiler = profiler
 
-    def execute(self, godata_outbreak_name, anonymize=False):
-        df = self.input_port.read_dataframe()
+        # Apenas as colunas usadas pelos mapeadores são lidas da entrada
+        disease_module = disease_registry.get(disease_module_name)
+        self.columns = sorted(
+            set(SinanMapperService.REQUIRED_COLUMNS) | set(disease_module.required_columns)
+        )
+        self.categorical_columns = sorted(
+            set(SinanMapperService.CATEGORICAL_COLUMNS) | set(disease_module.categorical_columns)
+        )
 
+    def execute(self, godata_outbreak_name, anonymize=False) -> int:
+        """
+        Importa a entrada bloco a bloco e retorna o total de casos processados.
+        Os casos mapeados não são mais acumulados nem retornados, para manter
+        o uso de memória limitado ao tamanho dos blocos.
+        """
+        started = time.perf_counter()
+        outbreak_id = self.godata_outbreak_translator.translate(godata_outbreak_name)
+        preprocessor = Preprocessor()
+        total_cases = 0
+        # Resultados por status ("success", "error", "skipped", "resumed"), quando a saída os informa
+        statuses = Counter()
+
+        # A entrada é consumida em blocos para manter o uso de memória limitado
+        chunks = self.input_port.read_chunks(columns=self.columns)
+        if self.profiler is not None:
+            chunks = self.profiler.wrap_source("leitura", chunks)
+        chunks = self._log_progress(chunks)
         # Preprocessamento está na Application Layer (não no domínio)
-        df = Preprocessor().run(df, anonymize)
+        preprocess = partial(preprocessor.run, anonymize_data=anonymize, categorical_columns=self.categorical_columns)
+        map_chunk = CaseChunkMapper(
+            self.sinan_mapper, self.disease_mapper, self.godata_mapper, self.disease_module_name, outbreak_id
+        )
+        upload = lambda cases: (len(cases), self.output_port.send_cases(cases, outbreak_id))
 
-        outbreak_id = self.godata_outbreak_translator.translate(godata_outbreak_name)
+        if self.workers > 1:
+            # Nos processos de mapeamento, o tempo medido é só a espera pelos blocos já
+            # mapeados; a leitura da entrada, feita ao submeter os blocos, fica de fora
+            map_chunk.return_updates = True
+            collect = wait_result
+            if self.profiler is not None:
+                collect = self.profiler.wrap("mapeamento", collect)
+            collect = metrics.timed("stage_duration_seconds", collect, stage="mapeamento")
+            chunks = ProcessPoolMapper([preprocess, map_chunk], workers=self.workers, collect=collect).map(chunks)
+            chunks = map(self._merge_updates, chunks)
+            stages = [("envio", upload)]
+        else:
+            stages = [("preprocessamento", preprocess), ("mapeamento", map_chunk), ("envio", upload)]
+        if self.profiler is not None:
+            stages = [(name, self.profiler.wrap(name, fn)) for name, fn in stages]
+        stages = [(name, metrics.timed("stage_duration_seconds", fn, stage=name)) for name, fn in stages]
+
+        pipeline = Pipeline(stages=stages, queue_size=self.queue_size, threaded=self.pipelined)
+        for sent, results in pipeline.run(chunks):
+            statuses.update(result["status"] for result in results or [])
+            total_cases += sent
 
-        cases = []
-
-        for index, row in df.iterrows():
-            logger.info("Processando Dados (%s/%s)", index + 1, len(df))
-            sinan_case = self.sinan_mapper.map(row)
-            questionnaire_answers = self.disease_mapper.map(row)
-            godata_case = self.godata_mapper.map(
-                sinan_case = sinan_case, 
-                questionnaire_answers = questionnaire_answers,
-                disease_name = self.disease_module_name,
-                outbreak_id = outbreak_id
+        self.godata_location_translator.report_unresolved()
+        if self.location_cache is not None:
+            self.location_cache.save()
+        elapsed = time.perf_counter() - started
+        metrics.set_gauge("run_duration_seconds", elapsed)
+        metrics.set_gauge("run_cases_total", total_cases)
+        metrics.set_gauge("run_throughput_cases_per_second", total_cases / elapsed if elapsed else 0)
+        logger.info("Importação concluída: %s casos processados", total_cases)
+        if statuses:
+            logger.info(
+                "Casos enviados: %s, sem alterações: %s, já confirmados no diário: %s, com erro: %s",
+                statuses["success"], statuses["skipped"], statuses["resumed"], statuses["error"],
+            )
+        return total_cases
+
+    def _merge_updates(self, mapped: "MappedChunk") -> List[GodataCase]:
+        """Traz para o processo principal o que o mapeamento aprendeu em outro processo."""
+        self.godata_mapper.merge_resolutions(mapped.resolutions)
+        self.godata_location_translator.merge_unresolved(mapped.unresolved)
+        metrics.merge(mapped.metrics)
+        return mapped.cases
+
+    @staticmethod
+    def _log_progress(chunks: Iterable) -> Iterator:
+        read_rows = 0
+        for df in ImportSinanDataUseCase._timed_source(chunks, "leitura"):
+            logger.info("Processando Dados (linhas %s a %s)", read_rows + 1, read_rows + len(df))
+            read_rows += len(df)
+            metrics.inc("rows_read_total", len(df))
+            yield df
+
+    @staticmethod
+    def _timed_source(source: Iterable, stage: str) -> Iterator:
+        """Registra como duração da etapa o tempo de obter cada item de `source`."""
+        iterator = iter(source)
+        while True:
+            with metrics.timer("stage_duration_seconds", stage=stage):
+                item = next(iterator, None)
+            if item is None:
+                return
+            yield item
+
+
+class MappedChunk(NamedTuple):
+    """Bloco mapeado em outro processo, com as resoluções de localização e as métricas registradas nele."""
+    cases: List[GodataCase]
+    resolutions: Dict[str, Optional[str]]
+    unresolved: Set[Tuple[Optional[str], str]]
+    metrics: Dict[str, Any]
+
+
+class CaseChunkMapper:
+    """
+    Etapa de mapeamento: converte um bloco pré-processado em GodataCase.
+    É serializável, para poder ser enviada aos processos de mapeamento;
+    lá, com `return_updates`, devolve um MappedChunk.
+    """
+    def __init__(
+            self,
+            sinan_mapper: SinanMapperService,
+            disease_mapper: DiseaseMapperService,
+            godata_mapper: GodataMapperService,
+            disease_name: str,
+            outbreak_id: str,
+        ):
+        self.sinan_mapper = sinan_mapper
+        self.disease_mapper = disease_mapper
+        self.godata_mapper = godata_mapper
+        self.disease_name = disease_name
+        self.outbreak_id = outbreak_id
+        self.return_updates = False
+
+    def __call__(self, df) -> Union[List[GodataCase], MappedChunk]:
+        # Os mapeadores convertem o bloco inteiro coluna a coluna
+        with metrics.timer("mapper_duration_seconds", mapper="sinan"):
+            sinan_cases = self.sinan_mapper.map_batch(df)
+        with metrics.timer("mapper_duration_seconds", mapper="disease"):
+            answers = self.disease_mapper.map_batch(df)
+        with metrics.timer("mapper_duration_seconds", mapper="godata"):
+            cases = self.godata_mapper.map_batch(
+                sinan_cases = sinan_cases,
+                questionnaire_answers = answers,
+                disease_name = self.disease_name,
+                outbreak_id = self.outbreak_id
             )
-           
-            cases.append(godata_case)
         logger.info("Casos mapeados, enviando...")
-        self.output_port.send_cases(cases, outbreak_id)
-        return cases
\ No newline at end of file
+        if self.return_updates:
+            return MappedChunk(
+                cases,
+                self.godata_mapper.drain_resolutions(),
+                self.godata_mapper.godata_location_translator.unresolved,
+                metrics.drain(),
+            )
+        return cases
@@ -1,7 +1,7 @@
 import importlib
 import pkgutil
 from dataclasses import is_dataclass
-from typing import Dict, Type, Any
+from typing import Dict, Type, Any, Iterable, List, Optional
 from core.adapters.translation.translation_registry import translation_registry
 
 class DiseaseModuleSpec:
@@ -15,16 +15,23 @@ class DiseaseModuleSpec:
         questionnaire_map: Dict[str, str],
         case_classification_map: Dict[str, Any],
         outcome_map: Dict[str, Any],
+        categorical_columns: Optional[Iterable[str]] = None,
     ):
         self.name = name
         self.questionnaire_cls = questionnaire_cls
         self.questionnaire_map = questionnaire_map
+        self.categorical_columns: List[str] = list(categorical_columns or [])
 
         ## Registrando tradutores globais para outcome e case_classification
         translation_registry.register(
             f"{name}_case_classification", case_classification_map
         )
         translation_registry.register(f"{name}_outcome", outcome_map)
+
+    @property
+    def required_columns(self) -> List[str]:
+        """Colunas do SINAN usadas pelo questionário do agravo."""
+        return sorted(set(self.questionnaire_map.values()))
         
 
 
@@ -37,6 +44,8 @@ class DiseaseRegistry:
       - QUESTIONNAIRE_MAP
       - CASE_CLASSIFICATION_MAP
       - OUTCOME_MAP
+    e pode conter:
+      - CATEGORICAL_COLUMNS
     """
 
     def __init__(self, module_package: str = "core.domain.diseases.modules"):
@@ -81,6 +90,7 @@ class DiseaseRegistry:
                 questionnaire_map=questionnaire_map,
                 case_classification_map=case_classification_map,
                 outcome_map=outcome_map,
+                categorical_columns=getattr(mod, "CATEGORICAL_COLUMNS", None),
             )
 
     # ----------------------------------------------------------------------
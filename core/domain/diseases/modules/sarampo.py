@@ -38,6 +38,13 @@ QUESTIONNAIRE_MAP = {
     "municipio_de_notificacao": "ID_MUNICIP"    
 }
 
+# Colunas de códigos (resultados de exames, fonte, vacina) armazenadas como categóricas
+CATEGORICAL_COLUMNS = [
+    "ID_S1_IGG", "ID_S1_IGM_", "ID_S1_IGG_",
+    "ID_S2_IGG", "ID_S2_IGM", "ID_S2_IGG_", "ID_S2_IGM_",
+    "CS_FONTE", "CS_VACINA",
+]
+
 # Registro dos tipos de dados de cada variavel do questionário
 @dataclass
 class QuestionnaireAnswers:    
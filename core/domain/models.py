@@ -66,7 +66,7 @@ class GodataCase:
     #classificationHistory: Optional[List[Any]] = None
     dateRanges: Optional[List[Any]] = field(default_factory=list)
     dob: Optional[str] = None
-    duplicateKeys: Optional[DuplicateKeys] = DuplicateKeys(document=[], name=[])
+    duplicateKeys: Optional[DuplicateKeys] = field(default_factory=lambda: DuplicateKeys(document=[], name=[]))
     hasRelationships: Optional[bool] = False
     numberOfContacts: Optional[int] = 0
     numberOfExposures: Optional[int] = 0
@@ -1,12 +1,38 @@
 
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 class DataframeReader(ABC):
     @abstractmethod
-    def read_dataframe(self):
+    def read_dataframe(self, columns: Optional[Iterable[str]] = None):
+        """
+        Lê a entrada inteira.
+        Quando `columns` é informado, apenas essas colunas são carregadas;
+        colunas ausentes no arquivo são ignoradas.
+        """
+        ...
+
+    def read_chunks(self, columns: Optional[Iterable[str]] = None) -> Iterator:
+        """
+        Lê a entrada em blocos de linhas.
+        Por padrão entrega todo o DataFrame em um único bloco.
+        """
+        yield self.read_dataframe(columns)
+
+    @abstractmethod
+    def cache_key(self) -> Dict[str, Any]:
+        """
+        Opções do leitor que alteram o conteúdo lido (não o caminho nem o
+        tamanho dos blocos), usadas na chave do CachedReader.
+        """
         ...
 
 class CasesOutputPort(ABC):
     @abstractmethod
-    def send_cases(self, cases):
-        ...
\ No newline at end of file
+    def send_cases(self, cases, outbreak_id):
+        """
+        Envia um bloco de casos do surto `outbreak_id`.
+        É chamado uma vez por bloco da entrada; pode retornar a lista de
+        resultados por caso (dicionários com `status`) ou None.
+        """
+        ...
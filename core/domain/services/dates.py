@@ -0,0 +1,56 @@
+import pandas as pd
+from datetime import datetime
+from typing import Any, Callable, List, Optional
+
+# Formato das datas lidas como texto do XLSX do SINAN
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Formatos aceitos, em ordem de tentativa: o do XLSX e os comuns nas exportações em CSV
+DATE_FORMATS = (
+    DATE_FORMAT,
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%Y%m%d",
+)
+
+
+def parse_date(value: Any) -> Optional[datetime]:
+    """Converte uma data do SINAN; valores vazios ou inválidos viram None."""
+    if isinstance(value, datetime):
+        return value
+    if not value or not isinstance(value, str):
+        return None
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_dates(
+        values: pd.Series,
+        existing: Callable[[datetime], Any] = lambda value: value,
+    ) -> List[Any]:
+    """
+    Versão vetorizada de `parse_date` para uma coluna inteira.
+    Valores que já são datas (ex.: DBF ou dados anonimizados) passam por `existing`.
+    """
+    is_datetime = values.map(lambda value: isinstance(value, datetime)).to_numpy(dtype=bool)
+    pending = values.where(~is_datetime & (values != "").to_numpy(dtype=bool), None)
+    parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+
+    for date_format in DATE_FORMATS:
+        attempt = pd.to_datetime(pending, format=date_format, errors="coerce")
+        parsed = parsed.fillna(attempt)
+        # Os formatos seguintes só são tentados nos valores ainda não reconhecidos
+        pending = pending.where(attempt.isna(), None)
+        if not pending.notna().any():
+            break
+
+    dates = [None if pd.isna(value) else value.to_pydatetime() for value in parsed]
+    if is_datetime.any():
+        for i in is_datetime.nonzero()[0]:
+            dates[i] = existing(values.iat[i])
+    return dates
@@ -1,47 +1,120 @@
 import pandas as pd
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping, NamedTuple, Optional
 from dataclasses import fields
 
 from core.domain.models import IBGEId
+from core.domain.services.dates import parse_date, parse_dates
 from core.domain.diseases.disease_registry import disease_registry
 from core.adapters import IBGELocationIdTranslator
 from core.logger import logger
+
+# Conversores possíveis para um campo do questionário
+DATE_CONVERTER = "date"
+IBGE_CONVERTER = "ibge_municipio"
+PASSTHROUGH_CONVERTER = "passthrough"
+
+
+class FieldPlan(NamedTuple):
+    """Como um campo do questionário é preenchido a partir do SINAN."""
+    name: str
+    column: Optional[str]
+    converter: str
+    # Valor da coluna que indica resposta ausente
+    empty_value: Any = ""
+
+
 class DiseaseMapperService:
     def __init__(self, disease_name: str, ibge_location_translator: IBGELocationIdTranslator):
         try:
             disease_module = disease_registry.get(disease_name)
         except KeyError:
             raise ValueError(f"Disease '{disease_name}' is not registered.")
-        
-        self.questionnaire_cls = disease_module.questionnaire_cls           
+
+        self.questionnaire_cls = disease_module.questionnaire_cls
         self.questionnaire_map = disease_module.questionnaire_map
         self.ibge_location_translator = ibge_location_translator
+        self.plan = self._compile_plan()
 
-    def _resolve_date(self, date_str: Any) -> datetime:
-        try:
-            return [{"value": datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S").isoformat()}]
-        except Exception:
-            return  [{}]
-    
-    def map(self, row: pd.Series) -> Dict[str, Dict[str, Any]]:
-        answers = {}
+    def _compile_plan(self) -> List[FieldPlan]:
+        """Resolve uma única vez a coluna e o conversor de cada campo do questionário."""
+        plan = []
         for field_info in fields(self.questionnaire_cls):
-            column_name = self.questionnaire_map.get(field_info.name)
-            
-            if row.get(column_name, "") == "":
-                answers[field_info.name] = [{}]
+            if field_info.type == Optional[datetime]:
+                converter = DATE_CONVERTER
+            elif field_info.type == Optional[IBGEId]:
+                converter = IBGE_CONVERTER
+            else:
+                converter = PASSTHROUGH_CONVERTER
+
+            plan.append(FieldPlan(
+                name=field_info.name,
+                column=self.questionnaire_map.get(field_info.name),
+                converter=converter,
+            ))
+        return plan
+
+    @staticmethod
+    def _date_answer(value: Optional[datetime]) -> List[Dict[str, Any]]:
+        return [{"value": value.isoformat()}] if value is not None else [{}]
+
+    def _resolve_date(self, date_str: Any) -> List[Dict[str, Any]]:
+        return self._date_answer(parse_date(date_str))
+
+    def map(self, row: Mapping[str, Any]) -> Dict[str, Dict[str, Any]]:
+        answers = {}
+        for field in self.plan:
+            value = row.get(field.column, field.empty_value)
+
+            if value == field.empty_value:
+                answers[field.name] = [{}]
                 continue
-            
-            if str(field_info.type) == "typing.Optional[datetime.datetime]":
-                answers[field_info.name] = self._resolve_date(row.get(column_name))
 
-            elif str(field_info.type) == "typing.Optional[core.domain.models.IBGEId]":
-                answers[field_info.name] = [{
-                    "value": self.ibge_location_translator.get_municipio(row.get(column_name))
+            if field.converter == DATE_CONVERTER:
+                answers[field.name] = self._resolve_date(value)
+
+            elif field.converter == IBGE_CONVERTER:
+                answers[field.name] = [{
+                    "value": self.ibge_location_translator.get_municipio(value)
                 }]
 
             else:
-                answers[field_info.name] = [{"value": row.get(column_name)}]
+                answers[field.name] = [{"value": value}]
+
+        return answers
+
+    def map_batch(self, df: pd.DataFrame) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Mapeia um bloco inteiro do DataFrame, aplicando o plano de campos
+        coluna a coluna. Equivalente a chamar `map` em cada linha.
+        """
+        answers = [{} for _ in range(len(df))]
+        for field in self.plan:
+            for row_answers, value in zip(answers, self._map_column(field, df)):
+                row_answers[field.name] = value
+        return answers
+
+    def _map_column(self, field: FieldPlan, df: pd.DataFrame) -> List[List[Dict[str, Any]]]:
+        if field.column not in df.columns:
+            return [[{}] for _ in range(len(df))]
+
+        values = df[field.column]
+        is_empty = (values == field.empty_value).to_numpy(dtype=bool)
+
+        if field.converter == DATE_CONVERTER:
+            converted = self._resolve_dates(values)
+        elif field.converter == IBGE_CONVERTER:
+            # Cada código distinto é resolvido uma única vez
+            municipios = {
+                code: self.ibge_location_translator.get_municipio(code)
+                for code in values.unique()
+            }
+            converted = [[{"value": municipios[code]}] for code in values.tolist()]
+        else:
+            converted = [[{"value": value}] for value in values.tolist()]
+
+        return [[{}] if empty else answer for empty, answer in zip(is_empty, converted)]
 
-        return answers
\ No newline at end of file
+    def _resolve_dates(self, values: pd.Series) -> List[List[Dict[str, Any]]]:
+        """Versão vetorizada de `_resolve_date` para uma coluna inteira."""
+        return [self._date_answer(value) for value in parse_dates(values)]
@@ -1,13 +1,15 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
 from core.adapters import (
     IBGELocationIdTranslator,
     GodataLocationTranslator,
-    GodataOutbreakTranslator
+    GodataOutbreakTranslator,
+    LocationResolutionCache
 ) 
 
-from core.adapters.translation.translation_registry import translation_registry
+from core.adapters.translation.translation_registry import translation_registry, Translator
+from core.metrics import metrics
 
 from core.domain.models import (
     GodataCase, 
@@ -20,12 +22,27 @@ class GodataMapperService:
     def __init__(   self,                
                     godata_location_translator: GodataLocationTranslator, 
                     ibge_location_translator: IBGELocationIdTranslator,
+                    location_cache: Optional[LocationResolutionCache] = None,
                 ):
 
         self.godata_location_translator = godata_location_translator
         self.ibge_location_translator = ibge_location_translator
+        # Tradutores de desfecho e classificação já resolvidos, por agravo
+        self._translators: Dict[str, Tuple[Translator, Translator]] = {}
+        # Código IBGE → id de localização do Go.Data, resolvido uma vez por execução
+        # (ou reaproveitado entre execuções, quando há uma tabela persistente)
+        self._residence_locations = location_cache if location_cache is not None else {}
+        # Resoluções feitas desde a última chamada de drain_resolutions, para
+        # serem devolvidas ao processo principal quando o mapeamento roda em outros processos
+        self._new_resolutions: Dict[str, Optional[str]] = {}
     
     
+    def __getstate__(self) -> dict:
+        # Os tradutores resolvidos podem conter funções locais; são resolvidos de novo após desserializar
+        state = self.__dict__.copy()
+        state["_translators"] = {}
+        return state
+
     def _get_full_address(self, logrado, numero, complemento) -> str:
         parts = [logrado, numero, complemento]
         return ", ".join(part for part in parts if part)
@@ -36,6 +53,37 @@ class GodataMapperService:
         else:
             return None
         
+    def _resolve_residence_location(self, codigo: str) -> Optional[str]:
+        if codigo not in self._residence_locations:
+            with metrics.timer("location_resolution_duration_seconds"):
+                self._residence_locations[codigo] = self.godata_location_translator.translate(
+                    *self.ibge_location_translator.get_location(codigo)
+                )
+            self._new_resolutions[codigo] = self._residence_locations[codigo]
+            resolved = self._residence_locations[codigo] is not None
+            metrics.inc("location_resolutions_total", result="resolved" if resolved else "unresolved")
+        return self._residence_locations[codigo]
+
+    def drain_resolutions(self) -> Dict[str, Optional[str]]:
+        """Retorna e esquece as resoluções de localização feitas desde a última chamada."""
+        resolutions, self._new_resolutions = self._new_resolutions, {}
+        return resolutions
+
+    def merge_resolutions(self, resolutions: Dict[str, Optional[str]]) -> None:
+        """Incorpora resoluções feitas em outro processo (e à tabela persistente, se houver)."""
+        for codigo, location_id in resolutions.items():
+            if codigo not in self._residence_locations:
+                self._residence_locations[codigo] = location_id
+
+    def _disease_translators(self, disease_name: str) -> Tuple[Translator, Translator]:
+        """Resolve uma única vez os tradutores de desfecho e classificação do agravo."""
+        if disease_name not in self._translators:
+            self._translators[disease_name] = (
+                translation_registry.get(f"{disease_name}_outcome"),
+                translation_registry.get(f"{disease_name}_case_classification"),
+            )
+        return self._translators[disease_name]
+
     def map(    
         self, 
         sinan_case: SinanCase, 
@@ -44,50 +92,71 @@ class GodataMapperService:
         outbreak_id: str       
     ) -> GodataCase:
         
-        return GodataCase (
+        return self.map_batch([sinan_case], [questionnaire_answers], disease_name, outbreak_id)[0]
+
+    def map_batch(
+        self,
+        sinan_cases: List[SinanCase],
+        questionnaire_answers: List[Dict[str, List[Dict[str, Any]]]],
+        disease_name: str,
+        outbreak_id: str
+    ) -> List[GodataCase]:
+        """
+        Mapeia um bloco de casos. As traduções de códigos são aplicadas
+        uma vez por coluna em vez de uma vez por caso.
+        """
+        outcome_translator, classification_translator = self._disease_translators(disease_name)
+
+        genders = translation_registry.translate_many("gender", [c.cs_sexo for c in sinan_cases])
+        pregnancy_statuses = translation_registry.translate_many(
+            "pregnancy_status", [c.cs_gestant for c in sinan_cases]
+        )
+        outcomes = outcome_translator.many([c.evolucao for c in sinan_cases])
+        classifications = classification_translator.many([c.classificacao_final for c in sinan_cases])
+
+        document_type = translation_registry.translate("document_type", "CNS")
+        address_type = translation_registry.translate("address_type", "Endereço Atual")
+        updated_at = self._datetime_serializer(datetime.now(timezone.utc))
+
+        cases = []
+        for sinan_case, answers, gender, pregnancy_status, outcome, classification in zip(
+            sinan_cases, questionnaire_answers, genders, pregnancy_statuses, outcomes, classifications
+        ):
+            location_id = self._resolve_residence_location(sinan_case.municipio_residencia)
+            cases.append(GodataCase (
                 visualId=f"{sinan_case.nu_notific}",
                 firstName=sinan_case.nm_pacient,
-                gender=translation_registry.translate("gender",sinan_case.cs_sexo),
+                gender=gender,
                 dob=self._datetime_serializer(sinan_case.dt_nasc),
-                pregnancyStatus=translation_registry.translate("pregnancy_status", sinan_case.cs_gestant),
+                pregnancyStatus=pregnancy_status,
                 documents=(                                 
                     [] if not sinan_case.id_cns_sus else [  
                         Document(                           
                             number= sinan_case.id_cns_sus, 
-                            type= translation_registry.translate("document_type", "CNS")                      
+                            type= document_type                      
                         )
                     ]
                 ),
                 addresses=[
                     Address(
-                        typeId= translation_registry.translate("address_type", "Endereço Atual"),
+                        typeId= address_type,
                         addressLine1=   self._get_full_address(
                                             sinan_case.nm_logrado, 
                                             sinan_case.nu_numero, 
                                             sinan_case.nm_complemento
                                         ),
-                        locationId=self.godata_location_translator.translate(
-                            *self.ibge_location_translator.get_location(sinan_case.municipio_residencia)
-                        ),
+                        locationId=location_id,
                         phoneNumber=sinan_case.nu_telefon,  
                         postalCode=sinan_case.nu_cep
                     )
                 ], 
-                usualPlaceOfResidenceLocationId=self.godata_location_translator.translate(
-                    *self.ibge_location_translator.get_location(sinan_case.municipio_residencia)
-                ),
+                usualPlaceOfResidenceLocationId=location_id,
                 outbreakId=outbreak_id,
-                outcomeId=translation_registry.translate(f"{disease_name}_outcome", sinan_case.evolucao),
-                classification=translation_registry.translate(f"{disease_name}_case_classification", sinan_case.classificacao_final),
+                outcomeId=outcome,
+                classification=classification,
                 dateOfReporting=self._datetime_serializer(sinan_case.dt_notific),
                 dateOfOnset=self._datetime_serializer(sinan_case.dt_sin_pri),
-                updatedAt=self._datetime_serializer(datetime.now(timezone.utc)),
-                questionnaireAnswers=questionnaire_answers
-            )
-    
-
-    
-
-
-
-
+                updatedAt=updated_at,
+                questionnaireAnswers=answers
+            ))
+        return cases
@@ -1,19 +1,42 @@
 import pandas as pd
 from datetime import datetime
-from typing import Any
+from typing import Any, List, Optional
 
 from core.domain.models import SinanCase
+from core.domain.services.dates import DATE_FORMAT, parse_date, parse_dates
 from core.logger import logger
 from core.adapters.translation.translation_registry import translation_registry
 
 class SinanMapperService:
+    # Colunas do SINAN lidas por `map`
+    REQUIRED_COLUMNS = (
+        "NU_NOTIFIC", "NM_PACIENT", "DT_NASC", "CS_SEXO", "CS_GESTANT",
+        "ID_CNS_SUS", "NU_TELEFON", "NU_CEP", "ID_MN_RESI", "EVOLUCAO",
+        "CLASS_FIN", "DT_NOTIFIC", "NM_BAIRRO", "NM_LOGRADO", "NU_NUMERO",
+        "NM_COMPLEM", "DT_SIN_PRI",
+    )
+    # Colunas de códigos com poucos valores distintos
+    CATEGORICAL_COLUMNS = ("CS_SEXO", "CS_GESTANT", "EVOLUCAO", "CLASS_FIN")
+    DATE_FORMAT = DATE_FORMAT
+
     def _resolve_date(self, date_str: Any) -> datetime:
         if isinstance(date_str, datetime):
             return date_str.date()
-        try:  
-            return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S") if date_str else None
-        except Exception:
-            return None
+        return parse_date(date_str)
+
+    def _resolve_dates(self, values: pd.Series) -> List[Optional[datetime]]:
+        """Versão vetorizada de `_resolve_date` para uma coluna inteira."""
+        return parse_dates(values, existing=self._resolve_date)
+
+    def _column(self, df: pd.DataFrame, name: str, default: Any = "") -> List[Any]:
+        if name in df.columns:
+            return df[name].tolist()
+        return [default] * len(df)
+
+    def _date_column(self, df: pd.DataFrame, name: str) -> List[Optional[datetime]]:
+        if name in df.columns:
+            return self._resolve_dates(df[name])
+        return [None] * len(df)
         
     def map(self, row: pd.Series) -> SinanCase:
         """mapeia uma linha do DataFrame para um objeto SinanCase."""
@@ -41,4 +64,56 @@ class SinanMapperService:
             
             dt_sin_pri = self._resolve_date(row.get("DT_SIN_PRI", "")),
         )
+
+    def map_batch(self, df: pd.DataFrame) -> List[SinanCase]:
+        """
+        Mapeia um bloco inteiro do DataFrame para objetos SinanCase.
+        Equivalente a aplicar `map` em cada linha, mas as colunas são
+        convertidas de uma vez (inclusive as datas).
+        """
+        columns = zip(
+            self._column(df, "NU_NOTIFIC"),
+            self._column(df, "NM_PACIENT", None),
+            self._date_column(df, "DT_NASC"),
+            self._column(df, "CS_SEXO"),
+            self._column(df, "CS_GESTANT"),
+            self._column(df, "ID_CNS_SUS"),
+            self._column(df, "NU_TELEFON"),
+            self._column(df, "NU_CEP"),
+            self._column(df, "ID_MN_RESI"),
+            self._column(df, "EVOLUCAO"),
+            self._column(df, "CLASS_FIN"),
+            self._date_column(df, "DT_NOTIFIC"),
+            self._column(df, "NM_BAIRRO"),
+            self._column(df, "NM_LOGRADO"),
+            self._column(df, "NU_NUMERO"),
+            self._column(df, "NM_COMPLEM"),
+            self._date_column(df, "DT_SIN_PRI"),
+        )
+        return [
+            SinanCase(
+                nu_notific=nu_notific,
+                nm_pacient=nm_pacient,
+                dt_nasc=dt_nasc,
+                cs_sexo=cs_sexo,
+                cs_gestant=cs_gestant,
+                id_cns_sus=id_cns_sus,
+                nu_telefon=nu_telefon,
+                nu_cep=nu_cep,
+                municipio_residencia=municipio_residencia,
+                evolucao=evolucao,
+                classificacao_final=classificacao_final,
+                dt_notific=dt_notific,
+                nm_bairro=nm_bairro,
+                nm_logrado=nm_logrado,
+                nu_numero=nu_numero,
+                nm_complemento=nm_complemento,
+                dt_sin_pri=dt_sin_pri,
+            )
+            for (
+                nu_notific, nm_pacient, dt_nasc, cs_sexo, cs_gestant, id_cns_sus,
+                nu_telefon, nu_cep, municipio_residencia, evolucao, classificacao_final,
+                dt_notific, nm_bairro, nm_logrado, nu_numero, nm_complemento, dt_sin_pri,
+            ) in columns
+        ]
     
@@ -1,2 +1,5 @@
 from .auth import GodataAuth
-from .client import GodataApiClient
\ No newline at end of file
+from .client import GodataApiClient
+from .rate_limiter import TokenBucketRateLimiter
+from .retry_policy import RetryPolicy
+from .transport import HttpTransport
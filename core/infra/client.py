@@ -1,60 +1,184 @@
 from core.logger import logger
+from core.metrics import metrics
+import json
+import time
 import requests
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
+from core.infra.rate_limiter import TokenBucketRateLimiter
+from core.infra.retry_policy import RetryPolicy
+from core.infra.transport import HttpTransport
 
 
 class GodataApiError(Exception):
     """Exceção personalizada para erros da API Go.Data."""
-    pass
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class GodataApiClient:
-    """Cliente HTTP para comunicação com a API Go.Data."""
-
-    def __init__(self, base_url: str, token: str, session: Optional[requests.Session] = None):
+    """
+    Cliente HTTP para comunicação com a API Go.Data.
+
+    Falhas transitórias são repetidas conforme `retry_policy`; o timeout de
+    cada requisição é escolhido pelo nome da operação em `timeouts`
+    (com `DEFAULT_TIMEOUT` para as demais) e, com `rate_limiter`, as
+    requisições respeitam uma taxa máxima comum a todas as threads.
+
+    Para uso com várias threads, prefira `transport` (HttpTransport) à
+    `session` compartilhada.
+    """
+    DEFAULT_TIMEOUT = 20
+    DEFAULT_TIMEOUTS: Dict[str, float] = {
+        "get_cases": 60,
+        "get_locations": 60,
+        "import_cases": 120,
+    }
+
+    def __init__(
+            self,
+            base_url: str,
+            token: str,
+            session: Optional[requests.Session] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limiter: Optional[TokenBucketRateLimiter] = None,
+            timeouts: Optional[Dict[str, float]] = None,
+            transport: Optional[HttpTransport] = None,
+        ):
         self.base_url = base_url.rstrip("/")
         self.token = token
         self.session = session or requests.Session()
+        self.transport = transport
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.timeouts = {**self.DEFAULT_TIMEOUTS, **(timeouts or {})}
 
     # --- Métodos utilitários internos ---
 
     def _auth_params(self) -> Dict[str, str]:
         return {"access_token": self.token}
 
-    def _request(self, method: str, endpoint: str, **kwargs) -> Any:
-        """Executa uma requisição HTTP genérica com tratamento de erros padrão."""
+    def _request(self, method: str, endpoint: str, operation: Optional[str] = None, **kwargs) -> Any:
+        """Executa uma requisição HTTP genérica com repetições e tratamento de erros padrão."""
         url = f"{self.base_url}{endpoint}"
         params = kwargs.pop("params", {})
         params.update(self._auth_params())
+        timeout = self.timeouts.get(operation, self.DEFAULT_TIMEOUT)
+        operation_label = operation or "other"
 
         logger.debug(f"Requisição {method.upper()} → {url} com params={params} e kwargs={kwargs}")
 
-        try:
-            response = self.session.request(method, url, params=params, timeout=20, **kwargs)
-            response.raise_for_status()
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            metrics.add_gauge("http_requests_in_flight", 1)
+            start = time.perf_counter()
+            try:
+                response = (self.transport or self.session).request(
+                    method, url, params=params, timeout=timeout, **kwargs
+                )
+            except requests.RequestException as e:
+                error = e
+            else:
+                error = None
+            finally:
+                metrics.add_gauge("http_requests_in_flight", -1)
+                metrics.observe("http_request_duration_seconds", time.perf_counter() - start, operation=operation_label)
+
+            if error is not None:
+                metrics.inc("http_responses_total", operation=operation_label, status=type(error).__name__)
+                if self.retry_policy.should_retry(method, attempt, error=error):
+                    metrics.inc("http_retries_total", operation=operation_label)
+                    self._wait_retry(method, url, attempt, str(error))
+                    continue
+                logger.error(f"Erro ao executar requisição {method.upper()} em {url}: {error}")
+                raise GodataApiError(str(error)) from error
+
+            metrics.inc("http_responses_total", operation=operation_label, status=response.status_code)
+            try:
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                if self.retry_policy.should_retry(method, attempt, status_code=response.status_code):
+                    metrics.inc("http_retries_total", operation=operation_label)
+                    self._wait_retry(method, url, attempt, str(e), response.headers.get("Retry-After"))
+                    continue
+                logger.error(f"Erro ao executar requisição {method.upper()} em {url}: {e}")
+                raise GodataApiError(str(e), status_code=response.status_code) from e
+
             logger.debug(f"Resposta {response.status_code}: {response.text[:200]}...")
             return response.json() if response.text else None
-        except requests.RequestException as e:
-            logger.error(f"Erro ao executar requisição {method.upper()} em {url}: {e}")
-            raise GodataApiError(str(e)) from e
+
+    def _wait_retry(self, method: str, url: str, attempt: int, reason: str, retry_after: Optional[str] = None) -> None:
+        delay = self.retry_policy.delay(attempt, retry_after)
+        logger.warning(
+            f"Falha na requisição {method.upper()} em {url} ({reason}), "
+            f"tentativa {attempt + 1} em {delay:.1f} s"
+        )
+        time.sleep(delay)
 
     # --- Métodos públicos da API ---
 
     def get_outbreaks(self) -> Any:
-        return self._request("GET", "/api/outbreaks")
+        return self._request("GET", "/api/outbreaks", operation="get_outbreaks")
 
     def get_reference_data(self) -> Any:
-        return self._request("GET", "/api/reference-data")
+        return self._request("GET", "/api/reference-data", operation="get_reference_data")
+
+    def get_cases(self, outbreak_id: str, filter_params: Optional[Dict[str, str]] = None) -> Any:
+        return self._request("GET", f"/api/outbreaks/{outbreak_id}/cases", operation="get_cases", params=filter_params or {})
+
+    def iter_cases(
+            self,
+            outbreak_id: str,
+            page_size: int = 1000,
+            fields: Optional[Sequence[str]] = ("id", "visualId", "updatedAt"),
+            where: Optional[Dict[str, Any]] = None,
+        ) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre os casos do surto em páginas de `page_size`, pedindo apenas
+        os campos em `fields` (None retorna o documento completo).
+        A paginação é por chave (id maior que o último da página anterior), e não
+        por skip: cada página custa o mesmo e casos criados ou removidos durante
+        a leitura não deslocam as páginas seguintes.
+        """
+        if fields and "id" not in fields:
+            fields = ("id", *fields)
+        last_id = None
+        while True:
+            conditions = [where] if where else []
+            if last_id is not None:
+                conditions.append({"id": {"gt": last_id}})
+            filter_ = {"limit": page_size, "order": "id ASC"}
+            if fields:
+                filter_["fields"] = {field: True for field in fields}
+            if len(conditions) == 1:
+                filter_["where"] = conditions[0]
+            elif conditions:
+                filter_["where"] = {"and": conditions}
+
+            page = self.get_cases(outbreak_id, {"filter": json.dumps(filter_)}) or []
+            # Servidor que ignora o filtro por id devolveria a mesma página indefinidamente
+            if page and last_id is not None and page[-1].get("id") <= last_id:
+                return
+            yield from page
+            # Página incompleta encerra; página maior que o limite indica que o servidor ignorou a paginação
+            if len(page) != page_size:
+                return
+            last_id = page[-1].get("id")
 
-    def get_cases(self, outbreak_id: str) -> Any:
-        return self._request("GET", f"/api/outbreaks/{outbreak_id}/cases")
-    
     def get_locations(self, filter_params: Optional[Dict[str, str]] = None) -> Any:
-        return self._request("GET", "/api/locations/hierarchical", params=filter_params or {})
+        return self._request("GET", "/api/locations/hierarchical", operation="get_locations", params=filter_params or {})
     
     def post_case(self, outbreak_id: str, case_data: dict) -> Any:
-        return self._request("POST", f"/api/outbreaks/{outbreak_id}/cases", json=case_data)
+        return self._request("POST", f"/api/outbreaks/{outbreak_id}/cases", operation="post_case", json=case_data)
+
+    def import_cases(self, outbreak_id: str, cases_data: List[dict]) -> Any:
+        """Cria vários casos em uma única requisição (importação em lote do Go.Data)."""
+        return self._request("POST", f"/api/outbreaks/{outbreak_id}/cases/import", operation="import_cases", json={"data": cases_data})
 
     def put_case(self, outbreak_id: str, case_id: str, case_data: dict) -> Any:
-        return self._request("PUT", f"/api/outbreaks/{outbreak_id}/cases/{case_id}", json=case_data)
\ No newline at end of file
+        return self._request("PUT", f"/api/outbreaks/{outbreak_id}/cases/{case_id}", operation="put_case", json=case_data)
\ No newline at end of file
@@ -0,0 +1,36 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucketRateLimiter:
+    """
+    Limitador de taxa por balde de fichas, compartilhado entre threads.
+
+    O balde enche a `rate` fichas por segundo até `capacity`; cada requisição
+    consome uma ficha e espera quando o balde está vazio, o que permite
+    rajadas curtas sem ultrapassar a taxa média configurada.
+    """
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("A taxa do limitador deve ser positiva.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Consome uma ficha, esperando se necessário. Retorna o tempo esperado em segundos."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
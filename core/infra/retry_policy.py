@@ -0,0 +1,80 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+
+class RetryPolicy:
+    """
+    Regras de repetição das requisições ao Go.Data.
+
+    GET e PUT são idempotentes e podem ser repetidos após timeouts, falhas
+    de conexão e respostas 429/5xx transitórias. POST só é repetido quando
+    há garantia de que o servidor não processou a requisição: falha ao
+    abrir a conexão ou resposta 429/503.
+
+    A espera segue backoff exponencial com jitter completo, limitado a
+    `backoff_max`; quando a resposta traz `Retry-After`, esse valor é usado.
+    """
+    IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    RETRY_STATUS: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    # Respostas em que o servidor recusou a requisição antes de processá-la
+    REFUSED_STATUS: FrozenSet[int] = frozenset({429, 503})
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def should_retry(
+            self,
+            method: str,
+            attempt: int,
+            status_code: Optional[int] = None,
+            error: Optional[requests.RequestException] = None,
+        ) -> bool:
+        """`attempt` é o número de tentativas já feitas (começando em 1)."""
+        if attempt > self.max_retries:
+            return False
+
+        idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        if status_code is not None:
+            statuses = self.RETRY_STATUS if idempotent else self.REFUSED_STATUS
+            return status_code in statuses
+        if error is not None:
+            if self._is_connect_error(error):
+                return True
+            return idempotent and isinstance(error, (requests.Timeout, requests.ConnectionError))
+        return False
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Tempo de espera, em segundos, antes da próxima tentativa."""
+        server_delay = self._parse_retry_after(retry_after)
+        if server_delay is not None:
+            return min(server_delay, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def _is_connect_error(error: requests.RequestException) -> bool:
+        # Falhas em que a requisição não chegou a ser enviada ao servidor
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, requests.ConnectionError) and error.args:
+            return isinstance(getattr(error.args[0], "reason", None), NewConnectionError)
+        return False
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
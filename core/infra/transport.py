@@ -0,0 +1,79 @@
+import gzip
+import json
+import threading
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HttpTransport:
+    """
+    Transporte HTTP para uso concorrente do GodataApiClient.
+
+    Cada thread recebe sua própria `requests.Session` (cabeçalhos e cookies
+    não são compartilhados entre threads), mas todas usam o mesmo
+    `HTTPAdapter`, cujo pool de conexões é seguro entre threads e tem
+    `pool_size` conexões por host. Com `pool_block`, uma thread sem conexão
+    livre espera em vez de abrir e descartar conexões extras.
+
+    Com `gzip_requests`, corpos JSON a partir de `gzip_min_size` bytes são
+    enviados comprimidos (`Content-Encoding: gzip`).
+    """
+    def __init__(
+            self,
+            pool_size: int = 10,
+            keep_alive: bool = True,
+            pool_block: bool = True,
+            gzip_requests: bool = False,
+            gzip_min_size: int = 1024,
+            base_session: Optional[requests.Session] = None,
+        ):
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.gzip_requests = gzip_requests
+        self.gzip_min_size = gzip_min_size
+        # Sessão de origem (p.ex. a do login), cujos cabeçalhos e cookies são copiados
+        self.base_session = base_session
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=pool_block)
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """Sessão da thread atual, criada no primeiro uso."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._new_session()
+            self._local.session = session
+        return session
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        if self.base_session is not None:
+            session.headers.update(self.base_session.headers)
+            session.cookies.update(self.base_session.cookies)
+        session.headers["Connection"] = "keep-alive" if self.keep_alive else "close"
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        if self.gzip_requests and kwargs.get("json") is not None:
+            self._compress_json(kwargs)
+        return self.session.request(method, url, **kwargs)
+
+    def _compress_json(self, kwargs: dict) -> None:
+        body = json.dumps(kwargs["json"]).encode("utf-8")
+        if len(body) < self.gzip_min_size:
+            return
+
+        kwargs.pop("json")
+        kwargs["data"] = gzip.compress(body, compresslevel=5)
+        kwargs["headers"] = {
+            **(kwargs.get("headers") or {}),
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+        }
+
+    def close(self) -> None:
+        self._adapter.close()
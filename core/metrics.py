@@ -0,0 +1,220 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Limites (em segundos) dos histogramas de duração
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class MetricsRegistry:
+    """
+    Registro de métricas da execução (contadores, gauges e histogramas),
+    seguro entre threads, com rótulos livres por métrica.
+
+    Ao final da execução pode ser gravado como relatório JSON (`write_json`)
+    ou no formato textfile do Prometheus (`write_prometheus`).
+    """
+    def __init__(self, namespace: str = "sinan_godata"):
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._gauges: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self.started_at = time.time()
+
+    @staticmethod
+    def _labels(labels: Dict[str, Any]) -> Labels:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    # --- Registro ---
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._gauges.setdefault(name, {})[self._labels(labels)] = value
+
+    def add_gauge(self, name: str, delta: float, **labels: Any) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            series[key] = series.get(key, 0) + delta
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram()
+            series[key].observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[None]:
+        """Registra no histograma `name` a duração do bloco, em segundos."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed(self, name: str, fn: Callable[..., Any], **labels: Any) -> Callable[..., Any]:
+        """Envolve `fn` para registrar a duração de cada chamada."""
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self.timer(name, **labels):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    def drain(self) -> Dict[str, Any]:
+        """
+        Retorna o que foi registrado desde a última chamada e esvazia o
+        registro. Usado nos processos de mapeamento, cujo registro é
+        separado do processo principal; o resultado é serializável e é
+        somado lá com `merge`.
+        """
+        with self._lock:
+            delta = {"counters": self._counters, "gauges": self._gauges, "histograms": self._histograms}
+            self._counters, self._gauges, self._histograms = {}, {}, {}
+        return delta
+
+    def merge(self, delta: Dict[str, Any]) -> None:
+        """Soma contadores e histogramas de `drain`; gauges ficam com o valor recebido."""
+        with self._lock:
+            for name, series in delta["counters"].items():
+                target = self._counters.setdefault(name, {})
+                for key, value in series.items():
+                    target[key] = target.get(key, 0) + value
+            for name, series in delta["gauges"].items():
+                self._gauges.setdefault(name, {}).update(series)
+            for name, series in delta["histograms"].items():
+                target = self._histograms.setdefault(name, {})
+                for key, histogram in series.items():
+                    if key not in target:
+                        target[key] = Histogram(histogram.buckets)
+                    merged = target[key]
+                    merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+                    merged.sum += histogram.sum
+                    merged.count += histogram.count
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+            self.started_at = time.time()
+
+    # --- Leitura e exportação ---
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "started_at": self.started_at,
+                "counters": {
+                    name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+                "gauges": {
+                    name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                    for name, series in self._gauges.items()
+                },
+                "histograms": {
+                    name: [
+                        {
+                            "labels": dict(key),
+                            "count": histogram.count,
+                            "sum": round(histogram.sum, 6),
+                            "mean": round(histogram.sum / histogram.count, 6) if histogram.count else 0.0,
+                            "buckets": {str(bound): count for bound, count in histogram.cumulative()},
+                        }
+                        for key, histogram in series.items()
+                    ]
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def write_json(self, path: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        report = {**(extra or {}), "metrics": self.snapshot()}
+        self._atomic_write(path, json.dumps(report, indent=2, default=str))
+
+    def write_prometheus(self, path: str) -> None:
+        """Grava no formato textfile do Prometheus (node_exporter), de forma atômica."""
+        self._atomic_write(path, self.to_prometheus())
+
+    def to_prometheus(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                metric = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                lines += [f"{metric}{self._format_labels(key)} {value}" for key, value in series.items()]
+            for name, series in sorted(self._gauges.items()):
+                metric = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {metric} gauge")
+                lines += [f"{metric}{self._format_labels(key)} {value}" for key, value in series.items()]
+            for name, series in sorted(self._histograms.items()):
+                metric = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for key, histogram in series.items():
+                    for bound, count in histogram.cumulative():
+                        lines.append(f"{metric}_bucket{self._format_labels(key, le=str(bound))} {count}")
+                    lines.append(f"{metric}_bucket{self._format_labels(key, le='+Inf')} {histogram.count}")
+                    lines.append(f"{metric}_sum{self._format_labels(key)} {histogram.sum}")
+                    lines.append(f"{metric}_count{self._format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _format_labels(key: Labels, **extra: str) -> str:
+        items = list(key) + list(extra.items())
+        if not items:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in items) + "}"
+
+    @staticmethod
+    def _atomic_write(path: str, content: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
+# Registro global, como o `logger`
+metrics = MetricsRegistry()
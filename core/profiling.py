@@ -0,0 +1,129 @@
+import cProfile
+import io
+import os
+import pstats
+import threading
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from core.logger import logger
+
+
+class StageProfiler:
+    """
+    Perfil de CPU (cProfile) por etapa da importação, com rastreamento
+    opcional de alocações (tracemalloc).
+
+    Cada etapa acumula seu próprio `cProfile.Profile`, gravado em
+    `<output_dir>/<etapa>.prof` (abre com `pstats` ou snakeviz); o resumo
+    com as funções mais custosas e o pico de memória de cada etapa vai para
+    `<output_dir>/summary.txt`.
+
+    O cProfile mede apenas a thread que chama a etapa: o trabalho feito em
+    pools de threads ou processos aparece como espera. Se outro profiler já
+    estiver ativo (p.ex. `python -m cProfile main.py`), a etapa roda sem
+    perfil e um aviso é registrado. Com etapas em paralelo (`PIPELINE`), os
+    picos de memória de etapas simultâneas se sobrepõem.
+    """
+    def __init__(self, output_dir: str, trace_memory: bool = False, top: int = 25):
+        self.output_dir = output_dir
+        self.trace_memory = trace_memory
+        self.top = top
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._peaks: Dict[str, int] = {}
+        self._calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._conflict_reported = False
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def wrap(self, stage: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Envolve `fn` para que cada chamada seja perfilada como parte de `stage`."""
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self.run(stage, fn, *args, **kwargs)
+        return wrapper
+
+    def wrap_source(self, stage: str, source: Iterable[Any]) -> Iterator[Any]:
+        """Perfila como `stage` a obtenção de cada item de `source` (p.ex. a leitura dos blocos)."""
+        iterator = iter(source)
+        done = object()
+        while True:
+            item = self.run(stage, next, iterator, done)
+            if item is done:
+                return
+            yield item
+
+    def run(self, stage: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            profile = self._profiles.setdefault(stage, cProfile.Profile())
+            self._calls[stage] = self._calls.get(stage, 0) + 1
+
+        if self.trace_memory:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        try:
+            profile.enable()
+        except ValueError as e:
+            self._report_conflict(e)
+            return fn(*args, **kwargs)
+
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profile.disable()
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+                with self._lock:
+                    self._peaks[stage] = max(self._peaks.get(stage, 0), peak)
+
+    def _report_conflict(self, error: Exception) -> None:
+        if not self._conflict_reported:
+            self._conflict_reported = True
+            logger.warning("Outro profiler está ativo, as etapas serão executadas sem perfil: %s", error)
+
+    # --- Resultados ---
+
+    @property
+    def peaks(self) -> Dict[str, int]:
+        """Pico de memória alocada (bytes) em cada etapa, com `trace_memory`."""
+        with self._lock:
+            return dict(self._peaks)
+
+    def write_report(self) -> str:
+        """Grava os perfis e o resumo; retorna o caminho do resumo."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        sections: List[str] = []
+        # A fotografia das alocações vem antes da escrita dos perfis, que também aloca
+        allocations = self._allocation_summary() if self.trace_memory else None
+
+        with self._lock:
+            profiles = dict(self._profiles)
+        for stage, profile in profiles.items():
+            profile.dump_stats(os.path.join(self.output_dir, f"{stage}.prof"))
+            sections.append(self._stage_summary(stage, profile))
+
+        if allocations is not None:
+            sections.append(allocations)
+
+        summary_path = os.path.join(self.output_dir, "summary.txt")
+        with open(summary_path, "w") as f:
+            f.write("\n\n".join(sections) + "\n")
+        logger.info("Perfis das etapas gravados em %s", self.output_dir)
+        return summary_path
+
+    def _stage_summary(self, stage: str, profile: cProfile.Profile) -> str:
+        buffer = io.StringIO()
+        stats = pstats.Stats(profile, stream=buffer)
+        header = f"=== {stage}: {self._calls.get(stage, 0)} chamadas, {stats.total_tt:.3f} s de CPU perfilada"
+        if stage in self._peaks:
+            header += f", pico de memória {self._peaks[stage] / 2 ** 20:.1f} MiB"
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        return f"{header} ===\n{buffer.getvalue().strip()}"
+
+    def _allocation_summary(self) -> str:
+        lines = [f"=== Maiores alocações ainda ativas (top {self.top}) ==="]
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            lines += [str(stat) for stat in snapshot.statistics("lineno")[:self.top]]
+        return "\n".join(lines)
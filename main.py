@@ -1,3 +1,5 @@
+import argparse
+import atexit
 import os
 from dotenv import load_dotenv
 
@@ -6,44 +8,237 @@ from pprint import pprint
 
 from core.infra.auth import GodataAuth
 from core.infra.client import GodataApiClient
+from core.infra.rate_limiter import TokenBucketRateLimiter
+from core.infra.retry_policy import RetryPolicy
+from core.infra.transport import HttpTransport
 from core.adapters import (
     XlsxReader,
+    DbfReader,
+    CsvReader,
+    CachedReader,
     GodataOutbreakTranslator,
     GodataLocationTranslator,
+    ReferenceDataCache,
     IBGELocationIdTranslator,
+    LocationResolutionCache,
+    LocalCaseIndex,
     CaseUploader,
-    CaseJsonWriter
+    AdaptiveCaseUploader,
+    CaseJsonWriter,
+    RunJournal,
+    JournaledOutputPort,
 )
 
 from core.app.use_cases import (
     ImportSinanDataUseCase
 )
 from core.logger import logger
+from core.metrics import metrics
+from core.profiling import StageProfiler
 
 load_dotenv()
 API_URL = os.getenv("API_URL")
 API_TOKEN = os.getenv("API_TOKEN")
 API_USERNAME = os.getenv("API_USERNAME")
 API_PASSWORD = os.getenv("API_PASSWORD")
+# Repetições de requisições com falha transitória e taxa máxima de requisições por segundo (0 sem limite)
+API_MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", "3"))
+API_RATE_LIMIT = float(os.getenv("API_RATE_LIMIT", "0"))
+# Corpos JSON grandes enviados com gzip
+API_GZIP = os.getenv("API_GZIP", "") == "1"
+# Quantidade de linhas lidas e mapeadas por bloco
+CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "5000"))
+INPUT_PATH = os.getenv("INPUT_PATH", "data/input/base_enxant.xlsx")
+# Diretório do cache da entrada já lida (vazio desativa o cache)
+INPUT_CACHE_DIR = os.getenv("INPUT_CACHE_DIR", "")
+# Tamanho dos lotes de criação de casos (0 envia um caso por requisição)
+UPLOAD_BULK_SIZE = int(os.getenv("UPLOAD_BULK_SIZE", "0"))
+# Threads de envio do CaseUploader
+UPLOAD_WORKERS = int(os.getenv("UPLOAD_WORKERS", "5"))
+# Envio em threads com concorrência adaptativa (limite máximo de requisições simultâneas)
+UPLOAD_ADAPTIVE = os.getenv("UPLOAD_ADAPTIVE", "") == "1"
+UPLOAD_MAX_CONCURRENCY = int(os.getenv("UPLOAD_MAX_CONCURRENCY", "32"))
+# Validade, em segundos, dos snapshots de localizações e surtos do Go.Data
+REFERENCE_DATA_TTL = float(os.getenv("REFERENCE_DATA_TTL", str(24 * 60 * 60)))
+REFERENCE_DATA_REFRESH = os.getenv("REFERENCE_DATA_REFRESH", "") == "1"
+# Índice local dos casos do Go.Data, sincronizado por alterações (vazio desativa)
+CASE_INDEX_PATH = os.getenv("CASE_INDEX_PATH", "data/cache/case_index.sqlite3")
+# Leitura, mapeamento e envio em paralelo, com até PIPELINE_QUEUE_SIZE blocos entre as etapas
+PIPELINE = os.getenv("PIPELINE", "") == "1"
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "2"))
+# Processos de mapeamento dos blocos (1 mapeia no processo principal)
+MAPPING_WORKERS = int(os.getenv("MAPPING_WORKERS", "1"))
+# Diário com o resultado de cada caso, usado por --resume e --replay
+JOURNAL_PATH = os.getenv("JOURNAL_PATH", "data/journal/import.jsonl")
+# Resultados acumulados antes de cada gravação no diário
+JOURNAL_CHECKPOINT_SIZE = int(os.getenv("JOURNAL_CHECKPOINT_SIZE", "200"))
+# Relatório JSON de métricas da execução e arquivo textfile do Prometheus (vazio desativa)
+METRICS_REPORT_PATH = os.getenv("METRICS_REPORT_PATH", "data/output/run_report.json")
+METRICS_PROMETHEUS_PATH = os.getenv("METRICS_PROMETHEUS_PATH", "")
+# Diretório padrão dos perfis de --profile, ao lado do relatório da execução
+PROFILE_DIR = os.path.join(os.path.dirname(METRICS_REPORT_PATH) or "data/output", "profile")
+LOCATION_CACHE_PATH = os.getenv("LOCATION_CACHE_PATH", "data/cache/location_resolution.json")
+
+
+def build_uploader(api_client: GodataApiClient, reset_index: bool = False):
+    """Escolhe entre o envio com número fixo de threads e o envio com concorrência adaptativa."""
+    case_index = LocalCaseIndex(CASE_INDEX_PATH) if CASE_INDEX_PATH else None
+    if case_index is not None and reset_index:
+        case_index.reset()
+    if UPLOAD_ADAPTIVE:
+        # O envio adaptativo manda um caso por requisição
+        if UPLOAD_BULK_SIZE:
+            raise ValueError("UPLOAD_BULK_SIZE não é suportado com UPLOAD_ADAPTIVE; use apenas uma das opções")
+        return AdaptiveCaseUploader(
+            api_client=api_client,
+            max_concurrency=UPLOAD_MAX_CONCURRENCY,
+            case_index=case_index,
+        )
+    return CaseUploader(
+        api_client=api_client,
+        max_workers=UPLOAD_WORKERS,
+        bulk_size=UPLOAD_BULK_SIZE or None,
+        case_index=case_index,
+    )
+
+
+def build_reader(input_path: str):
+    """Escolhe o leitor de entrada pela extensão do arquivo."""
+    extension = os.path.splitext(input_path)[1].lower()
+    if extension == ".dbf":
+        reader = DbfReader(file_path=input_path, chunk_size=CHUNK_SIZE)
+    elif extension in (".csv", ".txt"):
+        reader = CsvReader(file_path=input_path, chunk_size=CHUNK_SIZE)
+    elif extension in (".xlsx", ".xlsm"):
+        reader = XlsxReader(file_path=input_path, chunk_size=CHUNK_SIZE)
+    else:
+        raise ValueError(f"Formato de entrada não suportado: {input_path}")
+
+    if INPUT_CACHE_DIR:
+        return CachedReader(reader, cache_dir=INPUT_CACHE_DIR)
+    return reader
+
+
+def write_run_report(args: argparse.Namespace) -> None:
+    """Grava as métricas da execução, inclusive quando ela termina com erro."""
+    if METRICS_REPORT_PATH:
+        metrics.write_json(METRICS_REPORT_PATH, extra={"input_path": INPUT_PATH, "args": vars(args)})
+        logger.info("Relatório de métricas gravado em %s", METRICS_REPORT_PATH)
+    if METRICS_PROMETHEUS_PATH:
+        metrics.write_prometheus(METRICS_PROMETHEUS_PATH)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Importa casos do SINAN para o Go.Data.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--resume",
+        action="store_true",
+        help="retoma a importação anterior, pulando os casos já confirmados no diário",
+    )
+    mode.add_argument(
+        "--replay",
+        action="store_true",
+        help="reenvia apenas os casos que falharam na importação anterior",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAPPING_WORKERS,
+        help="processos de mapeamento dos blocos da entrada (padrão: MAPPING_WORKERS ou 1)",
+    )
+    parser.add_argument(
+        "--reset-index",
+        action="store_true",
+        help="descarta o índice local de casos (CASE_INDEX_PATH) e lista os surtos inteiros de novo",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=PROFILE_DIR,
+        metavar="DIR",
+        help=f"grava o perfil de CPU de cada etapa e um resumo em DIR (padrão: {PROFILE_DIR})",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="registra também o pico de memória de cada etapa (tracemalloc); implica --profile",
+    )
+    args = parser.parse_args()
+    if args.profile_memory and not args.profile:
+        args.profile = PROFILE_DIR
+    return args
 
 
 if __name__ == "__main__":
+    args = parse_args()
+    atexit.register(write_run_report, args)
     auth = GodataAuth(API_URL, API_TOKEN)
     token = auth.login(username=API_USERNAME, password=API_PASSWORD)
-    api_client = GodataApiClient(base_url=API_URL, token=token, session=auth.session)
+    # Pool de conexões do tamanho da concorrência de envio
+    transport = HttpTransport(
+        pool_size=UPLOAD_MAX_CONCURRENCY if UPLOAD_ADAPTIVE else UPLOAD_WORKERS,
+        gzip_requests=API_GZIP,
+        base_session=auth.session,
+    )
+    api_client = GodataApiClient(
+        base_url=API_URL,
+        token=token,
+        session=auth.session,
+        transport=transport,
+        retry_policy=RetryPolicy(max_retries=API_MAX_RETRIES),
+        rate_limiter=TokenBucketRateLimiter(rate=API_RATE_LIMIT) if API_RATE_LIMIT > 0 else None,
+    )
+
+    # O diário da execução anterior é mantido ao retomar ou reenviar falhas
+    output_port = JournaledOutputPort(
+        output_port=build_uploader(api_client, reset_index=args.reset_index),
+        journal=RunJournal(JOURNAL_PATH),
+        resume=args.resume or args.replay,
+        checkpoint_size=JOURNAL_CHECKPOINT_SIZE,
+    )
+    if args.replay:
+        results = output_port.replay_failed()
+        logger.info(
+            "Reenvio concluído: %s casos, %s ainda com erro",
+            len(results), sum(result["status"] == "error" for result in results),
+        )
+        raise SystemExit(0)
 
-    xlsx_path = "data/input/base_enxant.xlsx"
     ibge_dictionary_path = "./data/input/Dic_Mun_Res.xlsx"
     
+    reference_data = ReferenceDataCache(api_client=api_client, ttl_seconds=REFERENCE_DATA_TTL)
+    if REFERENCE_DATA_REFRESH:
+        reference_data.invalidate()
+
+    godata_location_translator = GodataLocationTranslator(api_client=reference_data)
+    ibge_location_translator = IBGELocationIdTranslator(dictionary_path=ibge_dictionary_path)
+    location_cache = LocationResolutionCache(
+        path=LOCATION_CACHE_PATH,
+        fingerprint=LocationResolutionCache.build_fingerprint(
+            godata_location_translator.fingerprint,
+            ibge_location_translator.fingerprint,
+        ),
+    )
     
+    profiler = StageProfiler(args.profile, trace_memory=args.profile_memory) if args.profile else None
     use_case = ImportSinanDataUseCase(
         disease_module_name="sarampo",
-        input_port=XlsxReader(file_path=xlsx_path),
-        godata_outbreak_translator=GodataOutbreakTranslator(api_client=api_client),
-        godata_location_translator=GodataLocationTranslator(api_client=api_client),
-        ibge_location_translator=IBGELocationIdTranslator(dictionary_path=ibge_dictionary_path),
+        input_port=build_reader(INPUT_PATH),
+        godata_outbreak_translator=GodataOutbreakTranslator(api_client=reference_data),
+        godata_location_translator=godata_location_translator,
+        ibge_location_translator=ibge_location_translator,
         #output_port=CaseJsonWriter(file_path="data/output/cases.json")
-        output_port=CaseUploader(api_client=api_client)
+        output_port=output_port,
+        location_cache=location_cache,
+        pipelined=PIPELINE,
+        queue_size=PIPELINE_QUEUE_SIZE,
+        workers=args.workers,
+        profiler=profiler,
     )
 
-    use_case.execute("Sarampo",anonymize=True)
+    try:
+        use_case.execute("Sarampo",anonymize=True)
+    finally:
+        if profiler is not None:
+            profiler.write_report()
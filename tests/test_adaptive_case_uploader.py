@@ -0,0 +1,75 @@
+import threading
+import time
+
+from core.adapters import AdaptiveCaseUploader, AdaptiveConcurrencyLimiter
+
+from tests.test_case_uploader import FakeApi, case
+
+
+def test_limit_grows_additively_on_fast_responses():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=3, latency_target=1.0)
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release(latency=0.01, ok=True)
+    assert limiter.limit == 3
+    assert limiter.in_flight == 0
+
+
+def test_limit_halves_once_per_latency_window():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, latency_target=10.0)
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(latency=0.01, ok=False)
+    # Uma rajada de erros reduz o limite apenas uma vez
+    assert limiter.limit == 4
+
+
+def test_limit_never_goes_below_minimum():
+    limiter = AdaptiveConcurrencyLimiter(initial=1, min_limit=1, latency_target=0.0)
+    limiter.acquire()
+    limiter.release(latency=5.0, ok=True)
+    assert limiter.limit == 1
+
+
+def test_acquire_blocks_until_release():
+    limiter = AdaptiveConcurrencyLimiter(initial=1)
+    limiter.acquire()
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    thread.start()
+    assert not acquired.wait(0.1)
+    limiter.release(latency=0.01, ok=True)
+    assert acquired.wait(1)
+    thread.join()
+
+
+class SlowApi(FakeApi):
+    """Conta as requisições simultâneas."""
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def post_case(self, outbreak_id, case_data):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        return super().post_case(outbreak_id, case_data)
+
+
+def test_uploader_respects_limit_and_keeps_it_between_calls():
+    api = SlowApi()
+    uploader = AdaptiveCaseUploader(api, initial_concurrency=2, max_concurrency=4)
+    results = uploader.send_cases([case(str(i)) for i in range(20)], "ob-1")
+    assert sorted(item["NU_NOTIFIC"] for item in results) == sorted(str(i) for i in range(20))
+    assert all(item["status"] == "success" for item in results)
+    assert api.peak <= 4
+    assert uploader._concurrency_limit > 2
+
+    # Casos criados passam a ser atualizados
+    uploader.send_cases([case("0")], "ob-1")
+    assert api.puts == ["id-0"]
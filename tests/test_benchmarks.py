@@ -0,0 +1,33 @@
+import tracemalloc
+
+from benchmarks.run_benchmarks import parse_args, run
+from benchmarks.synthetic_sinan import location_tree
+
+
+def test_location_tree_has_region_level():
+    [brasil] = location_tree()
+    santa_catarina = next(uf for uf in brasil["children"] if uf["location"]["name"] == "Santa Catarina")
+    joinville = next(node for node in santa_catarina["children"] if node["location"]["name"] == "Joinville")
+    assert joinville["location"]["id"] == "loc-regiao-joinville"
+    assert [child["location"]["id"] for child in joinville["children"]] == ["loc-420910"]
+
+
+def test_benchmark_runs_the_use_case(tmp_path):
+    results = run(parse_args(["--rows", "150", "--chunk-size", "50", "--work-dir", str(tmp_path)]))
+    assert [item["stage"] for item in results] == [
+        "leitura", "preprocessamento", "mapeamento", "serializacao", "envio", "total"
+    ]
+    assert all(item["rows"] == 150 for item in results)
+    assert all(item["peak_mib"] is None for item in results)
+
+
+def test_benchmark_reports_peaks_with_profile_memory(tmp_path):
+    try:
+        results = run(parse_args([
+            "--rows", "100", "--chunk-size", "50", "--work-dir", str(tmp_path), "--skip-upload", "--profile-memory",
+        ]))
+    finally:
+        tracemalloc.stop()
+    peaks = {item["stage"]: item["peak_mib"] for item in results}
+    assert peaks["serializacao"] > 0
+    assert peaks["envio"] is not None
@@ -0,0 +1,95 @@
+import os
+
+import pandas as pd
+
+from core.adapters import CachedReader, CsvReader
+
+
+def write_csv(path, rows: int):
+    lines = ["NU_NOTIFIC;NM_PACIENT"] + [f"{i};Paciente {i}" for i in range(rows)]
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def CountingReader(*args, **kwargs) -> CsvReader:
+    """CsvReader que conta as leituras do arquivo."""
+    reader = CsvReader(*args, **kwargs)
+    reader.reads = 0
+    read_chunks = reader.read_chunks
+
+    def counting(columns=None):
+        reader.reads += 1
+        yield from read_chunks(columns)
+
+    reader.read_chunks = counting
+    return reader
+
+
+def entries(cache_dir):
+    return [name for name in os.listdir(cache_dir) if name != "index.json"]
+
+
+def test_miss_streams_chunks_into_parts_and_hit_skips_the_reader(tmp_path):
+    path = write_csv(tmp_path / "base.csv", 10)
+    reader = CountingReader(path, chunk_size=4)
+    cache = CachedReader(reader, cache_dir=str(tmp_path / "cache"))
+
+    first = list(cache.read_chunks(columns=["NU_NOTIFIC"]))
+    [entry] = entries(tmp_path / "cache")
+    parts = sorted(os.listdir(tmp_path / "cache" / entry))
+    assert parts[0] == "manifest.json" and len(parts) == 1 + 3
+
+    second = list(cache.read_chunks(columns=["NU_NOTIFIC"]))
+    assert reader.reads == 1
+    assert [len(df) for df in second] == [4, 4, 2]
+    pd.testing.assert_frame_equal(pd.concat(first), pd.concat(second))
+
+
+def test_hit_is_rechunked_to_current_chunk_size(tmp_path):
+    path = write_csv(tmp_path / "base.csv", 10)
+    list(CachedReader(CsvReader(path, chunk_size=4), cache_dir=str(tmp_path / "cache")).read_chunks())
+
+    reader = CountingReader(path, chunk_size=3)
+    chunks = list(CachedReader(reader, cache_dir=str(tmp_path / "cache")).read_chunks())
+    assert reader.reads == 0
+    assert [len(df) for df in chunks] == [3, 3, 3, 1]
+    assert list(pd.concat(chunks).index) == list(range(10))
+
+
+def test_interrupted_read_leaves_no_entry(tmp_path):
+    path = write_csv(tmp_path / "base.csv", 10)
+    cache = CachedReader(CsvReader(path, chunk_size=4), cache_dir=str(tmp_path / "cache"))
+    chunks = cache.read_chunks()
+    next(chunks)
+    chunks.close()
+    assert entries(tmp_path / "cache") == []
+
+
+def test_changed_file_or_reader_options_invalidate_the_entry(tmp_path):
+    path = write_csv(tmp_path / "base.csv", 5)
+    cache_dir = str(tmp_path / "cache")
+    list(CachedReader(CsvReader(path), cache_dir=cache_dir).read_chunks())
+
+    write_csv(tmp_path / "base.csv", 6)
+    reader = CountingReader(path)
+    assert len(CachedReader(reader, cache_dir=cache_dir).read_dataframe()) == 6
+    assert reader.reads == 1
+    # A entrada da versão anterior do arquivo é removida
+    assert len(entries(tmp_path / "cache")) == 1
+
+    reader = CountingReader(path, n_rows=2)
+    assert len(CachedReader(reader, cache_dir=cache_dir).read_dataframe()) == 2
+    assert reader.reads == 1
+
+
+def test_readers_must_declare_cache_key():
+    import pytest
+
+    from core.domain.ports import DataframeReader
+
+    class NoKeyReader(DataframeReader):
+        def read_dataframe(self, columns=None):
+            return pd.DataFrame()
+
+    with pytest.raises(TypeError):
+        NoKeyReader()
@@ -0,0 +1,42 @@
+import pytest
+
+from benchmarks.fake_godata_server import FakeGodataServer
+from core.adapters import CaseUploader, LocalCaseIndex
+from core.adapters.case_index import case_fingerprint
+from core.infra import RetryPolicy
+from core.infra.client import GodataApiClient
+
+from tests.test_case_uploader import case
+
+
+def test_fingerprint_ignores_volatile_fields():
+    first, second = case("1"), case("1")
+    second.updatedAt = "2030-01-01T00:00:00Z"
+    assert case_fingerprint(first) == case_fingerprint(second)
+    second.firstName = "Outro"
+    assert case_fingerprint(first) != case_fingerprint(second)
+
+
+@pytest.fixture
+def server():
+    with FakeGodataServer() as server:
+        yield server
+
+
+def test_failed_cases_are_sent_again_next_run(server, tmp_path):
+    index_path = str(tmp_path / "index.sqlite3")
+    client = GodataApiClient(base_url=server.url, token="fake-token", retry_policy=RetryPolicy(max_retries=0))
+    CaseUploader(client, case_index=LocalCaseIndex(index_path)).send_cases([case("1")], "ob-1")
+
+    # Atualização falha: a impressão digital nova não é gravada
+    changed = case("1")
+    changed.firstName = "Outro"
+    uploader = CaseUploader(client, case_index=LocalCaseIndex(index_path))
+    uploader._get_existing_cases("ob-1")
+    server.state.error_rate = 1.0
+    [failed] = uploader.send_cases([changed], "ob-1")
+    assert failed["status"] == "error"
+
+    server.state.error_rate = 0.0
+    [result] = CaseUploader(client, case_index=LocalCaseIndex(index_path)).send_cases([changed], "ob-1")
+    assert result["status"] == "success"
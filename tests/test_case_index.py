@@ -0,0 +1,69 @@
+import pytest
+
+from benchmarks.fake_godata_server import FakeGodataServer
+from core.adapters import CaseUploader, LocalCaseIndex
+from core.infra.client import GodataApiClient
+
+from tests.test_case_uploader import case
+
+
+@pytest.fixture
+def server():
+    with FakeGodataServer() as server:
+        yield server
+
+
+def uploader(server, tmp_path):
+    client = GodataApiClient(base_url=server.url, token="fake-token")
+    return CaseUploader(client, case_index=LocalCaseIndex(str(tmp_path / "index.sqlite3")))
+
+
+def test_sync_fetches_only_cases_changed_since_watermark(server, tmp_path):
+    server.state.save_case("ob-1", {"visualId": "1"}, case_id="c1")
+    first = uploader(server, tmp_path)
+    assert first._get_existing_cases("ob-1") == {"1": "c1"}
+    watermark = first.case_index.get_watermark("ob-1")
+
+    server.state.save_case("ob-1", {"visualId": "2"}, case_id="c2")
+    second = uploader(server, tmp_path)
+    calls = []
+    iter_cases = second.api_client.iter_cases
+    second.api_client.iter_cases = lambda *a, **kw: calls.append(kw["where"]) or iter_cases(*a, **kw)
+    assert second._get_existing_cases("ob-1") == {"1": "c1", "2": "c2"}
+    assert calls == [{"updatedAt": {"gte": watermark}}]
+
+
+def test_unchanged_cases_are_not_resent(server, tmp_path):
+    assert [r["status"] for r in uploader(server, tmp_path).send_cases([case("1")], "ob-1")] == ["success"]
+    requests = server.state.requests
+    assert [r["status"] for r in uploader(server, tmp_path).send_cases([case("1")], "ob-1")] == ["skipped"]
+    # Só a sincronização do índice
+    assert server.state.requests == requests + 1
+
+
+def test_case_deleted_remotely_is_created_again(server, tmp_path):
+    first = uploader(server, tmp_path)
+    [result] = first.send_cases([case("1")], "ob-1")
+    server.state.cases["ob-1"].clear()
+
+    changed = case("1")
+    changed.firstName = "Outro nome"
+    second = uploader(server, tmp_path)
+    [result] = second.send_cases([changed], "ob-1")
+    assert result["status"] == "success"
+    new_id = result["response_id"]
+    assert list(server.state.cases["ob-1"]) == [new_id]
+    assert second.case_index.cases("ob-1") == {"1": new_id}
+
+
+def test_reset_forces_full_listing(server, tmp_path):
+    first = uploader(server, tmp_path)
+    first.send_cases([case("1")], "ob-1")
+    server.state.cases["ob-1"].clear()
+
+    first.case_index.reset()
+    second = uploader(server, tmp_path)
+    assert second._get_existing_cases("ob-1") == {}
+    assert second.case_index.get_watermark("ob-1") is None
+    assert [r["status"] for r in second.send_cases([case("1")], "ob-1")] == ["success"]
+    assert len(server.state.cases["ob-1"]) == 1
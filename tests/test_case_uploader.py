@@ -0,0 +1,94 @@
+from core.adapters import CaseUploader
+from core.domain.models import GodataCase
+from core.infra.client import GodataApiError
+
+
+def case(visual_id):
+    return GodataCase(
+        addresses=[], classification="", dateOfOnset=None, dateOfReporting="2024-01-01",
+        documents=[], firstName="", gender="", outbreakId="ob-1", outcomeId="",
+        pregnancyStatus="", questionnaireAnswers={}, updatedAt="", usualPlaceOfResidenceLocationId="",
+        visualId=visual_id,
+    )
+
+
+class FakeApi:
+    """Cliente que guarda os casos em memória; `import_response` define a resposta da importação em lote."""
+    def __init__(self, import_response=None, import_error=None, find_error=None, existing=None):
+        self.cases = dict(existing or {})
+        self.import_response = import_response
+        self.import_error = import_error
+        self.find_error = find_error
+        self.posts = []
+        self.puts = []
+
+    def iter_cases(self, outbreak_id, page_size=1000, fields=None):
+        return [{"id": case_id, "visualId": visual_id} for visual_id, case_id in self.cases.items()]
+
+    def get_cases(self, outbreak_id, filter_params=None):
+        if self.find_error:
+            raise self.find_error
+        return [{"id": case_id, "visualId": visual_id} for visual_id, case_id in self.cases.items()]
+
+    def import_cases(self, outbreak_id, cases_data):
+        if self.import_error:
+            raise self.import_error
+        created = []
+        for data in cases_data:
+            self.cases[data["visualId"]] = f"id-{data['visualId']}"
+            created.append({"id": self.cases[data["visualId"]]})
+        return created if self.import_response is None else self.import_response
+
+    def post_case(self, outbreak_id, case_data):
+        self.posts.append(case_data["visualId"])
+        self.cases[case_data["visualId"]] = f"id-{case_data['visualId']}"
+        return {"id": self.cases[case_data["visualId"]]}
+
+    def put_case(self, outbreak_id, case_id, case_data):
+        self.puts.append(case_id)
+        return {"id": case_id}
+
+
+def statuses(results):
+    return {item["NU_NOTIFIC"]: (item["status"], item.get("response_id")) for item in results}
+
+
+def test_bulk_response_with_ids_is_trusted():
+    api = FakeApi()
+    results = CaseUploader(api, bulk_size=10).send_cases([case("1"), case("2")], "ob-1")
+    assert statuses(results) == {"1": ("success", "id-1"), "2": ("success", "id-2")}
+    assert api.posts == []
+
+
+def test_unclear_bulk_response_is_confirmed_before_marking_sent():
+    # Resposta que não é uma lista por caso: só o que foi encontrado no Go.Data conta como enviado
+    api = FakeApi(import_response={"count": 2})
+    results = CaseUploader(api, bulk_size=10).send_cases([case("1"), case("2")], "ob-1")
+    assert statuses(results) == {"1": ("success", "id-1"), "2": ("success", "id-2")}
+    assert api.posts == []
+
+
+def test_cases_missing_after_bulk_are_sent_individually():
+    # Lista vazia: nenhum caso do lote foi criado
+    api = FakeApi()
+    api.import_cases = lambda outbreak_id, cases_data: []
+    results = CaseUploader(api, bulk_size=10).send_cases([case("1"), case("2")], "ob-1")
+    assert statuses(results) == {"1": ("success", "id-1"), "2": ("success", "id-2")}
+    assert sorted(api.posts) == ["1", "2"]
+
+
+def test_unconfirmed_bulk_is_reported_as_error():
+    api = FakeApi(import_response={}, find_error=GodataApiError("timeout"))
+    results = CaseUploader(api, bulk_size=10).send_cases([case("1")], "ob-1")
+    assert [item["status"] for item in results] == ["error"]
+
+
+def test_failed_bulk_updates_partially_created_cases():
+    api = FakeApi(import_error=GodataApiError("500"))
+    api.cases["1"] = "id-1"
+    uploader = CaseUploader(api, bulk_size=10)
+    uploader._existing_cases["ob-1"] = {}
+    results = uploader.send_cases([case("1"), case("2")], "ob-1")
+    assert statuses(results) == {"1": ("success", "id-1"), "2": ("success", "id-2")}
+    assert api.puts == ["id-1"]
+    assert api.posts == ["2"]
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from benchmarks.fake_godata_server import FakeGodataServer
+from core.infra.client import GodataApiClient
+
+
+@pytest.fixture
+def server():
+    with FakeGodataServer() as server:
+        yield server
+
+
+def test_iter_cases_pages_by_id(server):
+    for i in range(25):
+        server.state.save_case("ob-1", {"visualId": f"v{i:02d}"}, case_id=f"c{i:02d}")
+    client = GodataApiClient(base_url=server.url, token="fake-token")
+    filters = _record_filters(client)
+
+    cases = list(client.iter_cases("ob-1", page_size=10, fields=("visualId",)))
+    assert [case["id"] for case in cases] == [f"c{i:02d}" for i in range(25)]
+    assert len(filters) == 3
+    assert all("skip" not in filter_ for filter_ in filters)
+    assert filters[1]["where"] == {"id": {"gt": "c09"}}
+
+
+def test_iter_cases_combines_caller_where(server):
+    for i in range(6):
+        server.state.save_case("ob-1", {"visualId": f"v{i}", "classification": "A" if i % 2 else "B"}, case_id=f"c{i}")
+    client = GodataApiClient(base_url=server.url, token="fake-token")
+
+    cases = list(client.iter_cases("ob-1", page_size=2, where={"classification": "A"}))
+    assert [case["id"] for case in cases] == ["c1", "c3", "c5"]
+
+
+def test_iter_cases_is_not_shifted_by_concurrent_deletes(server):
+    for i in range(6):
+        server.state.save_case("ob-1", {"visualId": f"v{i}"}, case_id=f"c{i}")
+    client = GodataApiClient(base_url=server.url, token="fake-token")
+
+    pages = client.iter_cases("ob-1", page_size=2)
+    seen = [next(pages)["id"], next(pages)["id"]]
+    # Remover casos já lidos não faz a próxima página pular nenhum
+    del server.state.cases["ob-1"]["c0"]
+    seen += [case["id"] for case in pages]
+    assert seen == [f"c{i}" for i in range(6)]
+
+
+def _record_filters(client):
+    filters = []
+    get_cases = client.get_cases
+
+    def recording(outbreak_id, filter_params=None):
+        filters.append(json.loads(filter_params["filter"]))
+        return get_cases(outbreak_id, filter_params)
+
+    client.get_cases = recording
+    return filters
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+import pytest
+
+from core.adapters import CsvReader
+from core.domain.services import SinanMapperService
+
+
+def write(tmp_path, content: str, encoding: str = "utf-8"):
+    path = tmp_path / "base.csv"
+    path.write_bytes(content.encode(encoding))
+    return str(path)
+
+
+def test_detects_delimiter_and_encoding(tmp_path):
+    path = write(tmp_path, "NU_NOTIFIC;NM_PACIENT\n1;José\n2;Conceição\n", encoding="latin-1")
+    df = CsvReader(path).read_dataframe()
+    assert df["NM_PACIENT"].tolist() == ["José", "Conceição"]
+    assert df["NU_NOTIFIC"].tolist() == ["1", "2"]
+
+
+def test_reads_requested_columns_in_chunks(tmp_path):
+    rows = "".join(f"{i},x{i},y\n" for i in range(5))
+    path = write(tmp_path, "NU_NOTIFIC,NM_PACIENT,OUTRA\n" + rows)
+    chunks = list(CsvReader(path, chunk_size=2).read_chunks(columns=["NU_NOTIFIC", "AUSENTE"]))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert all(list(chunk.columns) == ["NU_NOTIFIC"] for chunk in chunks)
+
+
+@pytest.mark.parametrize("value", ["2024-01-02", "02/01/2024", "2024-01-02 00:00:00", "02/01/2024 00:00", "20240102"])
+def test_common_sinan_date_formats(tmp_path, value):
+    path = write(tmp_path, f"NU_NOTIFIC;DT_NOTIFIC\n1;{value}\n")
+    df = CsvReader(path).read_dataframe()
+    assert SinanMapperService()._resolve_dates(df["DT_NOTIFIC"]) == [datetime(2024, 1, 2)]
+
+
+def test_latin1_accents_after_the_sample_are_not_replaced(tmp_path):
+    rows = "".join(f"{i};Paciente\n" for i in range(10000))
+    path = write(tmp_path, "NU_NOTIFIC;NM_PACIENT\n" + rows + "10000;São João\n", encoding="latin-1")
+    chunks = list(CsvReader(path, chunk_size=5000).read_chunks())
+    assert chunks[-1]["NM_PACIENT"].tolist()[-1] == "São João"
+
+
+def test_wrong_explicit_encoding_fails_instead_of_replacing(tmp_path):
+    path = write(tmp_path, "NU_NOTIFIC;NM_PACIENT\n1;José\n", encoding="latin-1")
+    with pytest.raises(UnicodeDecodeError):
+        CsvReader(path, encoding="utf-8").read_dataframe()
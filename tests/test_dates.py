@@ -0,0 +1,37 @@
+from datetime import date, datetime, timezone
+
+import pandas as pd
+
+from core.domain.services import DiseaseMapperService, SinanMapperService
+from core.domain.services.dates import parse_date, parse_dates
+
+
+def test_parse_date_handles_empty_and_invalid_values():
+    assert parse_date("2024-03-05 00:00:00") == datetime(2024, 3, 5)
+    assert parse_date("") is None
+    assert parse_date(None) is None
+    assert parse_date(float("nan")) is None
+    assert parse_date("não é data") is None
+
+
+def test_parse_dates_matches_scalar_version():
+    values = pd.Series(["2024-03-05 00:00:00", "", "lixo", None, datetime(2020, 1, 2)], dtype=object)
+    assert parse_dates(values) == [parse_date(value) for value in values]
+
+
+def test_existing_dates_go_through_callback():
+    values = pd.Series([datetime(2020, 1, 2, 10, 30), "2024-03-05 00:00:00"], dtype=object)
+    assert parse_dates(values, existing=lambda value: value.date()) == [date(2020, 1, 2), datetime(2024, 3, 5)]
+
+
+def test_timezone_aware_column():
+    values = pd.Series([datetime(2001, 1, 1, tzinfo=timezone.utc)] * 2)
+    assert parse_dates(values) == [datetime(2001, 1, 1, tzinfo=timezone.utc)] * 2
+
+
+def test_mappers_share_the_same_parsing():
+    values = pd.Series(["2024-03-05 00:00:00", "", datetime(2020, 1, 2)], dtype=object)
+    assert SinanMapperService()._resolve_dates(values) == [datetime(2024, 3, 5), None, date(2020, 1, 2)]
+    assert DiseaseMapperService("sarampo", ibge_location_translator=None)._resolve_dates(values) == [
+        [{"value": "2024-03-05T00:00:00"}], [{}], [{"value": "2020-01-02T00:00:00"}],
+    ]
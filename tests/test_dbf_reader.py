@@ -0,0 +1,55 @@
+import struct
+from datetime import datetime
+
+import pytest
+
+from core.adapters import DbfReader
+
+FIELDS = [("NU_NOTIFIC", "C", 7), ("NM_PACIENT", "C", 20), ("DT_NOTIFIC", "D", 8)]
+
+
+def write_dbf(path, rows):
+    """DBF mínimo (dBase III), no formato das exportações do SINAN."""
+    record_length = 1 + sum(length for _, _, length in FIELDS)
+    header_length = 32 + 32 * len(FIELDS) + 1
+    with open(path, "wb") as f:
+        f.write(struct.pack("<BBBBIHH20x", 3, 124, 1, 1, len(rows), header_length, record_length))
+        for name, kind, length in FIELDS:
+            f.write(struct.pack("<11sc4xBB14x", name.encode().ljust(11, b"\0"), kind.encode(), length, 0))
+        f.write(b"\r")
+        for row in rows:
+            f.write(b" ")
+            for (_, _, length), value in zip(FIELDS, row):
+                f.write(value.encode("cp850").ljust(length)[:length])
+        f.write(b"\x1a")
+    return str(path)
+
+
+@pytest.fixture
+def dbf_path(tmp_path):
+    return write_dbf(tmp_path / "base.dbf", [
+        ("1001", "João Conceição", "20240105"),
+        ("1002", "Ana", "20241399"),
+        ("1003", "Bruno", ""),
+    ])
+
+
+def test_reads_projected_columns_in_chunks(dbf_path):
+    chunks = list(DbfReader(dbf_path, chunk_size=2).read_chunks(columns=["NU_NOTIFIC", "DT_NOTIFIC"]))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert list(chunks[0].columns) == ["NU_NOTIFIC", "DT_NOTIFIC"]
+    assert list(chunks[1].index) == [2]
+
+
+def test_dates_and_cp850_text(dbf_path):
+    df = DbfReader(dbf_path).read_dataframe()
+    assert df["NM_PACIENT"].iloc[0] == "João Conceição"
+    assert df["DT_NOTIFIC"].iloc[0] == datetime(2024, 1, 5)
+    # Datas inválidas e vazias do SINAN ficam ausentes
+    assert df["DT_NOTIFIC"].iloc[1] is None
+    assert df["DT_NOTIFIC"].iloc[2] is None
+
+
+def test_n_rows_and_empty_projection(dbf_path):
+    assert len(DbfReader(dbf_path, n_rows=1).read_dataframe()) == 1
+    assert list(DbfReader(dbf_path).read_dataframe(columns=["INEXISTENTE"]).columns) == []
@@ -0,0 +1,71 @@
+import logging
+
+from core.adapters import GodataLocationTranslator
+
+
+def loc(name, location_id, *children):
+    return {"location": {"name": name, "id": location_id}, "children": list(children)}
+
+
+class FakeApi:
+    def __init__(self, tree):
+        self.tree = tree
+
+    def get_locations(self, filter_params=None):
+        return self.tree
+
+
+def translator(*states):
+    return GodataLocationTranslator(FakeApi([loc("Argentina", "ar"), loc("Brasil", "br", *states)]))
+
+
+def test_resolves_municipalities_at_any_depth_ignoring_accents():
+    t = translator(
+        loc("Santa Catarina", "sc", loc("Grande Florianópolis", "r1", loc("Florianópolis", "floripa"))),
+        loc("Pernambuco", "pe", loc("Recife", "recife")),
+    )
+    assert t.translate("FLORIANOPOLIS", "santa catarina") == "floripa"
+    assert t.translate("Recife", "Pernambuco") == "recife"
+
+
+def test_municipality_wins_over_region_with_the_same_name():
+    # Regiões de SC costumam ter o nome do município polo
+    t = translator(
+        loc("Santa Catarina", "sc",
+            loc("Chapecó", "regiao-chapeco", loc("Chapecó", "mun-chapeco"), loc("Xaxim", "mun-xaxim"))),
+    )
+    assert t.translate("Chapecó", "Santa Catarina") == "mun-chapeco"
+
+
+def test_ambiguous_names_are_reported(caplog):
+    with caplog.at_level(logging.WARNING):
+        t = translator(
+            loc("Santa Catarina", "sc",
+                loc("Região A", "ra", loc("Bom Jesus", "bj-1")),
+                loc("Região B", "rb", loc("Bom Jesus", "bj-2"))),
+        )
+    assert t.translate("Bom Jesus", "Santa Catarina") == "bj-1"
+    assert "bom jesus (santa catarina)" in caplog.text
+
+
+def test_unresolved_locations_are_collected_once(caplog):
+    t = translator(loc("Pernambuco", "pe", loc("Recife", "recife")))
+    with caplog.at_level(logging.WARNING):
+        assert t.translate("Olinda", "Pernambuco") is None
+        assert t.translate("Olinda", "Pernambuco") is None
+        assert t.translate("Manaus", "Amazonas") is None
+        assert t._unresolved == {("Olinda", "Pernambuco"), (None, "Amazonas")}
+        # Durante o mapeamento nada é avisado; só o resumo final
+        assert not [record for record in caplog.records if record.levelno >= logging.WARNING]
+        t.report_unresolved()
+    [record] = [record for record in caplog.records if record.levelno >= logging.WARNING]
+    assert record.getMessage() == "2 localizações não resolvidas no Go.Data: Olinda (Pernambuco), UF Amazonas"
+
+
+def test_pickling_without_reference_cache_ships_loaded_index():
+    import pickle
+
+    t = translator(loc("Pernambuco", "pe", loc("Recife", "recife")))
+    copy = pickle.loads(pickle.dumps(t))
+    assert copy.api_client is None
+    assert copy.translate("Recife", "Pernambuco") == "recife"
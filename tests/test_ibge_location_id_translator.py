@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_sinan import write_ibge_dictionary
+from core.adapters import IBGELocationIdTranslator
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    return write_ibge_dictionary(str(tmp_path / "Dic_Mun_Res.xlsx"))
+
+
+def test_compiled_table_skips_excel_on_next_runs(dictionary, monkeypatch):
+    assert IBGELocationIdTranslator(dictionary).get_location("420540") == ("Florianópolis", "Santa Catarina")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("o Excel não deveria ser lido")
+
+    monkeypatch.setattr(pd, "read_excel", fail)
+    translator = IBGELocationIdTranslator(dictionary)
+    assert translator.get_municipio("261160") == "Recife"
+    assert translator.get_uf("999999") == ""
+
+
+def test_changed_dictionary_is_recompiled(dictionary):
+    IBGELocationIdTranslator(dictionary).get_location("420540")
+    pd.DataFrame(
+        [("420540", "Florianópolis (nova)", "Santa Catarina")], columns=["ID_MN_RESI", "MUNICIPIO RESI", "UF RESI"]
+    ).to_excel(dictionary, index=False)
+    assert IBGELocationIdTranslator(dictionary).get_municipio("420540") == "Florianópolis (nova)"
+
+
+def test_corrupted_compiled_table_is_ignored(dictionary):
+    with open(f"{dictionary}.cache", "wb") as f:
+        f.write(b"nao e pickle")
+    assert IBGELocationIdTranslator(dictionary).get_municipio("420540") == "Florianópolis"
+
+
+def test_missing_columns_are_reported(tmp_path):
+    path = str(tmp_path / "dic.xlsx")
+    pd.DataFrame({"ID_MN_RESI": ["420540"]}).to_excel(path, index=False)
+    with pytest.raises(ValueError, match="Colunas ausentes"):
+        IBGELocationIdTranslator(path).get_location("420540")
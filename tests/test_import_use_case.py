@@ -0,0 +1,140 @@
+import pstats
+import time
+
+import pytest
+
+from benchmarks.fake_godata_server import OUTBREAK, FakeGodataServer
+from benchmarks.synthetic_sinan import write_dataset, write_ibge_dictionary
+from core.adapters import (
+    CaseUploader,
+    CsvReader,
+    GodataLocationTranslator,
+    GodataOutbreakTranslator,
+    IBGELocationIdTranslator,
+    LocationResolutionCache,
+    ReferenceDataCache,
+)
+from core.app.use_cases import ImportSinanDataUseCase
+from core.infra.client import GodataApiClient
+from core.metrics import metrics
+from core.profiling import StageProfiler
+
+
+@pytest.fixture
+def server():
+    with FakeGodataServer() as server:
+        yield server
+
+
+@pytest.fixture
+def paths(tmp_path):
+    write_dataset(str(tmp_path / "base.csv"), rows=120)
+    write_ibge_dictionary(str(tmp_path / "Dic_Mun_Res.xlsx"))
+    return tmp_path
+
+
+def import_cases(server, paths, **options):
+    api_client = GodataApiClient(base_url=server.url, token="fake-token")
+    reference_data = ReferenceDataCache(api_client, snapshot_dir=str(paths / "reference"))
+    locations = GodataLocationTranslator(reference_data)
+    ibge = IBGELocationIdTranslator(str(paths / "Dic_Mun_Res.xlsx"))
+    location_cache = LocationResolutionCache(
+        str(paths / "resolution.json"),
+        LocationResolutionCache.build_fingerprint(locations.fingerprint, ibge.fingerprint),
+    )
+    use_case = ImportSinanDataUseCase(
+        disease_module_name="sarampo",
+        input_port=CsvReader(str(paths / "base.csv"), chunk_size=50),
+        godata_outbreak_translator=GodataOutbreakTranslator(reference_data),
+        godata_location_translator=locations,
+        ibge_location_translator=ibge,
+        output_port=CaseUploader(api_client),
+        location_cache=location_cache,
+        **options,
+    )
+    total = use_case.execute(OUTBREAK["name"], anonymize=True)
+    return total, locations, location_cache
+
+
+@pytest.mark.parametrize("options", [{}, {"pipelined": True}, {"workers": 2}])
+def test_import_sends_every_case(server, paths, options):
+    total, locations, _ = import_cases(server, paths, **options)
+    assert total == 120
+    assert len(server.state.cases[OUTBREAK["id"]]) == 120
+
+
+def test_workers_return_location_resolutions_to_parent(server, paths):
+    _, locations, location_cache = import_cases(server, paths, workers=2)
+    # As resoluções feitas nos processos chegam à tabela persistente
+    reloaded = LocationResolutionCache(location_cache.path, location_cache.fingerprint)
+    assert reloaded["420540"] == "loc-420540"
+    assert reloaded["130260"] == "loc-130260"
+
+
+def test_workers_do_not_load_locations_when_cache_resolves_everything(server, paths):
+    import_cases(server, paths, workers=2)
+    # Segunda execução: tudo resolvido pela tabela persistente
+    _, locations, _ = import_cases(server, paths, workers=2)
+    assert locations._index is None
+
+
+def test_workers_load_locations_from_snapshot_when_cache_is_empty(server, paths):
+    _, locations, location_cache = import_cases(server, paths, workers=2)
+    # A árvore foi indexada nos processos de mapeamento, não no principal
+    assert locations._index is None
+    assert location_cache["420540"] == "loc-420540"
+
+
+def test_unresolved_locations_from_workers_are_reported(caplog):
+    locations = GodataLocationTranslator(api_client=None)
+    locations.merge_unresolved({("Manaus", "Amazonas"), (None, "XX")})
+    locations.report_unresolved()
+    assert "2 localizações não resolvidas no Go.Data: Manaus (Amazonas), UF XX" in caplog.text
+
+
+def test_metrics_recorded_in_workers_reach_parent_registry(server, paths):
+    metrics.reset()
+    import_cases(server, paths, workers=2)
+    snapshot = metrics.snapshot()
+    mappers = {item["labels"]["mapper"]: item["count"] for item in snapshot["histograms"]["mapper_duration_seconds"]}
+    # 120 linhas em blocos de 50
+    assert mappers == {"sinan": 3, "disease": 3, "godata": 3}
+    assert "location_resolution_duration_seconds" in snapshot["histograms"]
+    assert sum(item["value"] for item in snapshot["counters"]["location_resolutions_total"]) > 0
+
+
+def test_mapping_stage_time_excludes_reading(server, paths, monkeypatch):
+    # Leitura artificialmente lenta: com workers > 1, não pode entrar no tempo do mapeamento
+    read_chunks = CsvReader.read_chunks
+
+    def slow_read_chunks(self, *args, **kwargs):
+        for chunk in read_chunks(self, *args, **kwargs):
+            time.sleep(0.5)
+            yield chunk
+
+    monkeypatch.setattr(CsvReader, "read_chunks", slow_read_chunks)
+    metrics.reset()
+    import_cases(server, paths, workers=2)
+    durations = metrics.snapshot()["histograms"]
+    reading = stage_seconds(durations, "leitura")
+    mapping = stage_seconds(durations, "mapeamento")
+    assert reading >= 0.5 * 3
+    assert mapping < reading
+
+
+def stage_seconds(histograms, stage):
+    return next(
+        value["sum"] for value in histograms["stage_duration_seconds"]
+        if value["labels"] == {"stage": stage}
+    )
+
+
+def test_profiler_stages_do_not_nest_with_workers(server, paths, tmp_path):
+    profiler = StageProfiler(str(tmp_path / "profile"))
+    import_cases(server, paths, workers=2, profiler=profiler)
+    assert set(profiler._profiles) == {"leitura", "mapeamento", "envio"}
+    assert profiler._calls["mapeamento"] == 3
+    # O perfil do mapeamento é só a espera pelos blocos, sem a leitura
+    mapping = pstats.Stats(profiler._profiles["mapeamento"])
+    assert not [function for _, _, function in mapping.stats if function == "read_chunks"]
+    assert [function for _, _, function in mapping.stats if function == "result"]
@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from benchmarks.fake_godata_server import FakeGodataServer
+from benchmarks.synthetic_sinan import write_ibge_dictionary
+from core.adapters import (
+    GodataLocationTranslator,
+    IBGELocationIdTranslator,
+    LocationResolutionCache,
+    ReferenceDataCache,
+)
+from core.domain.services import GodataMapperService
+from core.infra.client import GodataApiClient
+
+
+@pytest.fixture
+def server():
+    with FakeGodataServer() as server:
+        yield server
+
+
+class Run:
+    """Objetos montados como no main.py, para uma execução."""
+    def __init__(self, server, tmp_path):
+        api_client = GodataApiClient(base_url=server.url, token="fake-token")
+        reference_data = ReferenceDataCache(api_client, snapshot_dir=str(tmp_path / "reference"))
+        self.locations = GodataLocationTranslator(reference_data)
+        self.ibge = IBGELocationIdTranslator(str(tmp_path / "Dic_Mun_Res.xlsx"))
+        self.cache = LocationResolutionCache(
+            str(tmp_path / "resolution.json"),
+            LocationResolutionCache.build_fingerprint(self.locations.fingerprint, self.ibge.fingerprint),
+        )
+        self.mapper = GodataMapperService(self.locations, self.ibge, self.cache)
+
+
+def test_cache_hit_skips_tree_index_and_dictionary(server, tmp_path):
+    write_ibge_dictionary(str(tmp_path / "Dic_Mun_Res.xlsx"))
+    first = Run(server, tmp_path)
+    assert first.mapper._resolve_residence_location("420540") == "loc-420540"
+    first.cache.save()
+    requests = server.state.requests
+
+    second = Run(server, tmp_path)
+    assert second.mapper._resolve_residence_location("420540") == "loc-420540"
+    assert second.locations._index is None
+    assert second.ibge._loaded_table is None
+    assert server.state.requests == requests
+
+
+def test_miss_builds_index_lazily(server, tmp_path):
+    write_ibge_dictionary(str(tmp_path / "Dic_Mun_Res.xlsx"))
+    Run(server, tmp_path).cache.save()
+
+    run = Run(server, tmp_path)
+    assert run.locations._index is None
+    assert run.mapper._resolve_residence_location("261160") == "loc-261160"
+    assert run.locations._index is not None
+
+
+def test_changed_dictionary_or_tree_invalidates_the_table(server, tmp_path):
+    dictionary = str(tmp_path / "Dic_Mun_Res.xlsx")
+    write_ibge_dictionary(dictionary)
+    run = Run(server, tmp_path)
+    run.mapper._resolve_residence_location("420540")
+    run.cache.save()
+
+    stat = os.stat(dictionary)
+    os.utime(dictionary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert "420540" not in Run(server, tmp_path).cache
+
+    run = Run(server, tmp_path)
+    run.mapper._resolve_residence_location("420540")
+    run.cache.save()
+    santa_catarina = server.state.locations[0]["children"][0]
+    # Florianópolis, abaixo da região Grande Florianópolis
+    santa_catarina["children"][0]["children"][0]["location"]["id"] = "novo-id"
+    ReferenceDataCache(None, snapshot_dir=str(tmp_path / "reference")).invalidate("locations")
+    run = Run(server, tmp_path)
+    assert "420540" not in run.cache
+    assert run.mapper._resolve_residence_location("420540") == "novo-id"
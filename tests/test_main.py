@@ -0,0 +1,23 @@
+import main
+
+
+def test_profile_memory_implies_profile(monkeypatch):
+    monkeypatch.setattr("sys.argv", ["main.py", "--profile-memory"])
+    args = main.parse_args()
+    assert args.profile == main.PROFILE_DIR
+    assert args.profile_memory
+
+
+def test_profile_keeps_explicit_directory(monkeypatch):
+    monkeypatch.setattr("sys.argv", ["main.py", "--profile", "perfis", "--profile-memory"])
+    assert main.parse_args().profile == "perfis"
+
+
+def test_adaptive_upload_rejects_bulk_size(monkeypatch):
+    import pytest
+
+    monkeypatch.setattr(main, "UPLOAD_ADAPTIVE", True)
+    monkeypatch.setattr(main, "UPLOAD_BULK_SIZE", 100)
+    monkeypatch.setattr(main, "CASE_INDEX_PATH", "")
+    with pytest.raises(ValueError, match="UPLOAD_BULK_SIZE"):
+        main.build_uploader(api_client=None)
@@ -0,0 +1,27 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_sinan import generate_dataframe, write_ibge_dictionary
+from core.adapters import IBGELocationIdTranslator
+from core.app.services import Preprocessor
+from core.domain.services import DiseaseMapperService, SinanMapperService
+
+
+@pytest.fixture
+def df():
+    # Valores vazios e datas inválidas misturados aos gerados
+    df = generate_dataframe(40, seed=7)
+    df.loc[3, "DT_SIN_PRI"] = "lixo"
+    df.loc[4, "DT_SIN_PRI"] = None
+    return Preprocessor().run(df, anonymize_data=False, categorical_columns=SinanMapperService.CATEGORICAL_COLUMNS)
+
+
+def test_sinan_batch_matches_row_by_row(df):
+    mapper = SinanMapperService()
+    assert mapper.map_batch(df) == [mapper.map(row) for _, row in df.iterrows()]
+
+
+def test_disease_batch_matches_row_by_row(df, tmp_path):
+    ibge = IBGELocationIdTranslator(write_ibge_dictionary(str(tmp_path / "Dic_Mun_Res.xlsx")))
+    mapper = DiseaseMapperService("sarampo", ibge_location_translator=ibge)
+    assert mapper.map_batch(df) == [mapper.map(row) for _, row in df.iterrows()]
@@ -0,0 +1,83 @@
+import json
+
+from benchmarks.fake_godata_server import FakeGodataServer
+from core.infra import RetryPolicy
+from core.infra.client import GodataApiClient
+from core.metrics import MetricsRegistry, metrics
+
+
+def test_histogram_buckets_are_cumulative_and_inclusive():
+    registry = MetricsRegistry()
+    for value in (0.005, 0.2, 100):
+        registry.observe("duracao", value, stage="envio")
+    [series] = registry.snapshot()["histograms"]["duracao"]
+    assert series["labels"] == {"stage": "envio"}
+    assert series["count"] == 3
+    assert series["buckets"]["0.005"] == 1
+    assert series["buckets"]["0.25"] == 2
+    assert series["buckets"]["60"] == 2
+
+
+def test_prometheus_textfile_format(tmp_path):
+    registry = MetricsRegistry(namespace="teste")
+    registry.inc("casos_total", 2, status="success")
+    registry.set_gauge("limite", 4)
+    registry.observe("duracao", 0.01, operation='get "cases"')
+    path = tmp_path / "metrics.prom"
+    registry.write_prometheus(str(path))
+
+    text = path.read_text()
+    assert '# TYPE teste_casos_total counter\nteste_casos_total{status="success"} 2' in text
+    assert "teste_limite 4" in text
+    assert 'teste_duracao_bucket{operation="get \\"cases\\"",le="+Inf"} 1' in text
+    assert 'teste_duracao_count{operation="get \\"cases\\""} 1' in text
+
+
+def test_json_report_includes_extra_fields(tmp_path):
+    registry = MetricsRegistry()
+    registry.inc("rows_read_total", 10)
+    path = tmp_path / "report.json"
+    registry.write_json(str(path), extra={"input_path": "base.csv"})
+    report = json.loads(path.read_text())
+    assert report["input_path"] == "base.csv"
+    assert report["metrics"]["counters"]["rows_read_total"] == [{"labels": {}, "value": 10}]
+
+
+def test_client_records_latency_status_and_retries():
+    metrics.reset()
+    with FakeGodataServer(error_rate=1.0) as server:
+        client = GodataApiClient(
+            base_url=server.url, token="fake-token", retry_policy=RetryPolicy(max_retries=1, backoff_base=0.001)
+        )
+        try:
+            client.get_outbreaks()
+        except Exception:
+            pass
+    snapshot = metrics.snapshot()
+    responses = {
+        (item["labels"]["operation"], item["labels"]["status"]): item["value"]
+        for item in snapshot["counters"]["http_responses_total"]
+    }
+    assert responses == {("get_outbreaks", "503"): 2}
+    assert snapshot["counters"]["http_retries_total"] == [{"labels": {"operation": "get_outbreaks"}, "value": 1}]
+    assert snapshot["histograms"]["http_request_duration_seconds"][0]["count"] == 2
+    assert snapshot["gauges"]["http_requests_in_flight"][0]["value"] == 0
+
+
+def test_drained_metrics_are_merged_into_another_registry():
+    worker = MetricsRegistry()
+    worker.inc("resolucoes_total", 2, result="resolved")
+    worker.observe("duracao", 0.02, mapper="sinan")
+    parent = MetricsRegistry()
+    parent.inc("resolucoes_total", 1, result="resolved")
+    parent.observe("duracao", 0.2, mapper="sinan")
+
+    parent.merge(worker.drain())
+    snapshot = parent.snapshot()
+    assert snapshot["counters"]["resolucoes_total"] == [{"labels": {"result": "resolved"}, "value": 3}]
+    [series] = snapshot["histograms"]["duracao"]
+    assert series["count"] == 2
+    assert series["buckets"]["0.025"] == 1
+    assert series["buckets"]["0.25"] == 2
+    # O registro de origem fica vazio: o próximo drain só traz o que vier depois
+    assert worker.drain() == {"counters": {}, "gauges": {}, "histograms": {}}
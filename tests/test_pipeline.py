@@ -0,0 +1,55 @@
+import threading
+import time
+
+import pytest
+
+from core.app.services import Pipeline
+
+
+def test_threaded_keeps_order_and_matches_sequential():
+    stages = [("dobro", lambda x: x * 2), ("lento", lambda x: time.sleep(0.001 * (x % 3)) or x + 1)]
+    sequential = list(Pipeline(stages, threaded=False).run(range(20)))
+    assert list(Pipeline(stages, queue_size=1).run(range(20))) == sequential == [x * 2 + 1 for x in range(20)]
+
+
+def test_reading_does_not_run_ahead_of_slow_stage():
+    read = []
+
+    def source():
+        for i in range(50):
+            read.append(i)
+            yield i
+
+    results = Pipeline([("lento", lambda x: time.sleep(0.02) or x)], queue_size=2).run(source())
+    next(results)
+    time.sleep(0.1)
+    # Itens em trânsito: filas de entrada e saída, a etapa e a fonte
+    assert len(read) <= 7
+    results.close()
+
+
+def test_stage_error_is_raised_to_the_consumer():
+    def fail(x):
+        if x == 3:
+            raise ValueError("bloco inválido")
+        return x
+
+    with pytest.raises(ValueError, match="bloco inválido"):
+        list(Pipeline([("mapeamento", fail), ("envio", lambda x: x)]).run(range(10)))
+
+
+def test_source_error_is_raised_to_the_consumer():
+    def source():
+        yield 1
+        raise OSError("arquivo truncado")
+
+    with pytest.raises(OSError, match="arquivo truncado"):
+        list(Pipeline([("etapa", lambda x: x)]).run(source()))
+
+
+def test_abandoned_consumer_stops_all_threads():
+    before = threading.active_count()
+    results = Pipeline([("etapa", lambda x: x)], queue_size=1).run(iter(range(1000)))
+    next(results)
+    results.close()
+    assert threading.active_count() == before
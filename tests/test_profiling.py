@@ -0,0 +1,49 @@
+import time
+import tracemalloc
+
+from core.profiling import StageProfiler
+
+
+def busy(n):
+    return sum(i * i for i in range(n))
+
+
+def test_report_has_one_profile_per_stage(tmp_path):
+    profiler = StageProfiler(str(tmp_path), top=5)
+    wrapped = profiler.wrap("mapeamento", busy)
+    assert [wrapped(1000) for _ in range(3)] == [busy(1000)] * 3
+    assert list(profiler.wrap_source("leitura", iter([1, 2]))) == [1, 2]
+
+    summary = open(profiler.write_report()).read()
+    assert (tmp_path / "mapeamento.prof").exists()
+    assert (tmp_path / "leitura.prof").exists()
+    assert "=== mapeamento: 3 chamadas" in summary
+    # A fonte é consultada uma vez a mais, para saber que terminou
+    assert "=== leitura: 3 chamadas" in summary
+
+
+def test_memory_peaks_per_stage(tmp_path):
+    profiler = StageProfiler(str(tmp_path), trace_memory=True)
+    try:
+        profiler.run("grande", lambda: bytearray(8 * 2 ** 20))
+        profiler.run("pequena", lambda: bytearray(1024))
+        assert profiler.peaks["grande"] >= 8 * 2 ** 20
+        assert profiler.peaks["pequena"] < 2 ** 20
+        assert "Maiores alocações" in open(profiler.write_report()).read()
+    finally:
+        tracemalloc.stop()
+
+
+def test_stage_errors_are_raised_and_profile_is_disabled(tmp_path):
+    profiler = StageProfiler(str(tmp_path))
+
+    def fail():
+        raise RuntimeError("falhou")
+
+    try:
+        profiler.run("envio", fail)
+    except RuntimeError:
+        pass
+    # O perfil da etapa foi desligado: outra etapa pode ser perfilada em seguida
+    assert profiler.run("leitura", time.sleep, 0) is None
+    assert not profiler._conflict_reported
@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from benchmarks.fake_godata_server import OUTBREAK, FakeGodataServer
+from core.adapters import GodataLocationTranslator, GodataOutbreakTranslator, ReferenceDataCache
+from core.infra import RetryPolicy
+from core.infra.client import GodataApiClient
+
+
+@pytest.fixture
+def server():
+    with FakeGodataServer() as server:
+        yield server
+
+
+@pytest.fixture
+def api_client(server):
+    return GodataApiClient(base_url=server.url, token="fake-token", retry_policy=RetryPolicy(max_retries=0))
+
+
+def test_locations_are_fetched_in_a_single_request(server, api_client, tmp_path):
+    # O servidor local, como o Go.Data, aplica o `where` e devolve o Brasil sem a subárvore:
+    # filtrar não serve, então a árvore é baixada uma vez e recortada localmente
+    filtered = api_client.get_locations(filter_params={"filter": '{"where": {"name": "Brasil"}}'})
+    assert filtered[0]["children"] == []
+
+    cache = ReferenceDataCache(api_client, snapshot_dir=str(tmp_path))
+    requests = server.state.requests
+    [country] = cache.get_locations()
+    assert server.state.requests == requests + 1
+    assert country["location"]["name"] == "Brasil" and country["children"]
+    assert GodataLocationTranslator(cache).translate("Florianópolis", "Santa Catarina") == "loc-420540"
+
+
+def test_missing_country_is_not_cached(server, api_client, tmp_path):
+    server.state.locations = []
+    cache = ReferenceDataCache(api_client, snapshot_dir=str(tmp_path))
+    assert cache.get_locations() == []
+    assert not (tmp_path / "locations.json").exists()
+
+
+def test_snapshot_is_reused_until_invalidated(server, api_client, tmp_path):
+    cache = ReferenceDataCache(api_client, snapshot_dir=str(tmp_path))
+    cache.get_outbreaks()
+    requests = server.state.requests
+    assert cache.get_outbreaks() == [OUTBREAK]
+    assert server.state.requests == requests
+
+    cache.invalidate("outbreaks")
+    cache.get_outbreaks()
+    assert server.state.requests == requests + 1
+
+
+def test_outbreak_created_after_the_snapshot_is_refetched(server, api_client, tmp_path):
+    cache = ReferenceDataCache(api_client, snapshot_dir=str(tmp_path))
+    translator = GodataOutbreakTranslator(cache)
+
+    server.state.outbreaks.append({"id": "outbreak-dengue", "name": "Dengue"})
+    assert translator.translate("Dengue") == "outbreak-dengue"
+    # O snapshot também foi atualizado
+    assert GodataOutbreakTranslator(cache).translate("Dengue") == "outbreak-dengue"
+
+    with pytest.raises(ValueError):
+        translator.translate("Inexistente")
+
+
+def test_expired_snapshot_is_refetched(server, api_client, tmp_path, monkeypatch):
+    cache = ReferenceDataCache(api_client, snapshot_dir=str(tmp_path), ttl_seconds=60)
+    version = cache.locations_version()
+    requests = server.state.requests
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 30)
+    assert cache.locations_version() == version
+    cache.get_locations()
+    assert server.state.requests == requests
+
+    # Expirado, o snapshot é baixado de novo e a versão acompanha a árvore nova
+    server.state.locations[0]["children"].pop()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert cache.locations_version() != version
+    assert server.state.requests > requests
+
+
+def test_location_version_without_snapshot_fetches_once(server, api_client, tmp_path):
+    cache = ReferenceDataCache(api_client, snapshot_dir=str(tmp_path))
+    assert GodataLocationTranslator(cache).fingerprint == cache.locations_version()
+    requests = server.state.requests
+    cache.locations_version()
+    assert server.state.requests == requests
+
+
+def test_pickled_cache_reads_snapshot_without_api(server, api_client, tmp_path):
+    import pickle
+
+    cache = ReferenceDataCache(api_client, snapshot_dir=str(tmp_path), ttl_seconds=60)
+    locations = cache.get_locations()
+    copy = pickle.loads(pickle.dumps(cache))
+    assert copy.api_client is None
+    assert copy.get_locations() == locations
+
+    # Snapshot ausente: sem a API, não há como baixar
+    copy.invalidate("outbreaks")
+    with pytest.raises(RuntimeError):
+        copy.get_outbreaks()
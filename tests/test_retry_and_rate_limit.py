@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from benchmarks.fake_godata_server import OUTBREAK, FakeGodataServer
+from core.infra import RetryPolicy, TokenBucketRateLimiter
+from core.infra.client import GodataApiClient, GodataApiError
+
+
+def test_post_is_retried_only_when_refused():
+    policy = RetryPolicy(max_retries=3)
+    assert policy.should_retry("POST", 1, status_code=503)
+    assert policy.should_retry("POST", 1, status_code=429)
+    assert not policy.should_retry("POST", 1, status_code=500)
+    assert not policy.should_retry("POST", 1, error=requests.ReadTimeout())
+    assert policy.should_retry("POST", 1, error=requests.exceptions.ConnectTimeout())
+
+
+def test_idempotent_methods_retry_transient_errors_up_to_the_limit():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry("PUT", 1, status_code=500)
+    assert policy.should_retry("GET", 2, error=requests.ReadTimeout())
+    assert not policy.should_retry("GET", 3, status_code=503)
+    assert not policy.should_retry("GET", 1, status_code=404)
+
+
+def test_delay_uses_retry_after_and_caps_backoff():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5)
+    assert policy.delay(1, "2") == 2
+    assert policy.delay(1, "120") == 5
+    assert all(0 <= policy.delay(10) <= 5 for _ in range(20))
+    # Retry-After inválido cai no backoff
+    assert 0 <= policy.delay(1, "amanhã") <= 1
+
+
+def test_token_bucket_limits_average_rate():
+    limiter = TokenBucketRateLimiter(rate=50, capacity=1)
+    start = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(11)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # A primeira ficha está disponível; as outras 10 chegam a 50 por segundo
+    assert time.monotonic() - start >= 0.18
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=0)
+
+
+def test_client_retries_transient_server_errors():
+    with FakeGodataServer(error_rate=0.5) as server:
+        client = GodataApiClient(
+            base_url=server.url, token="fake-token", retry_policy=RetryPolicy(max_retries=20, backoff_base=0.001)
+        )
+        for _ in range(5):
+            assert client.get_outbreaks() == [OUTBREAK]
+        assert server.state.requests > 5
+
+
+def test_client_gives_up_with_status_code():
+    with FakeGodataServer(error_rate=1.0) as server:
+        client = GodataApiClient(
+            base_url=server.url, token="fake-token", retry_policy=RetryPolicy(max_retries=2, backoff_base=0.001)
+        )
+        with pytest.raises(GodataApiError) as error:
+            client.get_outbreaks()
+        assert error.value.status_code == 503
+        assert server.state.requests == 3
@@ -0,0 +1,81 @@
+from core.adapters import JournaledOutputPort, RunJournal
+from core.domain.ports import CasesOutputPort
+
+from tests.test_case_uploader import case
+
+
+class FakeOutput(CasesOutputPort):
+    """Saída que falha nos visualIds de `failing`."""
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.sent = []
+
+    def send_cases(self, cases, outbreak_id):
+        self.sent.extend(caso.visualId for caso in cases)
+        return [
+            {"NU_NOTIFIC": caso.visualId, "status": "error" if caso.visualId in self.failing else "success",
+             "error_message": "falhou" if caso.visualId in self.failing else None}
+            for caso in cases
+        ]
+
+
+def test_resume_marks_confirmed_cases_as_resumed(tmp_path):
+    journal = RunJournal(str(tmp_path / "journal.jsonl"))
+    JournaledOutputPort(FakeOutput(failing={"2"}), journal, checkpoint_size=1).send_cases(
+        [case("1"), case("2")], "ob-1"
+    )
+
+    output = FakeOutput()
+    results = JournaledOutputPort(output, journal, resume=True).send_cases([case("1"), case("2"), case("3")], "ob-1")
+    assert output.sent == ["2", "3"]
+    assert {item["NU_NOTIFIC"]: item["status"] for item in results} == {"1": "resumed", "2": "success", "3": "success"}
+
+
+def test_replay_resends_only_failed_payloads(tmp_path):
+    journal = RunJournal(str(tmp_path / "journal.jsonl"))
+    JournaledOutputPort(FakeOutput(failing={"2"}), journal).send_cases([case("1"), case("2")], "ob-1")
+
+    output = FakeOutput()
+    results = JournaledOutputPort(output, journal, resume=True).replay_failed()
+    assert output.sent == ["2"]
+    assert [item["status"] for item in results] == ["success"]
+    # Depois do reenvio, o último registro do caso é sucesso
+    assert journal.failed_cases() == {}
+    assert journal.confirmed("ob-1") == {"1", "2"}
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = RunJournal(str(path))
+    JournaledOutputPort(FakeOutput(), journal).send_cases([case("1")], "ob-1")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"outbreakId": "ob-1", "visualId": "2", "sta')
+    assert journal.confirmed("ob-1") == {"1"}
+
+
+def test_new_run_discards_previous_journal(tmp_path):
+    journal = RunJournal(str(tmp_path / "journal.jsonl"))
+    JournaledOutputPort(FakeOutput(), journal).send_cases([case("1")], "ob-1")
+    JournaledOutputPort(FakeOutput(), journal)
+    assert journal.confirmed("ob-1") == set()
+
+
+def test_whole_chunk_reaches_uploader_and_results_are_journaled_as_they_finish(tmp_path):
+    from tests.test_case_uploader import FakeApi
+    from core.adapters import CaseUploader
+
+    api = FakeApi()
+    batches = []
+    import_cases = api.import_cases
+    api.import_cases = lambda outbreak_id, cases_data: batches.append(len(cases_data)) or import_cases(outbreak_id, cases_data)
+    uploader = CaseUploader(api, max_workers=1, bulk_size=500)
+    journal = RunJournal(str(tmp_path / "journal.jsonl"))
+    journaled = []
+    record = journal.record
+    journal.record = lambda outbreak_id, results, cases: journaled.append(len(results)) or record(outbreak_id, results, cases)
+
+    JournaledOutputPort(uploader, journal, checkpoint_size=200).send_cases([case(str(i)) for i in range(1000)], "ob-1")
+    assert batches == [500, 500]
+    # Gravado a cada lote concluído, não só no fim do bloco
+    assert journaled == [500, 500]
+    assert len(journal.confirmed("ob-1")) == 1000
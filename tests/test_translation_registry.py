@@ -0,0 +1,14 @@
+from core.adapters.translation.translation_registry import TranslationRegistry
+
+
+def test_translate_many_matches_translate():
+    registry = TranslationRegistry()
+    registry.register("sexo", {"M": "MASCULINO", "F": "FEMININO"})
+    registry.register("maiusculas", lambda value: str(value).upper())
+    registry.register("coluna", lambda values: values.str.len(), batched=True)
+    values = ["M", "F", "I", "", None]
+
+    for name in ("sexo", "maiusculas", "inexistente"):
+        assert registry.translate_many(name, values) == [registry.translate(name, value) for value in values]
+    assert registry.translate_many("coluna", ["a", "abc"]) == [1, 3]
+    assert registry.translate("coluna", "ab") == 2
@@ -0,0 +1,44 @@
+import threading
+
+import requests
+
+from benchmarks.fake_godata_server import OUTBREAK, FakeGodataServer
+from core.infra import HttpTransport
+from core.infra.client import GodataApiClient
+
+
+def test_each_thread_gets_its_own_session_sharing_the_pool():
+    base = requests.Session()
+    base.headers["Authorization"] = "Bearer token"
+    transport = HttpTransport(pool_size=2, base_session=base)
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(transport.session))
+    thread.start()
+    thread.join()
+
+    assert transport.session is transport.session
+    assert sessions[0] is not transport.session
+    assert sessions[0].headers["Authorization"] == "Bearer token"
+    assert sessions[0].get_adapter("http://x") is transport.session.get_adapter("http://x")
+
+
+def test_large_json_bodies_are_gzipped():
+    transport = HttpTransport(gzip_requests=True, gzip_min_size=100)
+    small = {"json": {"a": 1}}
+    transport._compress_json(small)
+    assert "json" in small
+
+    large = {"json": {"data": ["x" * 50] * 10}}
+    transport._compress_json(large)
+    assert large["headers"]["Content-Encoding"] == "gzip"
+    assert "json" not in large
+
+
+def test_gzipped_import_reaches_the_server():
+    with FakeGodataServer() as server:
+        transport = HttpTransport(pool_size=4, gzip_requests=True, gzip_min_size=10)
+        client = GodataApiClient(base_url=server.url, token="fake-token", transport=transport)
+        created = client.import_cases(OUTBREAK["id"], [{"visualId": str(i)} for i in range(20)])
+        assert len(created) == 20
+        assert len(server.state.cases[OUTBREAK["id"]]) == 20
+        transport.close()
@@ -0,0 +1,36 @@
+import pandas as pd
+
+from core.adapters import XlsxReader
+
+
+def write_xlsx(path, rows=7):
+    pd.DataFrame({
+        "NU_NOTIFIC": [str(1000 + i) for i in range(rows)],
+        "ID_MN_RESI": [420540.0] * rows,
+        "NM_PACIENT": [f"Paciente {i}" for i in range(rows)],
+        "SEM_USO": ["x"] * rows,
+    }).to_excel(path, index=False)
+    return str(path)
+
+
+def test_streams_projected_columns_in_chunks(tmp_path):
+    reader = XlsxReader(write_xlsx(tmp_path / "base.xlsx"), chunk_size=3)
+    chunks = list(reader.read_chunks(columns=["NU_NOTIFIC", "ID_MN_RESI"]))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert list(chunks[0].columns) == ["NU_NOTIFIC", "ID_MN_RESI"]
+    # Índice contínuo entre os blocos e números inteiros como em dtype=str
+    assert list(chunks[2].index) == [6]
+    assert chunks[0].iloc[0].tolist() == ["1000", "420540"]
+
+
+def test_chunks_match_whole_read(tmp_path):
+    path = write_xlsx(tmp_path / "base.xlsx")
+    columns = ["NU_NOTIFIC", "NM_PACIENT"]
+    streamed = pd.concat(XlsxReader(path, chunk_size=2).read_chunks(columns=columns))
+    whole = XlsxReader(path).read_dataframe(columns=columns)
+    pd.testing.assert_frame_equal(streamed, whole, check_dtype=False)
+
+
+def test_n_rows_limits_streamed_rows(tmp_path):
+    reader = XlsxReader(write_xlsx(tmp_path / "base.xlsx"), n_rows=4, chunk_size=3)
+    assert sum(len(chunk) for chunk in reader.read_chunks()) == 4